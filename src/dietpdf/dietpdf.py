@@ -20,37 +20,121 @@ import logging
 import sys
 import re
 
+from os import path
+
 from .parser.PDFParser import PDFParser
+from .parser.map_file import map_file
+from .parser.parse_live_revision import parse_live_revision
+from .parser.parallel_parse import parallel_parse
+from .parser.read_xref import InvalidXref
 from .processor.PDFProcessor import (
     PDFProcessor, EncryptionNotImplemented, SignatureNotSupported
 )
 from .item.PDFObject import PDFObject
 from .info.all_source_codes import all_source_codes
+from .info.object_roles import classify_objects
 from .info.decode_objstm import convert_objstm, create_objstm
 from .info.group_contents import group_contents
+from .info.remove_unreachable import remove_unreachable
 from . import __version__
 
 _logger = logging.getLogger("dietpdf")
 
 
-def diet(input_pdf_name: str):
+def optimized_name(input_pdf_name: str) -> str:
+    """Name of the reduced PDF file.
+
+    The `.pdf` suffix, whatever its case, is replaced by `.opt.pdf`. It is
+    appended to names without this suffix.
+
+    Args:
+      input_pdf_name (str): the PDF to reduce
+
+    Returns:
+      str: the name of the reduced PDF file
+    """
+    return re.sub(r"(\.pdf)?$", ".opt.pdf", input_pdf_name, 1, re.IGNORECASE)
+
+
+def diet(
+    input_pdf_name: str, live_revision: bool = False, jobs: int = 1,
+    output_pdf_name: str = None
+):
     """Reduce PDF file size
 
+    The reduced PDF is entirely generated before being written since streams
+    may still be views on the mapped input file. The input file cannot be
+    overwritten.
+
     Args:
       input_pdf_name (str): the PDF to reduce
+      live_revision (bool): only parse the objects of the last revision
+      jobs (int): number of processes parsing the objects of the last revision
+      output_pdf_name (str): the name of the reduced PDF file, defaults to
+        the name given by `optimized_name`
     """
+    output_pdf_name = output_pdf_name or optimized_name(input_pdf_name)
 
-    output_pdf_name = re.sub("\.pdf$", ".opt.pdf", input_pdf_name)
+    if path.abspath(output_pdf_name) == path.abspath(input_pdf_name) or (
+        path.exists(output_pdf_name) and
+        path.samefile(output_pdf_name, input_pdf_name)
+    ):
+        _logger.info("The output file is the input file %s" % input_pdf_name)
+        print("The optimized PDF cannot overwrite the PDF to reduce.")
+        sys.exit(4)
 
     # Read PDF.
     _logger.info("Reading %s" % input_pdf_name)
-    pdf_file_content = open(input_pdf_name, "rb").read()
+    with map_file(input_pdf_name) as pdf_file_content:
+        optimized_pdf = _diet(
+            pdf_file_content, live_revision, jobs, input_pdf_name
+        )
+
+    # Write PDF.
+    _logger.info("Writing optimized PDF in %s" % output_pdf_name)
+    open(output_pdf_name, "wb").write(optimized_pdf)
+
+
+def _diet(
+    pdf_file_content, live_revision: bool, jobs: int = 1,
+    input_pdf_name: str = None
+) -> bytes:
+    """Reduce PDF file size
+
+    Args:
+      pdf_file_content (bytes or mmap): the PDF to reduce
+      live_revision (bool): only parse the objects of the last revision
+      jobs (int): number of processes parsing the objects of the last revision,
+        they need the name of the PDF file
+      input_pdf_name (str): the name of the PDF file
+
+    Returns:
+      bytes: the reduced PDF, which does not depend on `pdf_file_content`
+    """
     processor = PDFProcessor()
-    parser = PDFParser(processor)
+
+    # Parsing the objects with several processes implies only parsing the
+    # live revision.
+    parallel = jobs > 1 and input_pdf_name != None
+    live_revision = live_revision or parallel
 
     try:
-        parser.parse(pdf_file_content)
-        processor.end_parsing()
+        if live_revision:
+            try:
+                if parallel:
+                    parallel_parse(
+                        processor, input_pdf_name, pdf_file_content, jobs
+                    )
+                else:
+                    parse_live_revision(processor, pdf_file_content)
+            except InvalidXref as error:
+                _logger.info("Cannot parse the live revision: %s" % error)
+                processor = PDFProcessor()
+                live_revision = False
+
+        if not live_revision:
+            PDFParser(processor).parse(pdf_file_content)
+            processor.end_parsing()
     except EncryptionNotImplemented:
         _logger.info("Encrypted PDFs are not supported.")
         print("Encrypted PDFs are not supported.")
@@ -72,33 +156,39 @@ def diet(input_pdf_name: str):
     convert_objstm(processor.tokens)
     group_contents(processor.tokens)
 
+    # Unreachable objects would be optimized for nothing.
+    removed_count, removed_bytes = remove_unreachable(processor.tokens)
+    _logger.info("Removed %d unreachable objects (%d bytes)" % (
+        removed_count, removed_bytes
+    ))
+
     # Identifies every object whose stream is textual.
+    classify_objects(processor.tokens)
     source_codes = all_source_codes(processor.tokens)
 
-    def any_object(_, item): return type(item) == PDFObject
-    for _, object in processor.tokens.find(any_object):
+    for object in processor.tokens.find_by_class(PDFObject):
         object.source_code = object.obj_num in source_codes
 
     # Optimize streams.
     _logger.info("Start optimizing objects and streams")
 
-    def any_object_with_stream(_, item):
-        return type(item) == PDFObject and item.has_stream()
-
-    for _, object in processor.tokens.find(any_object_with_stream):
+    for object in processor.tokens.find_with_stream():
         _logger.info("Optimizing object %d stream" % object.obj_num)
         object.optimize_stream()
 
+    processor.tokens.refresh()
+
     # Group objects without stream into an object stream
     _logger.info("Grouping objects without stream into an object stream")
     create_objstm(processor.tokens)
 
-    # Write PDF.
-    _logger.info("Writing optimized PDF in %s" % output_pdf_name)
-    open(output_pdf_name, "wb").write(processor.encode())
+    # Generate PDF.
+    optimized_pdf = bytes(processor.encode())
 
     processor.pretty_print()
 
+    return optimized_pdf
+
 
 def parse_args(args):
     """Parse command line parameters
@@ -124,6 +214,23 @@ def parse_args(args):
         metavar="<input PDF>"
     )
 
+    parser.add_argument(
+        "-l",
+        "--live-revision",
+        dest="live_revision",
+        help="only parse the objects of the last revision",
+        action="store_true",
+    )
+
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        dest="jobs",
+        help="parse the objects of the last revision using JOBS processes",
+        type=int,
+        default=1,
+    )
+
     parser.add_argument(
         "-v",
         "--verbose",
@@ -170,7 +277,7 @@ def main(args):
     setup_logging(args.loglevel)
     _logger.info("Start optimizing PDF %s" % args.input_pdf)
 
-    diet(args.input_pdf)
+    diet(args.input_pdf, args.live_revision, args.jobs)
 
 
 def run():
@@ -20,9 +20,12 @@ import logging
 import sys
 
 from .parser.PDFParser import PDFParser
+from .parser.map_file import map_file
 from .processor.PDFProcessor import PDFProcessor
 from .item.PDFObject import PDFObject
-from .info.all_source_codes import all_source_codes
+from .info.object_roles import (
+    classify_objects, ROLE_FORM, ROLE_IMAGE, SOURCE_CODE_ROLES
+)
 from .info.decode_objstm import convert_objstm
 from . import __version__
 
@@ -38,33 +41,32 @@ def extractpdf(input_pdf_name: str, base: str):
     """
 
     # Read PDF
-    pdf_file_content = open(input_pdf_name, "rb").read()
     processor = PDFProcessor()
     parser = PDFParser(processor)
-    parser.parse(pdf_file_content)
-    processor.end_parsing()
+    with map_file(input_pdf_name) as pdf_file_content:
+        parser.parse(pdf_file_content)
+        processor.end_parsing()
 
     #convert_objstm(processor.tokens)
 
-    # Find all content objects
-    content_objects_set = all_source_codes(processor.tokens)
+    # Find the role of every object
+    roles = classify_objects(processor.tokens)
 
     # Extract all available streams
-    any_object_with_stream = lambda _, item: (
-        type(item) == PDFObject and
-        item.stream != None        
-    )
-    for _, object in processor.tokens.find(any_object_with_stream):
+    for object in processor.tokens.find_by_class(PDFObject):
+        if object.stream == None:
+            continue
+
         object_id = object.obj_num
+        role = roles.get(object.obj_num)
         extension = "raw"
         width = None
         height = None
-        if b"Type" in object and object[b"Type"] == b"XObject":
-            if b"Subtype" in object and object[b"Subtype"] == b"Form":
-                extension = "form-xobject"
-        elif object.obj_num in content_objects_set:
+        if role == ROLE_FORM:
+            extension = "form-xobject"
+        elif role in SOURCE_CODE_ROLES:
             extension = "content"
-        elif b"Subtype" in object and object[b"Subtype"] == b"Image":
+        elif role == ROLE_IMAGE:
             width = int(object[b"Width"])
             height = int(object[b"Height"])
 
@@ -5,7 +5,7 @@ __license__ = "mit"
 __maintainer__ = "Frédéric BISSON"
 __email__ = "zigazou@protonmail.com"
 
-import re
+from ..token.string_codec import clean_hexstring, escape
 
 
 def hex_to_bytes(hexstring: bytes) -> bytes:
@@ -22,19 +22,11 @@ def hex_to_bytes(hexstring: bytes) -> bytes:
     assert type(hexstring) == bytes
 
     # Remove any spaces
-    cleaned = b"%s" % re.sub(b"[^0-9A-Za-z]+", b"", hexstring)
+    cleaned = clean_hexstring(hexstring)
 
     # If there is only one digit in the last slot, add a 0
     if len(cleaned) >= 1 and len(cleaned) % 2 == 1:
         cleaned += b"0"
 
-    # Convert hexdecimal characters to bytes
-    cleaned = bytes.fromhex(cleaned.decode('ascii'))
-
-    # Escape special characters
-    cleaned = cleaned.replace(b"\\", b"\\\\")
-    cleaned = cleaned.replace(b"(", b"\\(")
-    cleaned = cleaned.replace(b")", b"\\)")
-    cleaned = cleaned.replace(b"\r", b"\\r")
-
-    return cleaned
\ No newline at end of file
+    # Convert hexdecimal characters to bytes and escape special characters
+    return escape(bytes.fromhex(cleaned.decode('ascii')))
@@ -6,8 +6,6 @@ __maintainer__ = "Frédéric BISSON"
 __email__ = "zigazou@protonmail.com"
 
 from ..pdf.PDF import PDF
-from ..item.PDFObject import PDFObject
-from ..item.PDFDictionary import PDFDictionary
 
 
 def all_uri(pdf: PDF) -> list:
@@ -22,14 +20,8 @@ def all_uri(pdf: PDF) -> list:
     assert type(pdf) == PDF
 
     # URIs are conteained in annotation objects in a PDF file.
-    def any_link(_, item): return (
-        type(item) == PDFObject and type(item.value) == PDFDictionary and
-        "Type" in item.value and item.value["Type"] == b"Annot" and
-        "Subtype" in item.value and item.value["Subtype"] == b"Link"
-    )
-
     urls = set()
-    for _, object in pdf.find(any_link):
+    for object in pdf.select(type="Annot", subtype="Link"):
         urls.add(pdf.get(object, ["A", "URI"]).to_string())
 
     return list(urls)
@@ -86,17 +86,10 @@ def convert_objstm(pdf: PDF):
         for index, item in pdf.find(any_object_without_stream)
     }
 
-    # Decode Objects stream
-    def any_objstm(_, item):
-        return (
-            type(item) == PDFObject and
-            type(item.value) == PDFDictionary and
-            b"Type" in item and item[b"Type"] == b"ObjStm"
-        )
-
     # Add the embedded objects to the stack.
     to_remove = []
-    for index, item in pdf.find(any_objstm):
+    for item in pdf.select(type="ObjStm"):
+        index = pdf.position(item.obj_num)
         to_remove.append(index)
         _logger.debug("Decoding object stream %d" % item.obj_num)
         objects = decode_objstm(item.decode_stream(), int(item[b"First"]))
@@ -112,9 +105,7 @@ def convert_objstm(pdf: PDF):
 
 
     # Remove the objects streams.
-    to_remove.sort(reverse=True)
-    for index in to_remove:
-        pdf.pop(index)
+    pdf.remove_indices(to_remove)
 
 
 def create_objstm(pdf: PDF) -> int:
@@ -129,13 +120,9 @@ def create_objstm(pdf: PDF) -> int:
     """
 
     # Find the highest object number to attribute it to the new object stream.
-    highest_object_number = 0
-
-    def any_object(_, item):
-        return type(item) == PDFObject
-
-    for _, item in pdf.find(any_object):
-        highest_object_number = max(item.obj_num, highest_object_number)
+    highest_object_number = max(
+        [item.obj_num for item in pdf.find_by_class(PDFObject)], default=0
+    )
 
     # Find objects without stream.
     def any_object_without_stream(_, item):
@@ -158,9 +145,7 @@ def create_objstm(pdf: PDF) -> int:
         objects[item.obj_num] = item
         to_remove.append(index)
 
-    to_remove.sort(reverse=True)
-    for index in to_remove:
-        pdf.pop(index)
+    pdf.remove_indices(to_remove)
 
     pdf.push(PDFObjectStream(highest_object_number + 1, 0, list(objects.values())))
 
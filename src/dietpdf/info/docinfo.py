@@ -7,7 +7,7 @@ __email__ = "zigazou@protonmail.com"
 
 import logging
 
-from ..item.PDFDictionary import PDFDictionary
+from ..item.PDFTrailer import PDFTrailer
 from ..processor.PDFProcessor import PDFProcessor
 
 _logger = logging.getLogger("content_objects")
@@ -25,20 +25,19 @@ def docinfo(pdf: PDFProcessor) -> dict:
 
     info = {}
 
-    # Look for root object
+    # Look for root object, either in a trailer or in a cross-reference stream
     root = None
-    for object in pdf.stack:
-        # Ignore non dictionary object
-        if not isinstance(object.value, PDFDictionary):
-            continue
+    for trailer in pdf.tokens.select(item_class=PDFTrailer, has=["Root"]):
+        root = trailer.dictionary[b"Root"].obj_num
+        break
 
-        # Look for root object
-        if b"Root" in object:
+    if root is None:
+        for object in pdf.tokens.select(has=["Root"]):
             root = object[b"Root"].obj_num
             break
 
     if root:
-        root_object = pdf.objects[root]
+        root_object = pdf.tokens.objects[root]
 
         if b"Pages" in root_object:
             pass
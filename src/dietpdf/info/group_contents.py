@@ -6,7 +6,6 @@ __maintainer__ = "Frédéric BISSON"
 __email__ = "zigazou@protonmail.com"
 
 from ..item.PDFObject import PDFObject
-from ..item.PDFDictionary import PDFDictionary
 from ..item.PDFList import PDFList
 from ..item.PDFStream import PDFStream
 from ..item.PDFReference import PDFReference
@@ -21,16 +20,14 @@ def group_contents(pdf: PDF):
     """
 
     # Find pages with contents list.
-    def any_page_with_contents_list(_, item):
+    def any_contents_list(item):
         return (
-            type(item) == PDFObject and type(item.value) == PDFDictionary and
-            b"Type" in item and item[b"Type"] == b"Page" and
             b"Contents" in item and type(item[b"Contents"]) == PDFList and
             len(item[b"Contents"]) > 1
         )
 
     objects_to_remove = []
-    for _, item in pdf.find(any_page_with_contents_list):
+    for item in pdf.select(type="Page", where=any_contents_list):
         grouped_contents = b" ".join([
             pdf.get(reference).decode_stream()
             for reference in item[b"Contents"]
@@ -52,10 +49,12 @@ def group_contents(pdf: PDF):
         item.value[b"Contents"] = PDFReference(first_content)
 
     # Remove contents that have been grouped.
+    objects_to_remove = set(objects_to_remove)
+
     def any_grouped_contents(_, item):
         return type(item) == PDFObject and item.obj_num in objects_to_remove
 
-    to_remove = [index for index, _ in pdf.find(any_grouped_contents)]
-    to_remove.sort(reverse=True)
-    for index in to_remove:
-        pdf.pop(index)
+    pdf.remove_where(any_grouped_contents)
+
+    # Streams of the first content objects have been replaced.
+    pdf.refresh()
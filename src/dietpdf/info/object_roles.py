@@ -0,0 +1,133 @@
+__author__ = "Frédéric BISSON"
+__copyright__ = "Copyright 2022, Frédéric BISSON"
+__credits__ = ["Frédéric BISSON"]
+__license__ = "mit"
+__maintainer__ = "Frédéric BISSON"
+__email__ = "zigazou@protonmail.com"
+
+from ..token.PDFName import PDFName
+from ..item.PDFObject import PDFObject
+from ..item.PDFDictionary import PDFDictionary
+from ..item.PDFList import PDFList
+from ..pdf.PDF import PDF
+
+ROLE_PAGE = "page"
+ROLE_PAGE_CONTENT = "page-content"
+ROLE_FORM = "form"
+ROLE_IMAGE = "image"
+ROLE_FONT = "font"
+ROLE_FONT_PROGRAM = "font-program"
+ROLE_CMAP = "cmap"
+ROLE_TOUNICODE = "tounicode"
+ROLE_ICC_PROFILE = "icc-profile"
+ROLE_METADATA = "metadata"
+ROLE_ANNOTATION = "annotation"
+
+# Roles of the objects whose stream is textual and optimizable.
+SOURCE_CODE_ROLES = {ROLE_PAGE_CONTENT, ROLE_FORM, ROLE_CMAP, ROLE_TOUNICODE}
+
+# Roles given by the /Type of an object.
+_TYPE_ROLES = {
+    b"Page": ROLE_PAGE,
+    b"Font": ROLE_FONT,
+    b"CMap": ROLE_CMAP,
+    b"Metadata": ROLE_METADATA,
+    b"Annot": ROLE_ANNOTATION,
+}
+
+# Roles given to the objects referenced by an entry of a dictionary, keys
+# are given as in the paths of `deep_find`.
+_KEY_ROLES = {
+    "Contents": ROLE_PAGE_CONTENT,
+    "ToUnicode": ROLE_TOUNICODE,
+    "FontFile": ROLE_FONT_PROGRAM,
+    "FontFile2": ROLE_FONT_PROGRAM,
+    "FontFile3": ROLE_FONT_PROGRAM,
+    "DestOutputProfile": ROLE_ICC_PROFILE,
+}
+
+
+def _own_role(object: PDFObject) -> str:
+    """Role of an object given by its own dictionary."""
+    if type(object.value) != PDFDictionary:
+        return None
+
+    if b"Subtype" in object:
+        if object[b"Subtype"] == b"Form":
+            if b"Type" not in object or object[b"Type"] == b"XObject":
+                return ROLE_FORM
+
+        if object[b"Subtype"] == b"Image":
+            if b"Type" not in object or object[b"Type"] == b"XObject":
+                return ROLE_IMAGE
+
+    if b"Type" in object and type(object[b"Type"]) == PDFName:
+        return _TYPE_ROLES.get(object[b"Type"])
+
+    return None
+
+
+def _is_icc_based(object: PDFObject, path: tuple) -> bool:
+    """Is the reference at the path the stream of an ICCBased color space?
+
+    An ICCBased color space is an array like `[/ICCBased 12 0 R]`.
+    """
+    if path[-1] != 1:
+        return False
+
+    container = object.value
+    for element in path[:-1]:
+        if type(container) == PDFDictionary and element in container:
+            container = container[element]
+        elif type(container) == PDFList and element in range(len(container)):
+            container = container[element]
+        else:
+            return False
+
+    return type(container) == PDFList and container[0] == b"ICCBased"
+
+
+def classify_objects(pdf: PDF) -> dict:
+    """Find the role of every object of a PDF in one pass.
+
+    The role of an object is given either by its own dictionary (a Form
+    XObject, an image, a CMap...) or by the way other objects reference it
+    (the `/Contents` of a page, the `/ToUnicode` of a font, the
+    `/FontFile2` of a font descriptor...). Its own dictionary prevails.
+
+    The roles are stored in the `roles` attribute of the PDF, objects without
+    a known role are not in it.
+
+    :param pdf: The document whose objects to classify
+    :type pdf: PDF
+    :return: The role (one of the `ROLE_*` constants) of each object number
+    :rtype: dict
+    """
+    assert isinstance(pdf, PDF)
+
+    own_roles = {}
+    referenced_roles = {}
+    for object in pdf.find_by_class(PDFObject):
+        role = _own_role(object)
+        if role:
+            own_roles[object.obj_num] = role
+
+        if type(object.value) not in [PDFDictionary, PDFList]:
+            continue
+
+        for path, obj_num in pdf.find_references(object):
+            # Only the entries of the dictionary of the object, either a
+            # reference or an array of references.
+            key = None
+            if len(path) == 1 or (len(path) == 2 and type(path[1]) == int):
+                key = path[0]
+
+            if type(key) == str and key in _KEY_ROLES:
+                referenced_roles.setdefault(obj_num, _KEY_ROLES[key])
+            elif _is_icc_based(object, path):
+                referenced_roles.setdefault(obj_num, ROLE_ICC_PROFILE)
+
+    referenced_roles.update(own_roles)
+    pdf.roles = referenced_roles
+
+    return pdf.roles
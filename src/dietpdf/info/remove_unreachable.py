@@ -0,0 +1,107 @@
+__author__ = "Frédéric BISSON"
+__copyright__ = "Copyright 2022, Frédéric BISSON"
+__credits__ = ["Frédéric BISSON"]
+__license__ = "mit"
+__maintainer__ = "Frédéric BISSON"
+__email__ = "zigazou@protonmail.com"
+
+from logging import getLogger
+
+from ..item.PDFObject import PDFObject
+from ..item.PDFDictionary import PDFDictionary
+from ..item.PDFReference import PDFReference
+from ..item.PDFTrailer import PDFTrailer
+from ..item.deep_find import deep_find
+from ..pdf.PDF import PDF
+
+_logger = getLogger("remove_unreachable")
+
+
+def _is_kept(object: PDFObject) -> bool:
+    """Objects which are never referenced but must be kept."""
+    if type(object.value) != PDFDictionary:
+        return False
+
+    if b"Linearized" in object:
+        return True
+
+    return b"Type" in object and object[b"Type"] == b"XRef"
+
+
+def _size(object: PDFObject) -> int:
+    """Approximate size of an encoded object.
+
+    The stream is not encoded, it would be copied only to get its length.
+    """
+    size = len(object.value.encode())
+    if object.stream != None:
+        size += len(object.stream)
+
+    return size
+
+
+def remove_unreachable(pdf: PDF) -> tuple:
+    """Remove the objects which cannot be reached from the trailers.
+
+    Every object referenced by a trailer (`/Root`, `/Info`...) or by a
+    cross-reference stream is reachable, so is every object referenced by a
+    reachable object. Other objects, like unreferenced images or old page
+    contents left by editors, are removed.
+
+    Nothing is removed if no trailer references any object.
+
+    :param pdf: The PDF file from which to remove the unreachable objects
+    :type pdf: PDF
+    :return: The number of objects removed and the approximate size of their
+        encoding
+    :rtype: tuple
+    """
+    assert isinstance(pdf, PDF)
+
+    def any_reference(_, item): return type(item) == PDFReference
+
+    # References held by the trailers.
+    to_visit = [
+        reference.obj_num
+        for trailer in pdf.find_by_class(PDFTrailer)
+        for _, reference in deep_find(trailer.dictionary, any_reference)
+    ]
+
+    for object in pdf.select(where=_is_kept):
+        to_visit += [obj_num for _, obj_num in pdf.find_references(object)]
+
+    if not to_visit:
+        _logger.debug("No trailer references any object")
+        return (0, 0)
+
+    # Mark every reachable object.
+    reachable = set()
+    while to_visit:
+        obj_num = to_visit.pop()
+        if obj_num in reachable:
+            continue
+
+        reachable.add(obj_num)
+
+        if obj_num in pdf.objects:
+            to_visit += [
+                reference
+                for _, reference in pdf.find_references(pdf.objects[obj_num])
+            ]
+
+    # Remove every other object.
+    def any_unreachable(_, item):
+        return (
+            type(item) == PDFObject and
+            item.obj_num not in reachable and
+            not _is_kept(item)
+        )
+
+    removed = pdf.remove_where(any_unreachable)
+    removed_bytes = sum(_size(object) for object in removed)
+
+    _logger.debug("Unreachable objects: %s" % (
+        [object.obj_num for object in removed],
+    ))
+
+    return (len(removed), removed_bytes)
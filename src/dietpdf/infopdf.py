@@ -20,6 +20,7 @@ import logging
 import sys
 
 from .parser.PDFParser import PDFParser
+from .parser.map_file import map_file
 from .processor.PDFProcessor import PDFProcessor
 from .item.PDFObject import PDFObject
 from .item.PDFList import PDFList
@@ -27,35 +28,78 @@ from .item.PDFDictionary import PDFDictionary
 from .item.PDFReference import PDFReference
 from .item.PDFTrailer import PDFTrailer
 from .item.deep_find import deep_find
+from .parser.read_xref import InvalidXref
+from .pdf.LazyPDF import LazyPDF
 from .info.decode_objstm import convert_objstm
+from .info.object_roles import classify_objects
 from . import __version__
 
 _logger = logging.getLogger(__name__)
 
 
 def info_hyperlinks(pdf):
-    def any_link(_, item): return (
+    urls = set()
+    for object in pdf.select(type="Annot", subtype="Link"):
+        link = pdf.get(object, ["A", "URI"])
+        if link:
+            urls.add(link.to_string())
+
+    return urls
+
+def info_hyperlinks_lazy(pdf: LazyPDF):
+    """Find hyperlinks by walking the page tree.
+
+    Only the page tree, the annotations and their actions are loaded. Contrary
+    to `info_hyperlinks`, which finds every Link annotation object, links
+    which are not in the `/Annots` of a page are not found.
+
+    :raise InvalidXref: If the trailer has no `/Root` or if an object cannot
+        be loaded
+    """
+    def any_link(item): return (
         type(item) == PDFObject and type(item.value) == PDFDictionary and
         b"Type" in item.value and item.value[b"Type"] == b"Annot" and
         b"Subtype" in item.value and item.value[b"Subtype"] == b"Link"
     )
 
+    def as_list(item):
+        if type(item) == PDFObject:
+            item = item.value
+
+        return item if type(item) == PDFList else []
+
+    if b"Root" not in pdf.trailer:
+        raise InvalidXref("No /Root in the trailer")
+
     urls = set()
-    for _, object in pdf.find(any_link):
-        link = pdf.get(object, ["A", "URI"])
-        if link:
-            urls.add(link.to_string())
+    visited = set()
+    nodes = [pdf.get(pdf.trailer[b"Root"], ["Pages"])]
+    while nodes:
+        node = nodes.pop()
+        if type(node) != PDFObject or node.obj_num in visited:
+            continue
+
+        visited.add(node.obj_num)
+
+        for kid in as_list(pdf.get(node, ["Kids"])):
+            if type(kid) == PDFReference:
+                nodes.append(pdf.get(kid))
+
+        for annotation in as_list(pdf.get(node, ["Annots"])):
+            if type(annotation) != PDFReference:
+                continue
+
+            annotation = pdf.get(annotation)
+            if any_link(annotation):
+                link = pdf.get(annotation, ["A", "URI"])
+                if link:
+                    urls.add(link.to_string())
 
     return urls
 
 def info_filters(pdf):
-    def any_filter(_, item): return (
-        type(item) == PDFObject and
-        type(item.value) == PDFDictionary and b"Filter" in item.value
-    )
-
     filters = set()
-    for _, object in pdf.find(any_filter):
+    for object in pdf.select(has=["Filter"]):
         filter = object.value[b"Filter"]
 
         if type(filter) == PDFList:
@@ -67,10 +111,10 @@ def info_filters(pdf):
     return filters
 
 def info_types(pdf):
-    def any_object_with_type(_, item): return type(item) == PDFObject
+    roles = classify_objects(pdf)
 
     labels = {}
-    for _, object in pdf.find(any_object_with_type):
+    for object in pdf.find_by_class(PDFObject):
         if type(object.value) == PDFDictionary:
             if b"Type" in object:
                 if b"Subtype" in object:
@@ -87,6 +131,10 @@ def info_types(pdf):
         else:
             label = ""
 
+        # Objects without type, like streams, are labeled with their role.
+        if not label and object.obj_num in roles:
+            label = "(%s)" % roles[object.obj_num]
+
         stream = object.has_stream()
 
         labels[object.obj_num] = (label, stream)
@@ -94,18 +142,17 @@ def info_types(pdf):
     return labels
 
 def info_graph(pdf):
-    def any_object(_, item): return type(item) == PDFObject
     def any_reference(_, item): return type(item) == PDFReference
     def any_trailer(_, item): return type(item) == PDFTrailer
 
     directed_links = set()
-    for _, object in pdf.find(any_object):
-        for path, item in deep_find(object, any_reference):
+    for object in pdf.find_by_class(PDFObject):
+        for path, obj_num in pdf.find_references(object):
             if type(path[-1]) == int and len(path) > 1:
                 relation = "%s[%d]" % (path[-2], path[-1])
             else:
                 relation = path[-1]
-            directed_links.add((object.obj_num, relation, item.obj_num))
+            directed_links.add((object.obj_num, relation, obj_num))
 
     for index, object in pdf.find(any_trailer):
         for path, item in deep_find(object, any_reference):
@@ -126,12 +173,30 @@ def infopdf(infotype: str, input_pdf_name: str):
       input_pdf_name (str): the PDF to reduce
     """
 
+    # Hyperlinks only need a few objects, they are loaded on demand using the
+    # cross-references. Full parsing is only used if they are invalid.
+    if infotype == "hyperlink":
+        urls = None
+        with map_file(input_pdf_name) as pdf_file_content:
+            try:
+                urls = info_hyperlinks_lazy(LazyPDF(pdf_file_content))
+            except InvalidXref as error:
+                _logger.info("Cannot load objects on demand: %s" % error)
+
+        if urls is not None:
+            print("/* hyperlink */")
+            for url in urls:
+                print(url)
+
+            print()
+            return
+
     # Read PDF
-    pdf_file_content = open(input_pdf_name, "rb").read()
     processor = PDFProcessor()
     parser = PDFParser(processor)
-    parser.parse(pdf_file_content)
-    processor.end_parsing()
+    with map_file(input_pdf_name) as pdf_file_content:
+        parser.parse(pdf_file_content)
+        processor.end_parsing()
     convert_objstm(processor.tokens)
 
     pdf = processor.tokens
@@ -21,6 +21,8 @@ NO_SPACE = [
 class PDFDictionary(PDFItem):
     """A PDF dictionary"""
 
+    __slots__ = ("items",)
+
     def __init__(self, items: dict):
         assert type(items) == dict
 
@@ -61,9 +63,11 @@ class PDFDictionary(PDFItem):
         PDFDictionary keys are PDFName. If anything else than a PDFName is used,
         this method will try to convert it to a PDFNmae.
 
-        It allows to directly use byte strings as key for example.
+        It allows to directly use byte strings as key for example. A PDFName
+        has the same hash as its byte string and equals it, byte strings are
+        therefore looked up without being converted.
         """
-        if not isinstance(key, PDFName):
+        if type(key) == str:
             key = PDFName(key)
 
         return self.items.__contains__(key)
@@ -74,9 +78,11 @@ class PDFDictionary(PDFItem):
         PDFDictionary keys are PDFName. If anything else than a PDFName is used,
         this method will try to convert it to a PDFNmae.
 
-        It allows to directly use byte strings as key for example.
+        It allows to directly use byte strings as key for example. A PDFName
+        has the same hash as its byte string and equals it, byte strings are
+        therefore looked up without being converted.
         """
-        if not isinstance(key, PDFName):
+        if type(key) == str:
             key = PDFName(key)
 
         return self.items.__getitem__(key)
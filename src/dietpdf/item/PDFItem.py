@@ -16,4 +16,5 @@ class PDFItem(PDFToken):
     
     This class should not be used directly, it should be derived first.
     """
-    pass
\ No newline at end of file
+
+    __slots__ = ()
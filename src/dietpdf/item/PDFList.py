@@ -49,6 +49,8 @@ NO_SPACE = {
 class PDFList(PDFItem):
     """A PDF list"""
 
+    __slots__ = ("items",)
+
     def __init__(self, items: list):
         """Creates a PDF list.
 
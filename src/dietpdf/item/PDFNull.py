@@ -13,6 +13,8 @@ from .PDFItem import PDFItem
 class PDFNull(PDFItem):
     """A null value (null)."""
 
+    __slots__ = ()
+
     def __eq__(self, other):
         """Equality operator for PDFNull.
 
@@ -38,6 +38,8 @@ NO_SPACE = ["PDFDictionary", "PDFList", "PDFString", "PDFHexString"]
 class PDFObject(PDFItem):
     """A PDF object"""
 
+    __slots__ = ("obj_num", "gen_num", "value", "stream", "source_code")
+
     def __init__(self, obj_num: int, gen_num: int, value, stream: PDFStream):
         assert type(obj_num) == int
         assert type(gen_num) == int
@@ -96,9 +98,6 @@ class PDFObject(PDFItem):
         If the PDFObject value is anything other than PDFDictionary, it returns
         False.
         """
-        if type(key) != PDFName:
-            key = PDFName(key)
-
         if type(self.value) != PDFDictionary:
             return False
 
@@ -158,7 +157,8 @@ class PDFObject(PDFItem):
             )
 
         if self.stream != None:
-            output += b"stream\n%sendstream\nendobj\n" % self.stream.encode()
+            # Format the stream content directly to avoid copying it twice.
+            output += b"stream\n%sendstream\nendobj\n" % self.stream.stream
         elif self.value.__class__.__name__ in NO_SPACE:
             output += b"endobj\n"
         else:
@@ -181,7 +181,7 @@ class PDFObject(PDFItem):
         filters = self[b"Filter"] if b"Filter" in self else None
         if not filters:
             # The stream needs not to be filtered
-            return self.stream.stream
+            return bytes(self.stream)
 
         # Convert the filter to a PDFList of filters
         if not isinstance(filters, PDFList):
@@ -195,8 +195,9 @@ class PDFObject(PDFItem):
         except KeyError:
             decode_parms = PDFList([PDFNull() for _ in filters])
 
-        # Apply filters
-        output = bytes(self.stream)
+        # Apply filters, the stream content is only copied when a filter
+        # really needs a byte string.
+        output = self.stream.stream
         for (filter, parms) in zip(filters, decode_parms):
             if filter == b"FlateDecode":
                 try:
@@ -210,7 +211,7 @@ class PDFObject(PDFItem):
             elif filter == b"ASCII85Decode":
                 try:
                     _logger.debug("ASCII85 decoding")
-                    output = a85decode(output.strip(), adobe=True)
+                    output = a85decode(bytes(output).strip(), adobe=True)
                 except:
                     raise Exception(
                         "Unable to decode ASCII85 object %d stream" %
@@ -219,7 +220,7 @@ class PDFObject(PDFItem):
             elif filter == b"LZWDecode":
                 try:
                     _logger.debug("LZW decoding")
-                    output = lzw_decode(output)
+                    output = lzw_decode(bytes(output))
                 except:
                     raise Exception(
                         "Unable to decompress (LZW) object %d stream" %
@@ -236,11 +237,15 @@ class PDFObject(PDFItem):
 
                 predictor = int(parms[b"Predictor"])
                 if predictor == 2:
-                    output = predictor_tiff_decode(output, columns, colors)
+                    output = predictor_tiff_decode(
+                        bytes(output), columns, colors
+                    )
                 elif predictor >= 10 and predictor <= 15:
-                    output = predictor_png_decode(output, columns, colors)
+                    output = predictor_png_decode(
+                        bytes(output), columns, colors
+                    )
 
-        return output
+        return bytes(output)
 
     def optimize_stream(self):
         """Optimize the stream of a PDFObject, if any.
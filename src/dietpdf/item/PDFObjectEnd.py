@@ -13,6 +13,8 @@ from .PDFItem import PDFItem
 class PDFObjectEnd(PDFItem):
     """End of a PDF object"""
 
+    __slots__ = ()
+
     def __eq__(self, other):
         """Equality operator for PDFObjectEnd.
 
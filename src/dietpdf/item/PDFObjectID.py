@@ -13,6 +13,8 @@ from .PDFItem import PDFItem
 class PDFObjectID(PDFItem):
     """A PDF object ID"""
 
+    __slots__ = ("obj_num", "gen_num")
+
     def __init__(self, obj_num: int, gen_num: int):
         """Create a PDFObjectID.
 
@@ -24,6 +24,8 @@ _logger = getLogger("PDFObjectStream")
 class PDFObjectStream(PDFItem):
     """A PDF object"""
 
+    __slots__ = ("obj_num", "gen_num", "objects", "source_code")
+
     def __init__(self, obj_num: int, gen_num: int, objects: list):
         assert type(obj_num) == int
         assert type(gen_num) == int
@@ -14,6 +14,8 @@ from .PDFObject import PDFObject
 class PDFReference(PDFItem):
     """A PDF reference to a PDF object"""
 
+    __slots__ = ("obj_num", "gen_num")
+
     def __init__(self, obj_num: int, gen_num: int = 0):
         """Create a PDFReference (like 1 0 R).
 
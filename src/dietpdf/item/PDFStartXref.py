@@ -13,6 +13,8 @@ from .PDFItem import PDFItem
 class PDFStartXref(PDFItem):
     """A PDF startxref"""
 
+    __slots__ = ("offset",)
+
     def __init__(self, offset: int):
         assert type(offset) == int
         self.offset = offset
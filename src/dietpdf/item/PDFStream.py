@@ -13,15 +13,28 @@ from .PDFItem import PDFItem
 
 
 class PDFStream(PDFItem):
-    """A PDF stream"""
+    """A PDF stream
 
-    def __init__(self, stream: bytes):
-        assert type(stream) == bytes
+    The stream content may be a `memoryview` on the buffer the PDF has been
+    parsed from. This avoids copying stream contents which are written back
+    untouched (a JPEG which cannot be improved for example). Use `bytes()` to
+    get the stream content as a byte string when it is really needed.
+    """
+
+    __slots__ = ("stream",)
+
+    def __init__(self, stream):
+        """Create a PDFStream.
+
+        :param stream: The stream content
+        :type stream: bytes or memoryview
+        """
+        assert type(stream) in [bytes, memoryview]
 
         self.stream = stream
 
     def __bytes__(self):
-        return self.stream
+        return bytes(self.stream)
 
     def __bool__(self):
         return self.stream != None and len(self.stream) > 0
@@ -61,4 +74,4 @@ class PDFStream(PDFItem):
         return self._pretty("Stream(%d)" % (len(self.stream),))
 
     def encode(self) -> bytes:
-        return self.stream
+        return bytes(self.stream)
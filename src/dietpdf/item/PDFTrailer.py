@@ -14,6 +14,8 @@ from .PDFDictionary import PDFDictionary
 class PDFTrailer(PDFItem):
     """A PDF trailer"""
 
+    __slots__ = ("dictionary",)
+
     def __init__(self, dictionary: PDFDictionary):
         assert type(dictionary) == PDFDictionary
 
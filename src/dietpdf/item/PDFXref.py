@@ -16,6 +16,8 @@ class PDFXref(PDFItem):
     It is composed of subsections of cross reference tables.
     """
 
+    __slots__ = ("subsections", "first_entry_offset")
+
     def __init__(self):
         self.subsections = []
         self.first_entry_offset = None
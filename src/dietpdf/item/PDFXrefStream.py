@@ -18,6 +18,11 @@ class PDFXrefStream(PDFItem):
     """A PDF cross-reference stream.
     """
 
+    __slots__ = (
+        "obj_num", "gen_num", "source_code", "references", "trailer_info",
+        "trailer_root", "first_entry_offset",
+    )
+
     def __init__(self, obj_num: int, gen_num: int, references: dict):
         assert type(obj_num) == int
         assert type(gen_num) == int
@@ -16,6 +16,8 @@ class PDFXrefSubSection(PDFItem):
     These objects are meant to be included in PDFXref objects.
     """
 
+    __slots__ = ("base", "count", "entries", "first_entry_offset")
+
     def __init__(self, base: int, count: int):
         """Create a PDFXrefSubsection.
 
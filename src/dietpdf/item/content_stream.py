@@ -5,11 +5,117 @@ __license__ = "mit"
 __maintainer__ = "Frédéric BISSON"
 __email__ = "zigazou@protonmail.com"
 
-from ..parser.TokenParser import TokenParser
+from logging import getLogger
+
+from ..parser.TokenParser import TokenParser, UnexpectedSequence
+from ..parser.ContentStreamLexer import (
+    ContentStreamLexer, KIND_NUMBER, KIND_OPERATOR, KIND_NAME, KIND_STRING,
+    KIND_HEX_STRING, KIND_COMMENT
+)
 from ..token.PDFHexString import PDFHexString
+from ..token.PDFNumber import raw_is_encoded, encode_value
 from ..token.hexstring_to_string import hexstring_to_string
+from ..token.string_codec import clean_hexstring
+from ..filter.hex_to_bytes import hex_to_bytes
 from ..processor.TokenProcessor import TokenProcessor
 
+_logger = getLogger("content_stream")
+
+# Maximum number of encoded numbers kept for each precision while minifying a
+# content stream.
+MAX_CACHED_NUMBERS = 65536
+
+# Kinds of token whose encoding starts with a regular character (neither a
+# white space nor a delimiter). A space is needed between such a token and a
+# previous token ending with a regular character.
+_STARTS_REGULAR = [False] * 256
+_STARTS_REGULAR[KIND_NUMBER] = True
+_STARTS_REGULAR[KIND_OPERATOR] = True
+
+_ENDS_REGULAR = [False] * 256
+_ENDS_REGULAR[KIND_NUMBER] = True
+_ENDS_REGULAR[KIND_OPERATOR] = True
+_ENDS_REGULAR[KIND_NAME] = True
+# Comments end with a line feed.
+_ENDS_REGULAR[KIND_COMMENT] = True
+
+
+def minify_content_stream(
+    lexer: ContentStreamLexer, convert_hexstrings: bool
+) -> bytes:
+    """Encode the tokens of a content stream without unnecessary spaces.
+
+    The output is the same as encoding the tokens of the content stream with
+    a `TokenProcessor`, but it is written directly from the arrays of the
+    lexer into a `bytearray`.
+
+    :param lexer: The tokens of the content stream
+    :type lexer: ContentStreamLexer
+    :param convert_hexstrings: Whether to convert hexadecimal strings to
+        strings
+    :type convert_hexstrings: bool
+    :return: The encoded tokens
+    :rtype: bytes
+    """
+    stream = lexer.stream
+    next_number = iter(lexer.numbers).__next__
+
+    # Content streams use the same numbers over and over, the encoded numbers
+    # are cached for each precision.
+    encoded_numbers = [{} for _ in range(256)]
+
+    # Appending to a bytearray is amortized, it does not copy what has already
+    # been written.
+    output = bytearray()
+    previous_ends_regular = False
+
+    for kind, start, end, precision in zip(
+        lexer.kinds, lexer.starts, lexer.ends, lexer.precisions
+    ):
+        if previous_ends_regular and _STARTS_REGULAR[kind]:
+            output += b" "
+
+        if kind == KIND_NUMBER:
+            raw = stream[start:end]
+            number = next_number()
+            cache = encoded_numbers[precision]
+            encoded = cache.get(raw)
+            if encoded is None:
+                if raw_is_encoded(raw, precision):
+                    encoded = raw
+                elif ord(".") in raw:
+                    encoded = encode_value(number, precision)
+                else:
+                    encoded = encode_value(int(raw), precision)
+
+                if len(cache) == MAX_CACHED_NUMBERS:
+                    cache.clear()
+
+                cache[raw] = encoded
+
+            output += encoded
+        elif kind == KIND_NAME:
+            output += stream[start - 1:end]
+        elif kind == KIND_STRING:
+            output += stream[start - 1:end + 1]
+        elif kind == KIND_HEX_STRING:
+            if convert_hexstrings:
+                output += b"(%s)" % hex_to_bytes(stream[start:end])
+            else:
+                output += b"<%s>" % clean_hexstring(stream[start:end])
+        elif kind == KIND_COMMENT:
+            output += stream[start:end]
+            output += b"\n"
+        else:
+            output += stream[start:end]
+
+        previous_ends_regular = _ENDS_REGULAR[kind]
+
+    output += b"\n"
+
+    return bytes(output)
+
+
 def optimize_content_stream(stream: bytes) -> bytes:
     """Optimize a content stream.
 
@@ -18,6 +124,10 @@ def optimize_content_stream(stream: bytes) -> bytes:
       - removing unnecessary white spaces
       - converting line feed to space for a better compression ratio
 
+    Content streams are read by a `ContentStreamLexer`. Those it does not
+    support (inline images for example) are read by a `TokenParser`, both ways
+    give the same output.
+
     :param content: The content stream to optimize
     :type content: bytes
     :return: The content stream optimized
@@ -25,14 +135,38 @@ def optimize_content_stream(stream: bytes) -> bytes:
     """
     assert type(stream) == bytes
 
+    # Convert hexadecimal strings to strings but not in character mappings
+    # because some readers do not like it.
+    convert_hexstrings = b"/CIDInit" not in stream
+
+    try:
+        lexer = ContentStreamLexer(stream)
+    except UnexpectedSequence as error:
+        _logger.debug("Content stream left to the TokenParser: %s" % error)
+        return _optimize_content_stream_tokens(stream, convert_hexstrings)
+
+    return minify_content_stream(lexer, convert_hexstrings)
+
+
+def _optimize_content_stream_tokens(
+    stream: bytes, convert_hexstrings: bool
+) -> bytes:
+    """Optimize a content stream using a TokenParser.
+
+    :param content: The content stream to optimize
+    :type content: bytes
+    :param convert_hexstrings: Whether to convert hexadecimal strings to
+        strings
+    :type convert_hexstrings: bool
+    :return: The content stream optimized
+    :rtype: bytes
+    """
     stack = TokenProcessor()
     parser = TokenParser(stack)
 
     parser.parse(stream)
 
-    # Convert hexadecimal strings to strings but not in character mappings
-    # because some readers do not like it.
-    if b"/CIDInit" not in stream:
+    if convert_hexstrings:
         def any_hexstring(_, item): return type(item) == PDFHexString
         for index, _ in stack.tokens.find(any_hexstring):
             stack.tokens.stack[index] = hexstring_to_string(
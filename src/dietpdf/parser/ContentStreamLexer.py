@@ -0,0 +1,175 @@
+__author__ = "Frédéric BISSON"
+__copyright__ = "Copyright 2022, Frédéric BISSON"
+__credits__ = ["Frédéric BISSON"]
+__license__ = "mit"
+__maintainer__ = "Frédéric BISSON"
+__email__ = "zigazou@protonmail.com"
+
+import re
+
+from array import array
+
+from ..token.string_codec import find_string_end
+
+from .TokenParser import UnexpectedSequence, OPERATOR_PRECISION
+
+# Kinds of token, they are the numbers of the groups of the token pattern.
+KIND_NUMBER = 1
+KIND_OPERATOR = 2
+KIND_NAME = 3
+KIND_DICT_OPEN = 4
+KIND_DICT_CLOSE = 5
+KIND_LIST_OPEN = 6
+KIND_LIST_CLOSE = 7
+KIND_HEX_STRING = 8
+KIND_STRING = 9
+KIND_COMMENT = 10
+
+# Precision of numbers which are not operands of an operator listed in
+# OPERATOR_PRECISION.
+DEFAULT_PRECISION = 4
+
+_WHITE_SPACE = b"\\0\\t\\n\\f\\r "
+_NAME_CHARS = b"!\"#$&'*+,.0-9:;=?@A-Z\\^_`a-z{|}~\x80-\xff-"
+_END_VALUE = b"(?=[%s()<>\\[\\]{}/%%]|$)" % _WHITE_SPACE
+
+# Names and operators containing braces would need the minifier to look at
+# their bytes, they are left to the TokenParser.
+_WORD_CHARS = _NAME_CHARS.replace(b"{|}", b"|")
+_END_WORD = b"(?=[%s()<>\\[\\]/%%]|$)" % _WHITE_SPACE
+
+# One match skips the white spaces preceding a token and recognizes it. It
+# recognizes the same tokens as the master pattern of the TokenParser.
+_token = re.compile(
+    b"[%s]*(?:" % _WHITE_SPACE +
+    b"([+-]?[0-9]+\\.?[0-9]*|[+-]?[0-9]*\\.[0-9]+)" + _END_VALUE +
+    b"|([a-zA-Z'][%s]*)" % _WORD_CHARS + _END_WORD +
+    b"|/([%s]+)" % _WORD_CHARS + _END_WORD +
+    b"|(<<)" +
+    b"|(>>)" +
+    b"|(\\[)" +
+    b"|(\\])" +
+    b"|<([A-Fa-f0-9%s]*)>" % _WHITE_SPACE +
+    b"|(\\()" +
+    b"|(%[^\r\n]*)[\r\n]*" +
+    b")"
+)
+
+_trailing_white_space = re.compile(b"[%s]*$" % _WHITE_SPACE)
+
+
+class ContentStreamLexer:
+    """A compact representation of the tokens of a content stream.
+
+    Content streams may hold millions of operands and operators. Instead of
+    creating one PDFToken per token, the lexer fills parallel arrays:
+
+      - `kinds` holds the kind of each token (one of the `KIND_*` constants)
+      - `starts` and `ends` hold the offsets of each token in the stream,
+        without delimiters (the `/` of names, the parentheses of strings...)
+      - `numbers` holds the value of each number, in the order of the numbers
+        in the stream
+      - `precisions` holds the precision used to encode each number, as the
+        TokenParser sets it according to the operator following the number
+
+    Inline images are not supported, neither are the malformed sequences
+    which the TokenParser handles character by character. They raise an
+    UnexpectedSequence, the TokenParser should then be used instead.
+    """
+
+    def __init__(self, stream: bytes):
+        """Create a lexer and read the tokens of a content stream.
+
+        :param stream: The content stream
+        :type stream: bytes
+        :raise UnexpectedSequence: If the content stream holds an inline image
+            or anything the lexer cannot handle
+        """
+        assert type(stream) == bytes
+
+        # Offsets fit in 4 bytes unless the stream is bigger than 4 GB.
+        offset_type = "I" if len(stream) < 2 ** 32 else "q"
+
+        self.stream = stream
+        self.kinds = array("B")
+        self.starts = array(offset_type)
+        self.ends = array(offset_type)
+        self.numbers = array("d")
+        self.precisions = array("B")
+
+        self._lex()
+
+    def __len__(self):
+        return len(self.kinds)
+
+    def token(self, index: int) -> bytes:
+        """Get the bytes of a token.
+
+        :param index: Index of the token
+        :type index: int
+        :return: The token bytes, without delimiters
+        :rtype: bytes
+        """
+        return self.stream[self.starts[index]:self.ends[index]]
+
+    def _lex(self):
+        stream = self.stream
+        kinds = self.kinds
+
+        # Appending through bound methods spares an attribute lookup for each
+        # token.
+        append_kind = kinds.append
+        append_start = self.starts.append
+        append_end = self.ends.append
+        append_number = self.numbers.append
+        append_precision = self.precisions.append
+        precisions = self.precisions
+
+        match = _token.match
+        offset = 0
+        length = len(stream)
+        while offset < length:
+            token = match(stream, offset)
+            if token is None:
+                if _trailing_white_space.match(stream, offset):
+                    break
+
+                raise UnexpectedSequence(
+                    "Unexpected sequence at offset %d" % offset
+                )
+
+            kind = token.lastindex
+            start, end = token.span(kind)
+            offset = token.end()
+
+            if kind == KIND_NUMBER:
+                append_number(float(stream[start:end]))
+            elif kind == KIND_OPERATOR:
+                operator = stream[start:end]
+                if operator == b"ID":
+                    raise UnexpectedSequence(
+                        "Inline image at offset %d" % start
+                    )
+
+                # The operator sets the precision of its operands.
+                if operator in OPERATOR_PRECISION:
+                    precision, count = OPERATOR_PRECISION[operator]
+                    index = len(kinds) - 1
+                    while (count > 0 and index >= 0 and
+                           kinds[index] == KIND_NUMBER):
+                        precisions[index] = precision
+                        index -= 1
+                        count -= 1
+            elif kind == KIND_STRING:
+                offset = find_string_end(stream, start)
+                if offset is None:
+                    raise UnexpectedSequence(
+                        "Unterminated string at offset %d" % start
+                    )
+
+                start, end = start + 1, offset - 1
+
+            append_kind(kind)
+            append_start(start)
+            append_end(end)
+            append_precision(DEFAULT_PRECISION)
@@ -8,25 +8,157 @@ __email__ = "zigazou@protonmail.com"
 import re
 
 from ..token.PDFCommand import PDFCommand
+from ..token.PDFNumber import PDFNumber
 from ..item.PDFStream import PDFStream
 from ..item.PDFNull import PDFNull
+from ..item.PDFDictionary import PDFDictionary
+from ..item.PDFObject import PDFObject
+from ..processor.TokenProcessor import TokenProcessor
 
-from .TokenParser import TokenParser
+from .TokenParser import TokenParser, UnexpectedSequence, ENGINE_SCANNER
 
 class PDFParser(TokenParser):
+    def __init__(self, processor: TokenProcessor, engine: str = ENGINE_SCANNER):
+        super().__init__(processor, engine)
+
+        self.start_of_stream = re.compile(b"\r\n|\n")
+        self.white_spaces = re.compile(
+            b"[%s]*" % re.escape(self.pdf_white_space)
+        )
+        self.end_of_stream_keyword = re.compile(
+            b"[%s]*endstream" % re.escape(self.pdf_white_space)
+        )
+
+    def _view(self, start: int, end: int):
+        """Get a view on a part of the parsed data without copying it.
+
+        A `bytearray` can be resized (chunks fed to the parser are appended
+        to one) which is forbidden while a view exists on it. Its parts are
+        therefore copied.
+
+        :param start: Offset of the first byte
+        :type start: int
+        :param end: Offset following the last byte
+        :type end: int
+        :return: A view on the parsed data
+        :rtype: memoryview or bytes
+        """
+        if type(self.binary_data) == bytearray:
+            return bytes(self.binary_data[start:end])
+
+        return memoryview(self.binary_data)[start:end]
+
+    def _stream_length(self) -> int:
+        """Get the length of the stream about to be parsed.
+
+        The length is read from the `/Length` entry of the dictionary on top of
+        the stack. Only direct integers are used, an indirect length would
+        require the object it points to which may not have been parsed yet.
+
+        :return: The length of the stream or None if it is unknown
+        :rtype: int or None
+        """
+        stack = self.processor.tokens.stack
+        if not stack or type(stack[-1]) != PDFDictionary:
+            return None
+
+        if b"Length" not in stack[-1]:
+            return None
+
+        length = stack[-1][b"Length"]
+        if type(length) != PDFNumber or type(length.value) != int:
+            return None
+
+        if length.value < 0:
+            return None
+
+        return length.value
+
+    def _parse_stream(self):
+        offset = self.offset + len(b"stream")
+
+        # Jump directly at the end of the stream when its length is known and
+        # check the endstream keyword is there. Like when the endstream
+        # keyword is searched, the stream holds everything up to the keyword,
+        # the end of line preceding it included.
+        length = self._stream_length()
+        if length != None:
+            start = self.start_of_stream.match(self.binary_data, offset)
+            if start:
+                end = start.end() + length
+                keyword = self.end_of_stream_keyword.match(self.binary_data, end)
+                if keyword:
+                    self.processor.push(PDFStream(self._view(
+                        start.end(), keyword.end() - len(b"endstream")
+                    )))
+                    self.offset = keyword.end()
+                    return
+
+                # The endstream keyword may be in the next chunk.
+                blank = self.white_spaces.match(self.binary_data, end)
+                available = len(self.binary_data) - blank.end()
+                if self.more_data_expected and available < len(b"endstream"):
+                    raise UnexpectedSequence(
+                        "Incomplete stream at offset %d" % self.offset
+                    )
+
+        # Look for the endstream keyword.
+        stream = self.end_of_stream.search(self.binary_data, offset)
+        self.processor.push(PDFStream(self._view(*stream.span(2))))
+        self.offset = stream.span(0)[1]
+
     def _parse_command(self):
         sub = self.end_of_word.search(self.binary_data, self.offset)
         word = sub.group(1)
 
         if word == b"stream":
-            stream = self.end_of_stream.search(
-                self.binary_data, self.offset + len(b"stream")
-            )
-            self.processor.push(PDFStream(stream.group(2)))
-            self.offset = stream.span(0)[1]
+            self._parse_stream()
         elif word == b"null":
             self.processor.push(PDFNull())
             self.offset = sub.span(0)[1]
         else:
             self.processor.push(PDFCommand(word))
             self.offset = sub.span(0)[1]
+
+    def parse_object(self, binary_data, offset: int) -> PDFObject:
+        """Parses one indirect object.
+
+        Parsing starts at the given offset, which must be the offset of an
+        object as given by a cross-reference, and stops as soon as the
+        `endobj` keyword has been read.
+
+        The object is pushed on the processor stack like during a full parse.
+
+        :param binary_data: The block of bytes containing the object
+        :type binary_data: bytes or bytearray or memoryview or mmap
+        :param offset: Offset of the object in the block of bytes
+        :type offset: int
+        :return: The object or None if no object could be read
+        :rtype: PDFObject or None
+        :raise UnexpectedCharacter: If a character is unexpected.
+        """
+        assert type(offset) == int
+
+        self.offset = offset
+        self.binary_data = binary_data
+
+        if self.engine == ENGINE_SCANNER:
+            parse_token = self._scan_token
+        else:
+            parse_token = self._dispatch_token
+
+        stack = self.processor.tokens.stack
+        stack_size = len(stack)
+        length = len(self.binary_data)
+        try:
+            while self.offset < length:
+                parse_token()
+
+                if len(stack) == stack_size + 1 and type(stack[-1]) == PDFObject:
+                    return stack[-1]
+        except AssertionError:
+            raise UnexpectedSequence(
+                "Unexpected sequence at offset %d" % self.offset
+            )
+
+        return None
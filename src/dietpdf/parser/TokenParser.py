@@ -18,6 +18,7 @@ from ..token.PDFDictClose import PDFDictClose
 from ..token.PDFHexString import PDFHexString
 from ..token.PDFString import PDFString
 from ..token.PDFRaw import PDFRaw
+from ..token.string_codec import find_string_end
 
 from ..processor.TokenProcessor import TokenProcessor
 
@@ -29,15 +30,83 @@ class UnexpectedSequence(Exception):
     pass
 
 
-class TokenParser:
+# Parsing engines.
+ENGINE_DISPATCH = "dispatch"  # Looks at each byte to select a method
+ENGINE_SCANNER = "scanner"  # Recognizes each token with one master pattern
+
+
+# First number is the precision, second number is the number of
+# parameters.
+OPERATOR_PRECISION = {
+    b"cm": (4, 5),
+    b"d0": (2, 2),
+    b"d1": (2, 6),
+    b"G": (3, 1),
+    b"g": (3, 1),
+    b"RG": (3, 3),
+    b"rg": (3, 3),
+    b"K": (3, 4),
+    b"k": (3, 4),
+    b"i": (1, 1),
+    b"w": (2, 1),
+    b"m": (2, 2),
+    b"l": (2, 2),
+    b"c": (2, 6),
+    b"v": (2, 4),
+    b"y": (2, 4),
+    b"re": (2, 4),
+    b"SC": (3, 4),
+    b"SCN": (3, 4),
+    b"sc": (3, 4),
+    b"scn": (3, 4),
+    b"Td": (3, 2),
+    b"TD": (3, 2),
+    b"Tf": (2, 1),
+    b"Tc": (3, 1),
+    b"Tw": (3, 1),
+    b"Tm": (4, 6),
+}
+
+
+class _PendingTokens:
+    """Holds the tokens pushed while parsing one token of a chunk.
+
+    When parsing chunks, a token may be cut by the end of the available data.
+    Its tokens are kept aside until the parser knows it is complete, they are
+    then handed to the real processor.
+    """
+
     def __init__(self, processor: TokenProcessor):
+        self.tokens = processor.tokens
+        self.items = []
+
+    def push(self, item):
+        self.items.append(item)
 
+
+class TokenParser:
+    def __init__(self, processor: TokenProcessor, engine: str = ENGINE_SCANNER):
+        """Create a parser feeding a processor.
+
+        :param processor: The processor receiving the tokens
+        :type processor: TokenProcessor
+        :param engine: The parsing engine, either `ENGINE_SCANNER` (default)
+            or `ENGINE_DISPATCH`
+        :type engine: str
+        """
         assert isinstance(processor, TokenProcessor)
+        assert engine in [ENGINE_SCANNER, ENGINE_DISPATCH]
 
         self.processor = processor
+        self.engine = engine
         self.offset = 0
         self.binary_data = b""
 
+        # Incremental parsing (see `feed` and `close`)
+        self.more_data_expected = False
+        self.pending = bytearray()
+        self.resume_size = 0
+
         # Characters authorized by the PDF specifications
         self.pdf_white_space = b"\0\t\n\f\r "
         self.pdf_delimiter = b"()<>[]{}/%"
@@ -77,6 +146,23 @@ class TokenParser:
             re.DOTALL
         )
 
+        # The master pattern recognizes any simple token in one match. Its
+        # alternatives use the same expressions as the dedicated ones above.
+        self.master_token = re.compile(
+            b"(?P<white_space>[%s]+)" % re.escape(self.pdf_white_space) +
+            b"|(?P<number>[+-]?[0-9]+\\.?[0-9]*|[+-]?[0-9]*\\.[0-9]+)" +
+            self.end_value +
+            b"|(?P<command>[%s])" % self.start_command +
+            b"|/(?P<name>[%s]+)" % self.pdf_name_chars + self.end_value +
+            b"|(?P<dict_open><<)" +
+            b"|(?P<dict_close>>>)" +
+            b"|(?P<list_open>\\[)" +
+            b"|(?P<list_close>\\])" +
+            b"|<(?P<hex_string>[A-Fa-f0-9%s]*)>" % self.pdf_white_space +
+            b"|(?P<string>\\()" +
+            b"|(?P<comment>%[^\r\n]*)[\r\n]*"
+        )
+
         self.end_of_inline_image = re.compile(
             b"(\r\n|[%s])(.+?)[%s](?=\n?EI[%s])"
             % (re.escape(self.pdf_white_space),
@@ -85,38 +171,26 @@ class TokenParser:
             re.DOTALL
         )
 
-        # First number is the precision, second number is the number of
-        # parameters.
-        self.operator_precision = {
-            b"cm": (4, 5),
-            b"d0": (2, 2),
-            b"d1": (2, 6),
-            b"G": (3, 1),
-            b"g": (3, 1),
-            b"RG": (3, 3),
-            b"rg": (3, 3),
-            b"K": (3, 4),
-            b"k": (3, 4),
-            b"i": (1, 1),
-            b"w": (2, 1),
-            b"m": (2, 2),
-            b"l": (2, 2),
-            b"c": (2, 6),
-            b"v": (2, 4),
-            b"y": (2, 4),
-            b"re": (2, 4),
-            b"SC": (3, 4),
-            b"SCN": (3, 4),
-            b"sc": (3, 4),
-            b"scn": (3, 4),
-            b"Td": (3, 2),
-            b"TD": (3, 2),
-            b"Tf": (2, 1),
-            b"Tc": (3, 1),
-            b"Tw": (3, 1),
-            b"Tm": (4, 6),
+        # Inline image data whose length is known must be followed by the EI
+        # operator.
+        self.start_of_inline_image = re.compile(
+            b"\r\n|[%s]" % re.escape(self.pdf_white_space)
+        )
+        self.end_of_inline_image_data = re.compile(
+            b"[%s]*EI(?=[%s]|$)"
+            % (re.escape(self.pdf_white_space), re.escape(self.pdf_white_space))
+        )
+
+        # Number of color components of the inline image color spaces.
+        self.inline_image_components = {
+            b"G": 1, b"DeviceGray": 1,
+            b"RGB": 3, b"DeviceRGB": 3,
+            b"CMYK": 4, b"DeviceCMYK": 4,
+            b"I": 1, b"Indexed": 1,
         }
 
+        self.operator_precision = OPERATOR_PRECISION
+
     def _parse_white_space(self):
         self.offset += 1
 
@@ -136,28 +210,173 @@ class TokenParser:
         sub = self.end_of_word.search(self.binary_data, self.offset)
         word = sub.group(1)
 
-        self.processor.push(PDFCommand(word))
-
         if word == b"ID":
             # Inline image detected
-            raw = self.end_of_inline_image.search(
-                self.binary_data, self.offset + len(b"ID")
-            )
-            self.processor.push(PDFRaw(raw.group(2)))
-            self.offset = raw.span(0)[1]
-        else:
-            self.offset = sub.span(0)[1]
+            image = self._inline_image_by_length(self.offset + len(b"ID"))
 
-            # Apply precision according to the command.
+            if image is None:
+                # Look for the first EI operator preceded by a white space.
+                raw = self.end_of_inline_image.search(
+                    self.binary_data, self.offset + len(b"ID")
+                )
+                image = (raw.group(2), raw.span(0)[1])
+
+            self.processor.push(PDFCommand(word))
+            self.processor.push(PDFRaw(bytes(image[0])))
+            self.offset = image[1]
+        else:
+            # Apply precision according to the command to its parameters.
             if word in self.operator_precision:
                 precision, update_count = self.operator_precision[word]
                 stack = self.processor.tokens.stack
-                for index in range(-2, -(update_count + 2), -1):
+                for index in range(-1, -(update_count + 1), -1):
                     if type(stack[index]) == PDFNumber:
                         stack[index].set_precision(precision)
                     else:
                         break
 
+            self.processor.push(PDFCommand(word))
+            self.offset = sub.span(0)[1]
+
+
+    def _inline_image_dictionary(self) -> dict:
+        """Get the entries of the inline image being parsed.
+
+        The entries are the tokens pushed since the last `BI` operator. Array
+        values are given as the list of their tokens.
+
+        :return: The entries of the inline image or None if they are not
+            understood
+        :rtype: dict
+        """
+        stack = self.processor.tokens.stack
+
+        start = len(stack) - 1
+        while start >= 0:
+            if type(stack[start]) == PDFCommand and stack[start].command == b"BI":
+                break
+            start -= 1
+        else:
+            return None
+
+        entries = {}
+        index = start + 1
+        while index < len(stack):
+            key = stack[index]
+            if type(key) != PDFName or index + 1 >= len(stack):
+                return None
+
+            index += 1
+            if type(stack[index]) == PDFListOpen:
+                value = []
+                index += 1
+                while index < len(stack) and type(stack[index]) != PDFListClose:
+                    value.append(stack[index])
+                    index += 1
+            else:
+                value = stack[index]
+
+            entries[key.name] = value
+            index += 1
+
+        return entries
+
+    def _inline_image_length(self) -> int:
+        """Compute the length of the data of the inline image being parsed.
+
+        The length is either given by the `/L` entry or computed from the
+        width, height, bits per component and color space of an unfiltered
+        image.
+
+        :return: The length in bytes or None if it cannot be computed
+        :rtype: int
+        """
+        entries = self._inline_image_dictionary()
+        if entries is None:
+            return None
+
+        def entry(abbreviation, name):
+            if abbreviation in entries:
+                return entries[abbreviation]
+
+            return entries.get(name)
+
+        def integer(value):
+            if type(value) == PDFNumber and type(value.value) == int:
+                return value.value
+
+            return None
+
+        length = integer(entry(b"L", b"Length"))
+        if length is not None:
+            return length
+
+        # Filtered data length cannot be known without decoding it.
+        if entry(b"F", b"Filter") is not None:
+            return None
+
+        width = integer(entry(b"W", b"Width"))
+        height = integer(entry(b"H", b"Height"))
+
+        mask = entry(b"IM", b"ImageMask")
+        if type(mask) == PDFCommand and mask.command == b"true":
+            bits, components = 1, 1
+        else:
+            bits = integer(entry(b"BPC", b"BitsPerComponent"))
+            color_space = entry(b"CS", b"ColorSpace")
+
+            # Indexed color spaces are given as arrays.
+            if type(color_space) == list and color_space:
+                color_space = color_space[0]
+
+            if type(color_space) != PDFName:
+                return None
+
+            components = self.inline_image_components.get(color_space.name)
+
+        if None in [width, height, bits, components]:
+            return None
+
+        return (width * components * bits + 7) // 8 * height
+
+    def _inline_image_by_length(self, offset: int) -> tuple:
+        """Get the data of the inline image being parsed using its length.
+
+        The data must be followed by the EI operator, otherwise the length is
+        considered wrong.
+
+        :param offset: The offset following the ID operator
+        :type offset: int
+        :return: The data and the offset of the EI operator or None if the
+            length is unknown or wrong
+        :rtype: tuple
+        """
+        length = self._inline_image_length()
+        if length is None:
+            return None
+
+        separator = self.start_of_inline_image.match(self.binary_data, offset)
+        if separator is None:
+            return None
+
+        # A CR LF separator could also be a CR followed by data.
+        starts = [separator.end()]
+        if separator.end() - offset == 2:
+            starts.append(offset + 1)
+
+        for start in starts:
+            end = start + length
+
+            if (self.more_data_expected and
+                    end + len(b"EI") >= len(self.binary_data)):
+                raise UnexpectedSequence(
+                    "Incomplete inline image at offset %d" % self.offset
+                )
+
+            if self.end_of_inline_image_data.match(self.binary_data, end):
+                return (self.binary_data[start:end], end)
+
+        return None
 
     def _parse_name(self):
         sub = self.end_of_word.search(self.binary_data, self.offset + 1)
@@ -186,72 +405,222 @@ class TokenParser:
         self.offset = sub.span(0)[1]
 
     def _parse_string(self):
-        char_offset = self.offset + 1
-        nested = 1
-        while nested != 0:
-            char = self.binary_data[char_offset:char_offset + 1]
-            if char == b")":
-                nested -= 1
-            elif char == b"(":
-                nested += 1
-            elif char == b"\\":
-                char_offset += 1
-
-            char_offset += 1
+        char_offset = find_string_end(self.binary_data, self.offset)
+        if char_offset is None:
+            raise UnexpectedSequence(
+                "Unterminated string at offset %d" % self.offset
+            )
 
         self.processor.push(
-            PDFString(self.binary_data[self.offset+1:char_offset-1])
+            PDFString(bytes(self.binary_data[self.offset+1:char_offset-1]))
         )
 
         self.offset = char_offset
 
-    def parse(self, binary_data: bytes):
+    def _dispatch_token(self):
+        """Parses one token by looking at its first byte.
+
+        This is the original engine: the first byte of the token selects the
+        method which will parse it.
+        """
+        current = self.binary_data[self.offset:self.offset+1]
+
+        if current in self.pdf_white_space:
+            self._parse_white_space()
+        elif current in self.start_comment:
+            self._parse_comment()
+        elif current in self.start_number:
+            self._parse_number()
+        elif current in self.start_command:
+            self._parse_command()
+        elif current in self.start_name:
+            self._parse_name()
+        elif current == b"[":
+            self._parse_list_open()
+        elif current == b"]":
+            self._parse_list_close()
+        elif self.binary_data[self.offset:self.offset + 2] == b"<<":
+            self._parse_dict_open()
+        elif self.binary_data[self.offset:self.offset + 2] == b">>":
+            self._parse_dict_close()
+        elif current == b"<":
+            self._parse_hex_string()
+        elif current == b"(":
+            self._parse_string()
+        else:
+            raise UnexpectedCharacter(
+                "Unexpected character 0x%02x at offset %d" %
+                (current[0], self.offset)
+            )
+
+    def _scan_token(self):
+        """Parses one token with the master pattern.
+
+        One match of the master pattern skips a whole run of white spaces or
+        recognizes a complete simple token. Commands and strings are handed to
+        their dedicated methods because they may need to look further (inline
+        images, streams, nested parentheses).
+
+        Anything the master pattern does not recognize is handed to the
+        original engine so that both engines behave the same on malformed
+        input.
+        """
+        token = self.master_token.match(self.binary_data, self.offset)
+
+        if token is None:
+            self._dispatch_token()
+            return
+
+        kind = token.lastgroup
+
+        if kind == "white_space":
+            self.offset = token.end()
+        elif kind == "number":
+            self.processor.push(PDFNumber(token.group(kind)))
+            self.offset = token.end()
+        elif kind == "command":
+            self._parse_command()
+        elif kind == "name":
+            self.processor.push(PDFName(token.group(kind)))
+            self.offset = token.end()
+        elif kind == "dict_open":
+            self.processor.push(PDFDictOpen())
+            self.offset = token.end()
+        elif kind == "dict_close":
+            self.processor.push(PDFDictClose())
+            self.offset = token.end()
+        elif kind == "list_open":
+            self.processor.push(PDFListOpen())
+            self.offset = token.end()
+        elif kind == "list_close":
+            self.processor.push(PDFListClose())
+            self.offset = token.end()
+        elif kind == "hex_string":
+            self.processor.push(PDFHexString(token.group(kind)))
+            self.offset = token.end()
+        elif kind == "string":
+            self._parse_string()
+        elif kind == "comment":
+            self.processor.push(PDFComment(token.group(kind)))
+            self.offset = token.end()
+
+    def parse(self, binary_data):
         """Parses a PDF
 
         Given a freshly created PDFself.Processor, this function parses a block
         of bytes and extract the PDF structure and objects.
 
+        The block of bytes may be any buffer object (`bytes`, `bytearray`,
+        `memoryview` or `mmap`). Using a memory mapped file avoids reading the
+        whole file in memory before parsing it.
+
         Once finished, the PDFself.Processor object will hold the structure and
         objects.
+
+        :param binary_data: The block of bytes to parse
+        :type binary_data: bytes or bytearray or memoryview or mmap
         :raise UnexpectedCharacter: If a character is unexpected.
         """
         self.offset = 0
         self.binary_data = binary_data
 
-        while self.offset < len(self.binary_data):
-            try:
-                current = self.binary_data[self.offset:self.offset+1]
-
-                if current in self.pdf_white_space:
-                    self._parse_white_space()
-                elif current in self.start_comment:
-                    self._parse_comment()
-                elif current in self.start_number:
-                    self._parse_number()
-                elif current in self.start_command:
-                    self._parse_command()
-                elif current in self.start_name:
-                    self._parse_name()
-                elif current == b"[":
-                    self._parse_list_open()
-                elif current == b"]":
-                    self._parse_list_close()
-                elif self.binary_data[self.offset:self.offset + 2] == b"<<":
-                    self._parse_dict_open()
-                elif self.binary_data[self.offset:self.offset + 2] == b">>":
-                    self._parse_dict_close()
-                elif current == b"<":
-                    self._parse_hex_string()
-                elif current == b"(":
-                    self._parse_string()
-                else:
-                    raise UnexpectedCharacter(
-                        "Unexpected character 0x%02x at offset %d" %
-                        (current[0], self.offset)
-                    )
-            except UnexpectedCharacter:
-                raise
-            except AssertionError:
-                raise UnexpectedSequence(
-                    "Unexpected sequence at offset %d" % self.offset
-                )
+        if self.engine == ENGINE_SCANNER:
+            parse_token = self._scan_token
+        else:
+            parse_token = self._dispatch_token
+
+        length = len(self.binary_data)
+        try:
+            while self.offset < length:
+                parse_token()
+        except AssertionError:
+            raise UnexpectedSequence(
+                "Unexpected sequence at offset %d" % self.offset
+            )
+
+    def feed(self, chunk):
+        """Parses a chunk of a PDF.
+
+        The chunks given to successive calls are the consecutive parts of one
+        PDF. Every complete token is handed to the processor as soon as it is
+        available. A token cut by the end of a chunk (a string, a hex string,
+        a stream...) is kept and parsed again once the following chunks have
+        been received.
+
+        A cut token is not tried again before the available data has doubled,
+        this keeps the parsing time linear even for huge streams.
+
+        Once the last chunk has been fed, `close` must be called.
+
+        :param chunk: The next bytes of the PDF
+        :type chunk: bytes or bytearray or memoryview
+        """
+        self.pending += chunk
+
+        if len(self.pending) >= self.resume_size:
+            self._parse_pending(False)
+
+    def close(self):
+        """Parses the remaining data of a PDF fed by chunks.
+
+        :raise UnexpectedCharacter: If a character is unexpected.
+        :raise UnexpectedSequence: If a sequence is unexpected or incomplete.
+        """
+        self._parse_pending(True)
+
+    def _parse_pending(self, final: bool):
+        """Parses the data fed so far.
+
+        Unless the parsing is final, each token is parsed aside and is only
+        handed to the processor if it ends before the end of the available
+        data. A token reaching the end of the data could be continued by the
+        next chunk (a number or a command for example) and a token raising an
+        error could be completed by it.
+
+        :param final: True if no more data will be fed
+        :type final: bool
+        """
+        self.binary_data = self.pending
+        self.offset = 0
+        self.more_data_expected = not final
+
+        if self.engine == ENGINE_SCANNER:
+            parse_token = self._scan_token
+        else:
+            parse_token = self._dispatch_token
+
+        processor = self.processor
+        length = len(self.binary_data)
+        try:
+            while self.offset < length:
+                if final:
+                    parse_token()
+                    continue
+
+                start = self.offset
+                self.processor = _PendingTokens(processor)
+                try:
+                    parse_token()
+                    complete = self.offset < length
+                except Exception:
+                    complete = False
+                finally:
+                    pending_tokens = self.processor
+                    self.processor = processor
+
+                if not complete:
+                    self.offset = start
+                    break
+
+                for item in pending_tokens.items:
+                    processor.push(item)
+        except AssertionError:
+            raise UnexpectedSequence(
+                "Unexpected sequence at offset %d" % self.offset
+            )
+        finally:
+            del self.pending[:self.offset]
+            self.binary_data = b""
+            self.offset = 0
+            self.more_data_expected = False
+            self.resume_size = 2 * len(self.pending)
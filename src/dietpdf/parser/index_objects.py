@@ -0,0 +1,79 @@
+__author__ = "Frédéric BISSON"
+__copyright__ = "Copyright 2022, Frédéric BISSON"
+__credits__ = ["Frédéric BISSON"]
+__license__ = "mit"
+__maintainer__ = "Frédéric BISSON"
+__email__ = "zigazou@protonmail.com"
+
+import re
+
+_WHITE_SPACE = b"\\0\\t\\n\\f\\r "
+_DELIMITER = b"()<>\\[\\]{}/%"
+
+# One sweep recognizes object headers, trailers, startxrefs and the start of
+# streams whose content must be skipped.
+_landmarks = re.compile(
+    b"(?<![^%s%s])(?P<obj_num>[0-9]+)[%s]+(?P<gen_num>[0-9]+)[%s]+obj"
+    b"(?=[%s%s]|$)"
+    % (_WHITE_SPACE, _DELIMITER, _WHITE_SPACE, _WHITE_SPACE,
+       _WHITE_SPACE, _DELIMITER) +
+    b"|(?<![a-zA-Z])(?P<trailer>trailer)(?=[%s<])" % _WHITE_SPACE +
+    b"|(?<![a-zA-Z])startxref[%s]+(?P<startxref>[0-9]+)" % _WHITE_SPACE +
+    b"|(?<![a-zA-Z])(?P<stream>stream)(?:\r\n|\n)"
+)
+
+_end_of_stream = re.compile(
+    b"endstream[%s]+endobj" % _WHITE_SPACE
+)
+
+
+def index_objects(binary_data) -> tuple:
+    """Index the objects of a PDF without relying on its cross-references.
+
+    A single regular expression sweep finds every `N G obj` header, every
+    `trailer` and every `startxref` keyword. Stream contents are skipped by
+    jumping to their `endstream endobj` sequence so that binary data cannot
+    be mistaken for an object header.
+
+    When an object is defined more than once, the last definition wins, as
+    `PDFProcessor` does when it parses the whole PDF.
+
+    The references use the same format as `read_xref`: each object number is
+    associated to a tuple `(1, offset, generation number)`. Objects stored in
+    object streams are not indexed.
+
+    :param binary_data: The PDF content
+    :type binary_data: bytes or bytearray or memoryview or mmap
+    :return: The references, the offsets of the `trailer` keywords and the
+        values of the `startxref` keywords in file order
+    :rtype: tuple
+    """
+    references = {}
+    trailers = []
+    startxrefs = []
+
+    offset = 0
+    while True:
+        landmark = _landmarks.search(binary_data, offset)
+        if landmark is None:
+            break
+
+        offset = landmark.end()
+        kind = landmark.lastgroup
+
+        if kind == "gen_num":
+            references[int(landmark.group("obj_num"))] = (
+                1, landmark.start(), int(landmark.group("gen_num"))
+            )
+        elif kind == "trailer":
+            trailers.append(landmark.start())
+        elif kind == "startxref":
+            startxrefs.append(int(landmark.group("startxref")))
+        elif kind == "stream":
+            end = _end_of_stream.search(binary_data, offset)
+            if end is None:
+                break
+
+            offset = end.end()
+
+    return (references, trailers, startxrefs)
@@ -0,0 +1,50 @@
+__author__ = "Frédéric BISSON"
+__copyright__ = "Copyright 2022, Frédéric BISSON"
+__credits__ = ["Frédéric BISSON"]
+__license__ = "mit"
+__maintainer__ = "Frédéric BISSON"
+__email__ = "zigazou@protonmail.com"
+
+from contextlib import contextmanager
+from mmap import mmap, ACCESS_READ
+
+
+@contextmanager
+def map_file(file_name: str):
+    """Map a file in memory for reading.
+
+    The file content is paged in on demand by the operating system instead of
+    being read at once. The mapped file can be given directly to the parsers
+    since their regular expressions work on any buffer object.
+
+    An empty file cannot be mapped, an empty byte string is given instead.
+
+    Usage:
+
+        with map_file("document.pdf") as pdf_file_content:
+            parser.parse(pdf_file_content)
+
+    :param file_name: The path of the file to map
+    :type file_name: str
+    :return: A read-only memory mapped file
+    :rtype: mmap or bytes
+    """
+    assert type(file_name) == str
+
+    with open(file_name, "rb") as pdf_file:
+        try:
+            mapped = mmap(pdf_file.fileno(), 0, access=ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped.
+            yield b""
+            return
+
+        try:
+            yield mapped
+        finally:
+            try:
+                mapped.close()
+            except BufferError:
+                # Some items still hold a view on the mapped file, it will be
+                # closed when they are garbage collected.
+                pass
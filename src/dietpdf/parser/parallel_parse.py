@@ -0,0 +1,214 @@
+__author__ = "Frédéric BISSON"
+__copyright__ = "Copyright 2022, Frédéric BISSON"
+__credits__ = ["Frédéric BISSON"]
+__license__ = "mit"
+__maintainer__ = "Frédéric BISSON"
+__email__ = "zigazou@protonmail.com"
+
+from logging import getLogger
+from mmap import mmap, ACCESS_READ
+from multiprocessing import Pool
+from os import cpu_count
+
+from ..item.PDFStream import PDFStream
+from ..item.PDFTrailer import PDFTrailer
+from ..processor.PDFProcessor import PDFProcessor
+from ..pdf.LazyPDF import LazyPDF
+
+from .PDFParser import PDFParser
+from .read_xref import InvalidXref
+
+_logger = getLogger("parallel_parse")
+
+# Each worker gets several ranges so that a worker given a range of slow
+# objects (fonts, content streams...) does not delay the others.
+RANGES_PER_WORKER = 4
+
+# The PDF mapped in memory by each worker process.
+_worker_data = None
+
+
+class _StreamSpanParser(PDFParser):
+    """A PDFParser which does not keep the content of streams.
+
+    Objects parsed by workers are sent back to the main process. Sending their
+    stream contents would copy them, only their position is sent instead.
+    """
+
+    def __init__(self, processor: PDFProcessor):
+        super().__init__(processor)
+        self.stream_span = None
+
+    def _view(self, start: int, end: int):
+        self.stream_span = (start, end)
+        return b""
+
+
+def _parse_range(binary_data, objects: list) -> list:
+    """Parse a range of objects.
+
+    :param binary_data: The PDF content
+    :type binary_data: bytes or bytearray or memoryview or mmap
+    :param objects: Offsets and numbers of the objects to parse
+    :type objects: list
+    :return: A list of tuples `(object, stream span)`, the stream span being
+        None when the object has no stream
+    :rtype: list
+    :raise InvalidXref: If an object is not found at its offset
+    """
+    parsed = []
+    parser = _StreamSpanParser(PDFProcessor())
+    for offset, obj_num in objects:
+        parser.stream_span = None
+        object = parser.parse_object(binary_data, offset)
+
+        if object is None or object.obj_num != obj_num:
+            raise InvalidXref(
+                "Object %d not found at offset %d" % (obj_num, offset)
+            )
+
+        # Objects are not needed once parsed.
+        parser.processor.tokens.pop()
+
+        if object.stream is not None:
+            object.stream = None
+            parsed.append((object, parser.stream_span))
+        else:
+            parsed.append((object, None))
+
+    return parsed
+
+
+def _open_worker(file_name: str):
+    """Map the PDF in memory once for each worker process."""
+    global _worker_data
+
+    with open(file_name, "rb") as pdf_file:
+        _worker_data = mmap(pdf_file.fileno(), 0, access=ACCESS_READ)
+
+
+def _parse_worker_range(objects: list) -> list:
+    return _parse_range(_worker_data, objects)
+
+
+def _split_objects(objects: list, range_count: int, end: int) -> list:
+    """Split objects sorted by offset into ranges of similar byte sizes.
+
+    :param objects: Offsets and numbers of the objects, sorted by offset
+    :type objects: list
+    :param range_count: Number of ranges wanted
+    :type range_count: int
+    :param end: Offset of the end of the PDF
+    :type end: int
+    :return: A list of lists of objects
+    :rtype: list
+    """
+    if not objects:
+        return []
+
+    range_size = (end - objects[0][0]) / range_count
+
+    ranges = [[]]
+    range_start = objects[0][0]
+    for offset, obj_num in objects:
+        if offset - range_start >= range_size and ranges[-1]:
+            ranges.append([])
+            range_start = offset
+
+        ranges[-1].append((offset, obj_num))
+
+    return ranges
+
+
+def parallel_parse(
+    processor: PDFProcessor, file_name: str, binary_data, workers: int = None
+):
+    """Parses the live revision of a PDF using several worker processes.
+
+    The objects offsets are read from the cross-references or, when they are
+    invalid, from an index of the objects found in the PDF. Since they only
+    give the last definition of each object number, the last definition wins
+    like when the whole PDF is parsed.
+
+    The objects are split in ranges of offsets parsed by worker processes.
+    Each worker maps the PDF file in memory instead of receiving its content.
+    Stream contents are not sent back, the objects use views on
+    `binary_data` instead.
+
+    Once finished, the processor holds the objects in file order followed by a
+    `PDFTrailer` holding the newest trailer dictionary, like
+    `parse_live_revision` does. There is no need to call `end_parsing`.
+
+    :param processor: A freshly created processor
+    :type processor: PDFProcessor
+    :param file_name: The path of the PDF file, opened by the workers
+    :type file_name: str
+    :param binary_data: The PDF content, as found in the file
+    :type binary_data: bytes or bytearray or memoryview or mmap
+    :param workers: Number of worker processes, defaults to the number of CPUs.
+        With one worker, objects are parsed by the current process.
+    :type workers: int or None
+    :raise InvalidXref: If no trailer can be found or an object is not found at
+        its offset. The processor state is then inconsistent and the PDF must
+        be parsed entirely with a new processor.
+    """
+    assert isinstance(processor, PDFProcessor)
+    assert type(file_name) == str
+    assert workers == None or (type(workers) == int and workers > 0)
+
+    if workers == None:
+        workers = cpu_count() or 1
+
+    document = LazyPDF(binary_data)
+
+    objects = sorted(
+        (entry[1], obj_num)
+        for obj_num, entry in document.references.items()
+        if entry[0] == 1
+    )
+
+    ranges = _split_objects(
+        objects, workers * RANGES_PER_WORKER, len(binary_data)
+    )
+
+    _logger.debug(
+        "Parsing %d objects in %d ranges with %d workers" %
+        (len(objects), len(ranges), workers)
+    )
+
+    if workers == 1:
+        results = (
+            _parse_range(binary_data, objects_range)
+            for objects_range in ranges
+        )
+        _merge_ranges(processor, binary_data, results)
+    else:
+        with Pool(workers, _open_worker, (file_name,)) as pool:
+            results = pool.imap(_parse_worker_range, ranges)
+            _merge_ranges(processor, binary_data, results)
+
+    processor.tokens.push(PDFTrailer(document.trailer))
+
+
+def _merge_ranges(processor: PDFProcessor, binary_data, results):
+    """Push parsed objects onto the processor stack, in range order.
+
+    :param processor: The processor receiving the objects
+    :type processor: PDFProcessor
+    :param binary_data: The PDF content the stream spans refer to
+    :type binary_data: bytes or bytearray or memoryview or mmap
+    :param results: The results of `_parse_range` for each range
+    :type results: iterable
+    """
+    if type(binary_data) == bytearray:
+        def view(start, end): return bytes(binary_data[start:end])
+    else:
+        buffer = memoryview(binary_data)
+        def view(start, end): return buffer[start:end]
+
+    for parsed in results:
+        for object, stream_span in parsed:
+            if stream_span is not None:
+                object.stream = PDFStream(view(*stream_span))
+
+            processor.tokens.push(object)
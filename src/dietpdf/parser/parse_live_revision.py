@@ -0,0 +1,64 @@
+__author__ = "Frédéric BISSON"
+__copyright__ = "Copyright 2022, Frédéric BISSON"
+__credits__ = ["Frédéric BISSON"]
+__license__ = "mit"
+__maintainer__ = "Frédéric BISSON"
+__email__ = "zigazou@protonmail.com"
+
+from logging import getLogger
+
+from ..item.PDFTrailer import PDFTrailer
+from ..processor.PDFProcessor import PDFProcessor
+
+from .PDFParser import PDFParser
+from .read_xref import read_xref, InvalidXref
+
+_logger = getLogger("parse_live_revision")
+
+
+def parse_live_revision(processor: PDFProcessor, binary_data):
+    """Parses only the live revision of a PDF.
+
+    An incrementally updated PDF keeps every superseded version of its
+    objects. Instead of parsing them all and letting the processor keep the
+    last ones, the cross-references (following `startxref` and the `/Prev`
+    chain) tell which definitions are live: only these are parsed, in file
+    order.
+
+    Once finished, the processor holds the live objects followed by a
+    `PDFTrailer` holding the newest trailer dictionary, there is no need to
+    call `end_parsing`.
+
+    :param processor: A freshly created processor
+    :type processor: PDFProcessor
+    :param binary_data: The PDF content
+    :type binary_data: bytes or bytearray or memoryview or mmap
+    :raise InvalidXref: If the cross-references cannot be read or do not point
+        to the objects. The processor state is then inconsistent and the PDF
+        must be parsed entirely with a new processor.
+    """
+    assert isinstance(processor, PDFProcessor)
+
+    references, trailer = read_xref(binary_data)
+
+    live_objects = sorted(
+        (entry[1], obj_num)
+        for obj_num, entry in references.items()
+        if entry[0] == 1
+    )
+
+    _logger.debug(
+        "%d live objects out of %d references" %
+        (len(live_objects), len(references))
+    )
+
+    parser = PDFParser(processor)
+    for offset, obj_num in live_objects:
+        object = parser.parse_object(binary_data, offset)
+
+        if object is None or object.obj_num != obj_num:
+            raise InvalidXref(
+                "Object %d not found at offset %d" % (obj_num, offset)
+            )
+
+    processor.tokens.push(PDFTrailer(trailer))
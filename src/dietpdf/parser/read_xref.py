@@ -0,0 +1,246 @@
+__author__ = "Frédéric BISSON"
+__copyright__ = "Copyright 2022, Frédéric BISSON"
+__credits__ = ["Frédéric BISSON"]
+__license__ = "mit"
+__maintainer__ = "Frédéric BISSON"
+__email__ = "zigazou@protonmail.com"
+
+import re
+
+from ..item.PDFObject import PDFObject
+from ..item.PDFDictionary import PDFDictionary
+from ..item.PDFXref import PDFXref
+from ..item.PDFTrailer import PDFTrailer
+from ..processor.PDFProcessor import PDFProcessor
+
+from .PDFParser import PDFParser
+
+
+class InvalidXref(Exception):
+    pass
+
+
+# A startxref keyword is looked for at the end of the file only.
+STARTXREF_WINDOW = 1024
+
+_startxref = re.compile(b"startxref[\0\t\n\f\r ]+([0-9]+)")
+_xref_keyword = re.compile(b"[\0\t\n\f\r ]*xref")
+_startxref_keyword = re.compile(b"startxref")
+
+
+def find_startxref(binary_data) -> int:
+    """Find the offset of the last cross-reference section of a PDF.
+
+    :param binary_data: The PDF content
+    :type binary_data: bytes or bytearray or memoryview or mmap
+    :return: The offset given by the last `startxref` keyword
+    :rtype: int
+    :raise InvalidXref: If there is no `startxref` at the end of the PDF
+    """
+    last = None
+    start = max(0, len(binary_data) - STARTXREF_WINDOW)
+    for last in _startxref.finditer(binary_data, start):
+        pass
+
+    if last is None:
+        raise InvalidXref("No startxref found")
+
+    return int(last.group(1))
+
+
+def decode_xref_stream(xref_stream: PDFObject) -> dict:
+    """Decode the references of a cross-reference stream.
+
+    The references use the same format as `PDFXrefStream.references`: each
+    object number is associated to a tuple of 3 integers whose meaning depend
+    on the first one (0 = free, 1 = offset and generation number, 2 = object
+    stream number and index in it).
+
+    :param xref_stream: The cross-reference stream object
+    :type xref_stream: PDFObject
+    :return: The references
+    :rtype: dict
+    """
+    assert type(xref_stream) == PDFObject
+
+    widths = [int(width) for width in xref_stream[b"W"]]
+    if b"Index" in xref_stream:
+        index = [int(number) for number in xref_stream[b"Index"]]
+    else:
+        index = [0, int(xref_stream[b"Size"])]
+
+    data = xref_stream.decode_stream()
+
+    references = {}
+    offset = 0
+    for subsection in range(0, len(index), 2):
+        base, count = index[subsection], index[subsection + 1]
+        for obj_num in range(base, base + count):
+            fields = []
+            for width in widths:
+                fields.append(int.from_bytes(data[offset:offset + width], "big"))
+                offset += width
+
+            # The type field defaults to 1 when its width is 0.
+            if widths[0] == 0:
+                fields[0] = 1
+
+            references[obj_num] = tuple(fields)
+
+        if offset > len(data):
+            raise InvalidXref("Truncated cross-reference stream")
+
+    return references
+
+
+def _xref_table_references(xref: PDFXref) -> dict:
+    """Convert a classic cross-reference table to references.
+
+    :param xref: The cross-reference table
+    :type xref: PDFXref
+    :return: The references (see `decode_xref_stream`)
+    :rtype: dict
+    """
+    references = {}
+    for subsection in xref.subsections:
+        obj_num = subsection.base
+        for ref_offset, ref_new, ref_type in subsection.entries:
+            references[obj_num] = (1 if ref_type == "n" else 0, ref_offset, ref_new)
+            obj_num += 1
+
+    return references
+
+
+def _parse_until_startxref(binary_data, offset: int) -> list:
+    """Parse the items between an offset and the next `startxref` keyword or
+    the end of the PDF.
+
+    :param binary_data: The PDF content
+    :type binary_data: bytes or bytearray or memoryview or mmap
+    :param offset: Offset where to start parsing
+    :type offset: int
+    :return: The items parsed
+    :rtype: list
+    """
+    startxref = _startxref_keyword.search(binary_data, offset)
+    end = len(binary_data) if startxref is None else startxref.start()
+
+    processor = PDFProcessor()
+    try:
+        PDFParser(processor).parse(memoryview(binary_data)[offset:end])
+        processor.end_parsing()
+    except Exception as error:
+        raise InvalidXref("Cannot parse at offset %d: %s" % (offset, error))
+
+    return processor.tokens.stack
+
+
+def read_trailer(binary_data, offset: int) -> PDFDictionary:
+    """Read a trailer dictionary.
+
+    :param binary_data: The PDF content
+    :type binary_data: bytes or bytearray or memoryview or mmap
+    :param offset: Offset of the `trailer` keyword
+    :type offset: int
+    :return: The trailer dictionary
+    :rtype: PDFDictionary
+    :raise InvalidXref: If there is no trailer at this offset
+    """
+    for item in _parse_until_startxref(binary_data, offset):
+        if type(item) == PDFTrailer:
+            return item.dictionary
+
+    raise InvalidXref("No trailer at offset %d" % offset)
+
+
+def _read_xref_section(binary_data, offset: int) -> tuple:
+    """Read one cross-reference section.
+
+    :param binary_data: The PDF content
+    :type binary_data: bytes or bytearray or memoryview or mmap
+    :param offset: Offset of the section (a `xref` table or a cross-reference
+        stream object)
+    :type offset: int
+    :return: The references and the trailer dictionary of the section
+    :rtype: tuple
+    """
+    if _xref_keyword.match(binary_data, offset):
+        # Classic table: parse everything until the startxref keyword.
+        xref = trailer = None
+        for item in _parse_until_startxref(binary_data, offset):
+            if type(item) == PDFXref and xref is None:
+                xref = item
+            elif type(item) == PDFTrailer and trailer is None:
+                trailer = item
+
+        if xref is None or trailer is None:
+            raise InvalidXref("Invalid xref table at offset %d" % offset)
+
+        return (_xref_table_references(xref), trailer.dictionary)
+
+    # Cross-reference stream.
+    xref_stream = PDFParser(PDFProcessor()).parse_object(binary_data, offset)
+    if (
+        xref_stream is None or
+        type(xref_stream.value) != PDFDictionary or
+        b"Type" not in xref_stream or xref_stream[b"Type"] != b"XRef"
+    ):
+        raise InvalidXref("No cross-reference at offset %d" % offset)
+
+    return (decode_xref_stream(xref_stream), xref_stream.value)
+
+
+def read_xref(binary_data) -> tuple:
+    """Read the cross-references of a PDF.
+
+    Reading starts at the offset given by the last `startxref` and follows the
+    `/Prev` chain. Entries of the newest sections take precedence. Hybrid
+    files (a classic table whose trailer has a `/XRefStm` entry) are handled:
+    entries of the cross-reference stream replace the free entries of the
+    table.
+
+    :param binary_data: The PDF content
+    :type binary_data: bytes or bytearray or memoryview or mmap
+    :return: The references (see `decode_xref_stream`) and the trailer
+        dictionary of the newest section
+    :rtype: tuple
+    :raise InvalidXref: If the cross-references cannot be read
+    """
+    references = {}
+    trailer = None
+    visited = set()
+    offset = find_startxref(binary_data)
+
+    try:
+        while offset is not None:
+            if offset in visited or offset >= len(binary_data):
+                raise InvalidXref("Invalid xref offset %d" % offset)
+
+            visited.add(offset)
+
+            section, dictionary = _read_xref_section(binary_data, offset)
+
+            if b"XRefStm" in dictionary:
+                hidden, _ = _read_xref_section(
+                    binary_data, int(dictionary[b"XRefStm"])
+                )
+                for obj_num in hidden:
+                    if obj_num not in section or section[obj_num][0] == 0:
+                        section[obj_num] = hidden[obj_num]
+
+            for obj_num in section:
+                references.setdefault(obj_num, section[obj_num])
+
+            if trailer is None:
+                trailer = dictionary
+
+            if b"Prev" in dictionary:
+                offset = int(dictionary[b"Prev"])
+            else:
+                offset = None
+    except InvalidXref:
+        raise
+    except Exception as error:
+        raise InvalidXref("Invalid cross-reference: %s" % error)
+
+    return (references, trailer)
@@ -0,0 +1,176 @@
+__author__ = "Frédéric BISSON"
+__copyright__ = "Copyright 2022, Frédéric BISSON"
+__credits__ = ["Frédéric BISSON"]
+__license__ = "mit"
+__maintainer__ = "Frédéric BISSON"
+__email__ = "zigazou@protonmail.com"
+
+from logging import getLogger
+
+from ..parser.PDFParser import PDFParser
+from ..parser.read_xref import read_xref, read_trailer, InvalidXref
+from ..parser.index_objects import index_objects
+from ..processor.PDFProcessor import PDFProcessor
+from ..item.PDFObject import PDFObject
+from ..info.decode_objstm import decode_objstm
+
+from .PDF import PDF
+
+_logger = getLogger("LazyPDF")
+
+
+class LazyPDF(PDF):
+    """A PDF document whose objects are loaded on demand.
+
+    Instead of parsing the whole document, the cross-references are read and
+    an object is only parsed the first time `get` needs it. Loaded objects are
+    kept in the `objects` attribute, the stack stays empty.
+
+    When the cross-references cannot be read or point to wrong offsets, they
+    are replaced by an index of the objects found in the PDF.
+    """
+
+    def __init__(self, binary_data):
+        """Create a LazyPDF reading objects from a PDF content.
+
+        The PDF content must remain available as long as objects are loaded
+        from it.
+
+        :param binary_data: The PDF content
+        :type binary_data: bytes or bytearray or memoryview or mmap
+        :raise InvalidXref: If no trailer can be found
+        """
+        super().__init__()
+        self.binary_data = binary_data
+        self.repaired = False
+
+        try:
+            self.references, self.trailer = read_xref(binary_data)
+        except InvalidXref as error:
+            _logger.info("Invalid cross-references: %s" % error)
+            self.references, self.trailer = {}, None
+            self.repair()
+
+    def repair(self):
+        """Replace the cross-references by an index of the objects.
+
+        Objects stored in object streams are still located using the
+        cross-references when they are available.
+
+        :raise InvalidXref: If no trailer can be found
+        """
+        _logger.info("Indexing objects")
+        references, trailers, _ = index_objects(self.binary_data)
+
+        for obj_num, entry in self.references.items():
+            if entry[0] == 2 and obj_num not in references:
+                references[obj_num] = entry
+
+        self.references = references
+        self.repaired = True
+
+        if self.trailer is not None:
+            return
+
+        if trailers:
+            self.trailer = read_trailer(self.binary_data, trailers[-1])
+            return
+
+        # Cross-reference streams hold the trailer, the newest one is usually
+        # the last object. Objects which cannot be loaded, like a truncated
+        # incremental update, are skipped.
+        def object_offset(obj_num): return self.references[obj_num][1]
+
+        for obj_num in sorted(self.references, key=object_offset, reverse=True):
+            try:
+                object = self.load(obj_num)
+            except InvalidXref as error:
+                _logger.info("Skipping object %d: %s" % (obj_num, error))
+                continue
+
+            if object is None:
+                continue
+
+            if b"Type" in object and object[b"Type"] == b"XRef":
+                self.trailer = object.value
+                return
+
+        raise InvalidXref("No trailer found")
+
+    def load(self, obj_num: int) -> PDFObject:
+        """Load an object given its number.
+
+        An object stored in an object stream is loaded by decoding the whole
+        object stream. Every object of the object stream is then loaded.
+
+        :param obj_num: The object number
+        :type obj_num: int
+        :return: The object or None if it is not referenced
+        :rtype: PDFObject or None
+        :raise InvalidXref: If the object is not found at its offset or
+            cannot be parsed, even after repairing the cross-references, or if
+            its object stream cannot be decoded
+        """
+        assert type(obj_num) == int
+
+        if obj_num in self.objects:
+            return self.objects[obj_num]
+
+        if obj_num not in self.references:
+            return None
+
+        entry_type, field_2, _ = self.references[obj_num]
+
+        if entry_type == 1:
+            _logger.debug("Loading object %d at offset %d" % (obj_num, field_2))
+            try:
+                object = PDFParser(PDFProcessor()).parse_object(
+                    self.binary_data, field_2
+                )
+                error = "Object %d not found at offset %d" % (obj_num, field_2)
+            except Exception as parse_error:
+                object = None
+                error = "Cannot parse object %d at offset %d: %s" % (
+                    obj_num, field_2, parse_error
+                )
+
+            if object is None or object.obj_num != obj_num:
+                if self.repaired:
+                    raise InvalidXref(error)
+
+                _logger.info(error)
+                self.repair()
+                return self.load(obj_num)
+
+            self.objects[obj_num] = object
+        elif entry_type == 2:
+            object_stream = self.load(field_2)
+            if object_stream is None:
+                return None
+
+            _logger.debug("Decoding object stream %d" % field_2)
+            try:
+                objects = decode_objstm(
+                    object_stream.decode_stream(), int(object_stream[b"First"])
+                )
+            except Exception as error:
+                raise InvalidXref(
+                    "Cannot decode object stream %d: %s" % (field_2, error)
+                )
+
+            # Only keep the objects for which this object stream holds the
+            # current version.
+            for index, object in enumerate(objects):
+                entry = self.references.get(object.obj_num)
+                if entry == (2, field_2, index):
+                    self.objects.setdefault(object.obj_num, object)
+
+        return self.objects.get(obj_num)
+
+    def _resolve_object(self, obj_num: int) -> PDFObject:
+        """Get the object used by `get` to resolve a reference.
+
+        Objects are loaded on demand, `get` may therefore raise an InvalidXref
+        if a cross-reference does not point to its object.
+        """
+        return self.load(obj_num)
@@ -6,23 +6,375 @@ __maintainer__ = "Frédéric BISSON"
 __email__ = "zigazou@protonmail.com"
 
 from ..token.TokenStack import TokenStack
+from ..token.PDFName import PDFName
 from ..item.PDFReference import PDFReference
 from ..item.PDFList import PDFList
 from ..item.PDFDictionary import PDFDictionary
 from ..item.PDFObject import PDFObject
 from ..item.PDFItem import PDFItem
+from ..item.deep_find import deep_find
+
+from .query import compile_query, to_name
+
+# Maximum number of paths resolved by `get` kept in cache.
+MAX_CACHED_PATHS = 65536
 
 
 class PDF(TokenStack):
     """A PDF document
 
     A PDF document which can be read or written.
+
+    Objects removed with `remove_object` leave a tombstone (`None`) in the
+    stack instead of shifting every following item. Tombstones are removed
+    by `compact`, which is called before any access by index.
+
+    The items are indexed by class, the objects by `/Type`, by `/Subtype` and
+    whether they have a stream. The `find_by_*` methods use these indexes
+    instead of scanning the whole stack. The indexes are built on the first
+    query and follow the pushes. Changing the `/Type`, `/Subtype` or stream
+    of an object already in the stack requires a call to `refresh`.
+
+    The references between objects are indexed the same way, in both
+    directions. Pushed and removed objects update this index instead of
+    dropping it.
     """
 
     def __init__(self):
         super().__init__()
         self.objects = {}
 
+        # Index in the stack of each object, it may be outdated after an
+        # insert or a pop at an index and is then rebuilt.
+        self.positions = {}
+        self.tombstones = 0
+
+        # Secondary indexes, built on demand.
+        self.indexed = False
+        self.class_index = {}
+        self.type_index = {}
+        self.subtype_index = {}
+        self.stream_index = []
+
+        # References indexes, built on demand. `reference_paths` gives the
+        # references found in each object (by id), `reverse_references`
+        # counts the (obj_num, path) pointing to each object number.
+        self.reference_paths = None
+        self.reverse_references = None
+
+        # Results of `get` by (obj_num, path), and the keys of the results
+        # depending on each object number.
+        self.path_cache = {}
+        self.path_dependencies = {}
+
+        # Role of each object number, set by `classify_objects`.
+        self.roles = {}
+
+    def refresh(self):
+        """Drop the indexes, they will be rebuilt on the next query.
+
+        It must be called after changing the `/Type`, `/Subtype`, stream or
+        references of objects in the stack. The roles of the objects are
+        forgotten too.
+        """
+        self._drop_indexes()
+        self.reference_paths = None
+        self.reverse_references = None
+        self.path_cache = {}
+        self.path_dependencies = {}
+        self.roles = {}
+
+    def _drop_indexes(self):
+        if not self.indexed:
+            return
+
+        self.indexed = False
+        self.class_index = {}
+        self.type_index = {}
+        self.subtype_index = {}
+        self.stream_index = []
+
+    def _index_item(self, item: PDFItem):
+        self.class_index.setdefault(type(item), []).append(item)
+
+        if type(item) != PDFObject:
+            return
+
+        if item.has_stream():
+            self.stream_index.append(item)
+
+        value = item.value
+        if type(value) != PDFDictionary:
+            return
+
+        if b"Type" in value and type(value[b"Type"]) == PDFName:
+            self.type_index.setdefault(value[b"Type"], []).append(item)
+
+        if b"Subtype" in value and type(value[b"Subtype"]) == PDFName:
+            self.subtype_index.setdefault(value[b"Subtype"], []).append(item)
+
+    def _build_indexes(self):
+        if self.indexed:
+            return
+
+        for item in self.stack:
+            if item is not None:
+                self._index_item(item)
+
+        self.indexed = True
+
+    def find_by_class(self, item_class: type) -> list:
+        """Find the items of a class.
+
+        :param item_class: The class of the items, subclasses are not included
+        :type item_class: type
+        :return: The items, in the stack order
+        :rtype: list
+        """
+        self._build_indexes()
+        return list(self.class_index.get(item_class, []))
+
+    def find_by_type(self, type_name: bytes, subtype: bytes = None) -> list:
+        """Find the objects having a `/Type`, and optionally a `/Subtype`.
+
+        :param type_name: The value of `/Type`, for example `b"Page"`
+        :type type_name: bytes or PDFName
+        :param subtype: The value of `/Subtype`, any subtype if None
+        :type subtype: bytes or PDFName or None
+        :return: The objects, in the stack order
+        :rtype: list
+        """
+        self._build_indexes()
+        return [
+            object for object in self.type_index.get(type_name, [])
+            if b"Type" in object and object[b"Type"] == type_name and (
+                subtype == None or
+                (b"Subtype" in object and object[b"Subtype"] == subtype)
+            )
+        ]
+
+    def find_by_subtype(self, subtype: bytes) -> list:
+        """Find the objects having a `/Subtype`, whatever their `/Type`.
+
+        :param subtype: The value of `/Subtype`, for example `b"Image"`
+        :type subtype: bytes or PDFName
+        :return: The objects, in the stack order
+        :rtype: list
+        """
+        self._build_indexes()
+        return [
+            object for object in self.subtype_index.get(subtype, [])
+            if b"Subtype" in object and object[b"Subtype"] == subtype
+        ]
+
+    def find_with_stream(self) -> list:
+        """Find the objects having a non-empty stream.
+
+        :return: The objects, in the stack order
+        :rtype: list
+        """
+        self._build_indexes()
+        return [object for object in self.stream_index if object.has_stream()]
+
+    def select(
+        self,
+        type=None,
+        subtype=None,
+        has: list = None,
+        stream: bool = None,
+        where: callable = None,
+        item_class=PDFObject
+    ) -> list:
+        """Select the items satisfying every given criteria.
+
+        For example `pdf.select(type="Page", has=["Contents"])` gives every
+        page having a content.
+
+        The indexes are used to get the candidates if they exist, otherwise
+        the stack is scanned once.
+
+        :param type: The value of `/Type`, any if None
+        :type type: str or bytes or PDFName or None
+        :param subtype: The value of `/Subtype`, any if None
+        :type subtype: str or bytes or PDFName or None
+        :param has: Keys the dictionary must contain
+        :type has: list of str or bytes or PDFName or None
+        :param stream: Whether the object must have a non-empty stream or not,
+            any if None
+        :type stream: bool or None
+        :param where: A predicate taking the item, for anything else
+        :type where: function or None
+        :param item_class: The class of the items, subclasses are not included
+        :type item_class: type
+        :return: The items, in the stack order
+        :rtype: list
+        :raise TypeError: If where is not a function or if a criterion does
+            not apply to the items of `item_class`
+        """
+        select = compile_query(item_class, type, subtype, has, stream, where)
+
+        if not self.indexed:
+            return [item for item in self.stack if select(item)]
+
+        if item_class != PDFObject:
+            candidates = self.class_index.get(item_class, [])
+        elif type is not None:
+            candidates = self.type_index.get(to_name(type), [])
+        elif subtype is not None:
+            candidates = self.subtype_index.get(to_name(subtype), [])
+        elif stream:
+            candidates = self.stream_index
+        else:
+            candidates = self.class_index.get(item_class, [])
+
+        return [item for item in candidates if select(item)]
+
+    def compact(self):
+        """Remove the tombstones left by `remove_object` from the stack.
+
+        The stack is modified in place so that references to it remain valid.
+        """
+        if self.tombstones:
+            self.stack[:] = [item for item in self.stack if item is not None]
+            self.tombstones = 0
+            self._index_positions()
+
+    def _index_positions(self):
+        self.positions = {
+            item.obj_num: index
+            for index, item in enumerate(self.stack)
+            if type(item) == PDFObject
+        }
+
+    def _build_references(self):
+        if self.reference_paths is not None:
+            return
+
+        self.reference_paths = {}
+        self.reverse_references = {}
+        for item in self.stack:
+            self._add_references(item)
+
+    def _add_references(self, item: PDFItem):
+        if self.reference_paths is None or type(item) != PDFObject:
+            return
+
+        def any_reference(_, item): return type(item) == PDFReference
+
+        references = [
+            (tuple(path), reference.obj_num)
+            for path, reference in deep_find(item, any_reference)
+        ]
+
+        self.reference_paths[id(item)] = references
+
+        for path, obj_num in references:
+            referrers = self.reverse_references.setdefault(obj_num, {})
+            referrer = (item.obj_num, path)
+            referrers[referrer] = referrers.get(referrer, 0) + 1
+
+    def _remove_references(self, item: PDFItem):
+        if self.reference_paths is None or type(item) != PDFObject:
+            return
+
+        for path, obj_num in self.reference_paths.pop(id(item), []):
+            referrers = self.reverse_references[obj_num]
+            referrer = (item.obj_num, path)
+            referrers[referrer] -= 1
+
+            if referrers[referrer] == 0:
+                del(referrers[referrer])
+                if not referrers:
+                    del(self.reverse_references[obj_num])
+
+    def _forget(self, items: list):
+        """Update the indexes after items have been removed from the stack."""
+        self._drop_indexes()
+
+        if self.path_cache:
+            for item in items:
+                if type(item) == PDFObject:
+                    self._invalidate_paths(item.obj_num)
+
+        if self.reference_paths is not None:
+            for item in items:
+                self._remove_references(item)
+
+    def find_references(self, object: PDFObject) -> list:
+        """Find the references contained in an object of the stack.
+
+        :param object: The object
+        :type object: PDFObject
+        :return: A list of tuples (path, obj_num), the path being a tuple as
+            given by `deep_find`
+        :rtype: list
+        """
+        assert type(object) == PDFObject
+
+        self._build_references()
+        return list(self.reference_paths.get(id(object), []))
+
+    def find_referrers(self, obj_num: int) -> set:
+        """Find the objects referencing an object.
+
+        :param obj_num: The object number
+        :type obj_num: int or PDFReference or PDFObject
+        :return: A set of tuples (obj_num, path) where obj_num is the number
+            of the referencing object and path the path of the reference in it,
+            as given by `deep_find`
+        :rtype: set
+        """
+        if type(obj_num) in [PDFObject, PDFReference]:
+            obj_num = obj_num.obj_num
+
+        self._build_references()
+        return set(self.reverse_references.get(obj_num, {}))
+
+    def position(self, obj_num: int) -> int:
+        """Get the index of an object in the stack.
+
+        :param obj_num: The object number
+        :type obj_num: int
+        :return: The index in the stack or None if the object is not in it
+        :rtype: int or None
+        :raise KeyError: If there is no such object
+        """
+        object = self.objects[obj_num]
+
+        index = self.positions.get(obj_num)
+        if index is None or index >= len(self.stack) or \
+           self.stack[index] is not object:
+            self._index_positions()
+            index = self.positions.get(obj_num)
+
+        return index
+
+    def remove_object(self, obj_num: int) -> PDFObject:
+        """Remove an object from the PDF.
+
+        The object is replaced by a tombstone in the stack, the removal costs
+        O(1) instead of shifting every item following it.
+
+        :param obj_num: The object number
+        :type obj_num: int
+        :return: The removed object or None if there is no such object
+        :rtype: PDFObject or None
+        """
+        if obj_num not in self.objects:
+            return None
+
+        index = self.position(obj_num)
+        object = self.objects.pop(obj_num)
+        self.positions.pop(obj_num, None)
+        self._invalidate_paths(obj_num)
+
+        if index is not None:
+            self.stack[index] = None
+            self.tombstones += 1
+            self._forget([object])
+
+        return object
+
     def insert(self, index: int, item: PDFItem):
         """Insert a PDFItem at specified index.
 
@@ -34,10 +386,14 @@ class PDF(TokenStack):
         :type index: int
         :raise TypeError: If `item` is not a PDFItem or any subclass of PDFItem
         """
+        self.compact()
         super().insert(index, item)
+        self._drop_indexes()
+        self._add_references(item)
 
         if type(item) == PDFObject:
             self.objects[item.obj_num] = item
+            self._invalidate_paths(item.obj_num)
 
     def push(self, item: PDFItem):
         """Push a PDFItem.
@@ -53,6 +409,15 @@ class PDF(TokenStack):
 
         if type(item) == PDFObject:
             self.objects[item.obj_num] = item
+            self.positions[item.obj_num] = len(self.stack) - 1
+
+            if self.path_cache:
+                self._invalidate_paths(item.obj_num)
+
+        if self.indexed:
+            self._index_item(item)
+
+        self._add_references(item)
 
     def pop(self, index=-1) -> PDFItem:
         """Pop the last pushed item.
@@ -63,15 +428,112 @@ class PDF(TokenStack):
         :rtype: PDFItem or any subclass of PDFItem
         :raise IndexError: If there is no more PDFItem to pop
         """
+        if index == -1:
+            # Tombstones on top of the stack are simply dropped.
+            while self.stack and self.stack[-1] is None:
+                self.stack.pop()
+                self.tombstones -= 1
+        else:
+            self.compact()
+
         item = super().pop(index)
+        self._forget([item])
 
         # Remove the item from the objects
         if isinstance(item, PDFObject) and item.obj_num in self.objects:
             del(self.objects[item.obj_num])
+            self.positions.pop(item.obj_num, None)
 
         return item
 
-    def get(self, obj_num: int, path=[]) -> PDFItem:
+    def pop_from(self, index: int) -> list:
+        """Pop every item from the specified index to the top of the stack.
+
+        The index is an index in `stack`, tombstones included. Tombstones are
+        not part of the popped items.
+
+        :param index: The index of the first item to pop
+        :type index: int
+        :return: The popped items, in the order they were pushed
+        :rtype: list
+        """
+        items = super().pop_from(index)
+        if not items:
+            return items
+
+        self._forget(items)
+
+        for item in items:
+            if type(item) == PDFObject and item.obj_num in self.objects:
+                del(self.objects[item.obj_num])
+                self.positions.pop(item.obj_num, None)
+
+        if self.tombstones:
+            live_items = [item for item in items if item is not None]
+            self.tombstones -= len(items) - len(live_items)
+            items = live_items
+
+        return items
+
+    def remove_indices(self, indices) -> list:
+        """Remove the items at the specified indexes.
+
+        The stack is rebuilt once, whatever the number of items removed. The
+        indexes are those given by `find`, without tombstones.
+
+        :param indices: The indexes of the items to remove
+        :type indices: iterable of int
+        :return: The removed items, in the stack order
+        :rtype: list
+        :raise IndexError: If an index is outside of the stack
+        """
+        self.compact()
+        removed = super().remove_indices(indices)
+
+        if removed:
+            for item in removed:
+                if type(item) == PDFObject and item.obj_num in self.objects:
+                    del(self.objects[item.obj_num])
+
+            self._index_positions()
+            self._forget(removed)
+
+        return removed
+
+    def stack_size(self) -> int:
+        """Returns the stack size of the PDF, tombstones excluded.
+
+        :return: Stack size of the PDF
+        :rtype: int
+        """
+        return len(self.stack) - self.tombstones
+
+    def stack_at(self, index: int) -> PDFItem:
+        """Get the element on the stack at the specified index.
+
+        :param index: The index
+        :type index: int
+        """
+        self.compact()
+        return super().stack_at(index)
+
+    def find(self, select: callable, start: int = 0):
+        """Find an item in the stack according to a predicate.
+
+        See `TokenStack.find`, tombstones are removed before searching.
+        """
+        self.compact()
+        return super().find(select, start)
+
+    def _resolve_object(self, obj_num: int) -> PDFObject:
+        """Get the object used by `get` to resolve a reference."""
+        return self.objects.get(obj_num)
+
+    def _invalidate_paths(self, obj_num: int):
+        for key in self.path_dependencies.pop(obj_num, ()):
+            self.path_cache.pop(key, None)
+
+    def get(self, obj_num: int, path: list = None) -> PDFItem:
         """Given an object given a starting object number and a path.
 
         If any part of the path does not point to a valid PDFItem, it returns
@@ -85,17 +547,20 @@ class PDF(TokenStack):
         Any value which would be a `PDFReference` will automatically be
         transformed into the object pointed at.
 
+        The path is not modified. Results are cached until an object involved
+        in the resolution is pushed or removed, or `refresh` is called.
+
         :param obj_num: The object number.
         :type obj_num: int or PDFReference or PDFObject or anything convertible
             to int
         :param path: A path described by a sequence of subpath.
-        :type path: list
+        :type path: list or tuple
         :return: The specified object (subclass of PDFItem) or None if the path
             is not valid.
         :rtype: PDFItem or any subclass of PDFItem or None
 
         """
-        assert type(path) == list
+        path = () if path is None else tuple(path)
 
         # Normalize the object number.
         if type(obj_num) in [PDFObject, PDFReference]:
@@ -103,31 +568,60 @@ class PDF(TokenStack):
         else:
             obj_num = int(obj_num)
 
-        # Check if the object is known.
-        if obj_num not in self.objects:
-            return None
+        key = (obj_num, path)
+        if key in self.path_cache:
+            return self.path_cache[key]
 
-        object = self.objects[obj_num]
+        value = None
+        index = 0
+        involved = set()
+        visited = set()
+        while (obj_num, index) not in visited:
+            visited.add((obj_num, index))
+            involved.add(obj_num)
 
-        # No more path to follow, this is the final destination.
-        if not path:
-            return object
-
-        # Consume as many path elements as possible inside the same object.
-        value = object.value
-        while path and value:
-            if type(value) == PDFDictionary:
-                value = value[path[0]] if path[0] in value else None
-            elif type(value) == PDFList:
-                value = value[path[0]] if path[0] in range(len(value)) else None
-            elif type(value) == PDFReference:
+            # Check if the object is known.
+            object = self._resolve_object(obj_num)
+            if object is None:
+                value = None
                 break
 
-            path.pop(0)
+            # No more path to follow, this is the final destination.
+            if index == len(path):
+                value = object
+                break
 
-        if type(value) == PDFReference:
-            return self.get(value, path)
-        elif path:
-            return None
+            # Consume as many path elements as possible inside the same object.
+            value = object.value
+            while index < len(path) and value:
+                if type(value) == PDFDictionary:
+                    value = value[path[index]] if path[index] in value else None
+                elif type(value) == PDFList:
+                    value = (
+                        value[path[index]]
+                        if path[index] in range(len(value)) else None
+                    )
+                elif type(value) == PDFReference:
+                    break
+
+                index += 1
+
+            if type(value) == PDFReference:
+                obj_num = value.obj_num
+            else:
+                if index < len(path):
+                    value = None
+                break
         else:
-            return value
+            # The references loop without consuming the path.
+            value = None
+
+        if len(self.path_cache) == MAX_CACHED_PATHS:
+            self.path_cache.clear()
+            self.path_dependencies.clear()
+
+        self.path_cache[key] = value
+        for involved_obj_num in involved:
+            self.path_dependencies.setdefault(involved_obj_num, set()).add(key)
+
+        return value
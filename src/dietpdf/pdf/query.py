@@ -0,0 +1,121 @@
+__author__ = "Frédéric BISSON"
+__copyright__ = "Copyright 2022, Frédéric BISSON"
+__credits__ = ["Frédéric BISSON"]
+__license__ = "mit"
+__maintainer__ = "Frédéric BISSON"
+__email__ = "zigazou@protonmail.com"
+
+from ..token.PDFName import PDFName
+from ..item.PDFDictionary import PDFDictionary
+from ..item.PDFObject import PDFObject
+from ..item.PDFTrailer import PDFTrailer
+
+_KEY_TYPE = PDFName(b"Type")
+_KEY_SUBTYPE = PDFName(b"Subtype")
+
+# How to get the dictionary of the items of each class which may have one.
+_DICTIONARY_GETTERS = {
+    PDFObject: lambda item: item.value,
+    PDFTrailer: lambda item: item.dictionary,
+    PDFDictionary: lambda item: item,
+}
+
+
+def to_name(name) -> PDFName:
+    """Convert a name given as a string, bytes or PDFName to a PDFName.
+
+    :param name: The name
+    :type name: str or bytes or PDFName
+    :return: The name
+    :rtype: PDFName
+    """
+    if type(name) == PDFName:
+        return name
+    elif type(name) == str:
+        return PDFName(name.encode())
+    else:
+        return PDFName(name)
+
+
+def compile_query(
+    item_class: type,
+    type_name=None,
+    subtype=None,
+    has: list = None,
+    stream: bool = None,
+    where: callable = None
+) -> callable:
+    """Compile the criteria of a query into a predicate.
+
+    Names are converted to PDFName once, when the query is compiled, and the
+    predicate only checks the criteria which have been given.
+
+    The dictionary criteria (`type_name`, `subtype` and `has`) apply to the
+    dictionary of a PDFObject or a PDFTrailer, or to a PDFDictionary. The
+    `stream` criterion only applies to PDFObject.
+
+    :param item_class: The class of the items, subclasses are not included
+    :type item_class: type
+    :param type_name: The value of `/Type`, any if None
+    :type type_name: str or bytes or PDFName or None
+    :param subtype: The value of `/Subtype`, any if None
+    :type subtype: str or bytes or PDFName or None
+    :param has: Keys the dictionary must contain
+    :type has: list of str or bytes or PDFName or None
+    :param stream: Whether the object must have a non-empty stream or not,
+        any if None
+    :type stream: bool or None
+    :param where: A predicate taking the item, for anything else
+    :type where: function or None
+    :return: A predicate taking an item and returning True if the item
+        satisfies every criteria
+    :rtype: function
+    :raise TypeError: If where is not a function or if a criterion does not
+        apply to the items of `item_class`
+    """
+    if where is not None and not callable(where):
+        raise TypeError("where must be a function which returns a boolean")
+
+    if stream is not None and item_class != PDFObject:
+        raise TypeError("only PDFObject may have a stream")
+
+    # Keys and values the dictionary must hold.
+    values = []
+    if type_name is not None:
+        values.append((_KEY_TYPE, to_name(type_name)))
+
+    if subtype is not None:
+        values.append((_KEY_SUBTYPE, to_name(subtype)))
+
+    keys = [to_name(key) for key in has or []]
+
+    needs_dictionary = bool(values or keys)
+    if needs_dictionary and item_class not in _DICTIONARY_GETTERS:
+        raise TypeError("%s has no dictionary" % (item_class.__name__,))
+
+    get_dictionary = _DICTIONARY_GETTERS.get(item_class)
+
+    def select(item) -> bool:
+        if type(item) != item_class:
+            return False
+
+        if needs_dictionary:
+            dictionary = get_dictionary(item)
+            if type(dictionary) != PDFDictionary:
+                return False
+
+            items = dictionary.items
+            for key, value in values:
+                if key not in items or items[key] != value:
+                    return False
+
+            for key in keys:
+                if key not in items:
+                    return False
+
+        if stream is not None and item.has_stream() != stream:
+            return False
+
+        return where is None or bool(where(item))
+
+    return select
@@ -54,6 +54,10 @@ class PDFProcessor(TokenProcessor):
     def __init__(self):
         self.tokens = PDF()
 
+        # Indexes in the stack of the list and dictionary opening markers
+        # which have not been closed yet.
+        self.marks = []
+
     def _generate_reference(self):
         gen_num = int(self.tokens.pop().value)
         obj_num = int(self.tokens.pop().value)
@@ -64,30 +68,50 @@ class PDFProcessor(TokenProcessor):
         obj_num = int(self.tokens.pop().value)
         self.tokens.push(PDFObjectID(obj_num, 0))
 
-    def _generate_list(self):
-        items = []
-        while self.tokens.stack_size() > 0:
-            current = self.tokens.pop()
+    def _open_marker(self, marker_type: type) -> int:
+        """Find the index of the last opening marker of the given type.
 
-            if isinstance(current, PDFListOpen):
-                items.reverse()
-                self.tokens.push(PDFList(items))
-                return
+        Markers opened after it are discarded, their items will be part of the
+        list or dictionary being closed.
+
+        :param marker_type: PDFListOpen or PDFDictOpen
+        :type marker_type: type
+        :return: Index of the marker in the stack or None if there is none
+        :rtype: int or None
+        """
+        stack = self.tokens.stack
+        while self.marks:
+            index = self.marks.pop()
+            if index < len(stack) and type(stack[index]) == marker_type:
+                return index
 
-            items.append(current)
+        return None
+
+    def _generate_list(self):
+        index = self._open_marker(PDFListOpen)
+        if index is None:
+            _logger.debug("Ignoring a list end without list start")
+            return
+
+        items = self.tokens.pop_from(index)
+        self.tokens.push(PDFList(items[1:]))
 
     def _generate_dict(self):
-        key_values = {}
+        index = self._open_marker(PDFDictOpen)
+        if index is None:
+            _logger.debug("Ignoring a dictionary end without dictionary start")
+            return
 
-        while self.tokens.stack_size() > 0:
-            value = self.tokens.pop()
+        items = self.tokens.pop_from(index)
 
-            if isinstance(value, PDFDictOpen):
-                self.tokens.push(PDFDictionary(key_values))
-                return
+        # Keys and values are paired from the end. The pairs are read
+        # backwards, when a key is repeated its first value is kept.
+        start = 1 + (len(items) - 1) % 2
+        key_values = dict(zip(
+            reversed(items[start::2]), reversed(items[start + 1::2])
+        ))
 
-            key = self.tokens.pop()
-            key_values[key] = value
+        self.tokens.push(PDFDictionary(key_values))
 
     def _generate_object(self):
         stream = self.tokens.pop()
@@ -110,69 +134,50 @@ class PDFProcessor(TokenProcessor):
         object_id = self.tokens.pop()
         object = PDFObject(object_id.obj_num, object_id.gen_num, value, stream)
 
-        if object.obj_num in self.tokens.objects:
-            # Remove objects in the stack with the same number.
-            def any_object_with_same_number(_, item):
-                return (
-                    type(item) == PDFObject and
-                    item.obj_num == object.obj_num
-                )
-
-            for index, _ in self.tokens.find(any_object_with_same_number):
-                self.tokens.pop(index)
-                break
+        # Remove the previous definition of the object.
+        self.tokens.remove_object(object.obj_num)
 
         self.tokens.push(object)
 
-    def _convert_startxref(self):
-        def any_startxref_command(_, item): return (
-            type(item) == PDFCommand and
-            item.command == b"startxref"
-        )
-
-        for offset, _ in self.tokens.find(any_startxref_command):
-            self.tokens.pop(offset)
-            self.tokens.insert(
-                offset,
-                PDFStartXref(self.tokens.pop(offset).value)
-            )
-
-    def _convert_xref(self):
-        def any_xref_command(_, item): return (
-            type(item) == PDFCommand and
-            item.command == b"xref"
-        )
-
-        for offset, _ in self.tokens.find(any_xref_command):
-            self.tokens.pop(offset)
-
-            xref = PDFXref()
-
-            while isinstance(self.tokens.stack_at(offset), PDFNumber):
-                base = self.tokens.pop(offset).value
-                count = self.tokens.pop(offset).value
-                subsection = PDFXrefSubSection(base, count)
+    def _convert_xref(self, stack: list, index: int) -> tuple:
+        """Convert the subsections following an `xref` command.
 
-                for _ in range(count):
-                    ref_offset = self.tokens.pop(offset).value
-                    ref_new = self.tokens.pop(offset).value
-                    ref_type = self.tokens.pop(offset).command.decode('ascii')
+        :param stack: The items of the stack
+        :type stack: list
+        :param index: Index of the first item following the `xref` command
+        :type index: int
+        :return: The PDFXref and the index of the first item following it
+        :rtype: tuple
+        """
+        xref = PDFXref()
 
-                    subsection.entries.append((ref_offset, ref_new, ref_type))
+        while index < len(stack) and isinstance(stack[index], PDFNumber):
+            base = stack[index].value
+            count = stack[index + 1].value
+            subsection = PDFXrefSubSection(base, count)
 
-                xref.subsections.append(subsection)
+            # Each entry is made of an offset, a generation number and a type.
+            start = index + 2
+            index = start + 3 * count
+            if index > len(stack):
+                raise IndexError("truncated xref subsection")
 
-            self.tokens.insert(offset, xref)
+            subsection.entries = [
+                (
+                    ref_offset.value,
+                    ref_new.value,
+                    ref_type.command.decode('ascii')
+                )
+                for ref_offset, ref_new, ref_type in zip(
+                    stack[start:index:3],
+                    stack[start + 1:index:3],
+                    stack[start + 2:index:3]
+                )
+            ]
 
-    def _convert_trailer(self):
-        def any_trailer_command(_, item): return (
-            type(item) == PDFCommand and
-            item.command == b"trailer"
-        )
+            xref.subsections.append(subsection)
 
-        for offset, _ in self.tokens.find(any_trailer_command):
-            self.tokens.pop(offset)
-            self.tokens.insert(offset, PDFTrailer(self.tokens.pop(offset)))
+        return (xref, index)
 
     def end_parsing(self):
         """Converts remaining items on the stack.
@@ -181,11 +186,39 @@ class PDFProcessor(TokenProcessor):
         follow a stack principle. They must therefore be recognized when all the
         parsing has been done.
 
+        They are recognized in one pass over the stack, each of them being
+        replaced by a single item.
+
         Without calling this method, the processor state is inconsistent.
         """
-        self._convert_startxref()
-        self._convert_xref()
-        self._convert_trailer()
+        self.tokens.compact()
+        self.marks = []
+
+        stack = self.tokens.stack
+        items = []
+        index = 0
+        while index < len(stack):
+            item = stack[index]
+            index += 1
+
+            if type(item) != PDFCommand:
+                items.append(item)
+            elif item.command == b"startxref":
+                items.append(PDFStartXref(stack[index].value))
+                index += 1
+            elif item.command == b"xref":
+                xref, index = self._convert_xref(stack, index)
+                items.append(xref)
+            elif item.command == b"trailer":
+                items.append(PDFTrailer(stack[index]))
+                index += 1
+            else:
+                items.append(item)
+
+        # The stack is modified in place, the positions of the objects are
+        # updated by the PDF when needed.
+        stack[:] = items
+        self.tokens.refresh()
 
     def push(self, item):
         """Push an item onto the processor's stack.
@@ -202,6 +235,9 @@ class PDFProcessor(TokenProcessor):
             self._generate_object_id()
         elif type(item) == PDFCommand and item.command == b"endobj":
             self._generate_object()
+        elif type(item) == PDFListOpen or type(item) == PDFDictOpen:
+            self.marks.append(len(self.tokens.stack))
+            self.tokens.push(item)
         elif type(item) == PDFListClose:
             self._generate_list()
         elif type(item) == PDFDictClose:
@@ -220,21 +256,16 @@ class PDFProcessor(TokenProcessor):
         :rtype: bytes
         """
 
+        objects = self.tokens.find_by_class(PDFObject)
+
         # Detect linearization
-        def any_linearized(_, item):
-            return (
-                type(item) == PDFObject and
-                type(item.value) == PDFDictionary and
-                b"Linearized" in item
-            )
+        def any_linearized(item):
+            return type(item.value) == PDFDictionary and b"Linearized" in item
 
-        linearized = self.tokens.find_first(any_linearized)
+        linearized = next(filter(any_linearized, objects), None)
 
         # Encode each object.
-        def any_object(_, item):
-            if type(item) != PDFObject:
-                return False
-
+        def any_object(item):
             if type(item.value) == PDFDictionary:
                 if b"Type" in item and item[b"Type"] == b"XRef":
                     return False
@@ -252,7 +283,7 @@ class PDFProcessor(TokenProcessor):
 
         # Write every object.
         xref_entries = {}
-        for _, item in self.tokens.find(any_object):
+        for item in filter(any_object, objects):
             item.item_offset = offset
             xref_entries[item.obj_num] = (1, offset, 0)
 
@@ -261,10 +292,7 @@ class PDFProcessor(TokenProcessor):
             output += item_encoded
 
         # Write every object stream.
-        def any_object_stream(_, item):
-            return type(item) == PDFObjectStream
-
-        for _, item in self.tokens.find(any_object_stream):
+        for item in self.tokens.find_by_class(PDFObjectStream):
             index = 0
             xref_entries[item.obj_num] = (1, offset, 0)
 
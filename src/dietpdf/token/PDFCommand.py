@@ -8,24 +8,59 @@ __email__ = "zigazou@protonmail.com"
 from .PDFToken import PDFToken
 
 
+# Maximum number of commands kept in the interning table.
+MAX_INTERNED_COMMANDS = 4096
+
+
 class PDFCommand(PDFToken):
     """A PDF command.
 
     Contrary to a PDF name (starting with a "/"), a PDF command may imply an
     interpretation upon its pushing on the processor stack.
+
+    PDFCommand instances are immutable and interned, like PDFName.
     """
 
-    def __init__(self, command: bytes):
-        """Create a `PDFCommand` object.
+    __slots__ = ("command",)
+
+    _interned = {}
+
+    def __new__(cls, command: bytes):
+        """Create a `PDFCommand` object or return the interned one.
 
         :param command: The command without any leading or trailing white space.
         ;type command: bytes
         """
-
         assert type(command) == bytes
         assert len(command) > 0
 
-        self.command = command
+        try:
+            return cls._interned[command]
+        except KeyError:
+            pass
+
+        instance = super().__new__(cls)
+        instance.command = command
+
+        if len(cls._interned) < MAX_INTERNED_COMMANDS:
+            cls._interned[command] = instance
+
+        return instance
+
+    def __reduce__(self):
+        return (PDFCommand, (self.command,))
+
+    @property
+    def item_offset(self):
+        """Interned commands are shared, they have no offset."""
+        return None
+
+    @item_offset.setter
+    def item_offset(self, _):
+        pass
+
+    def __hash__(self) -> int:
+        return hash(self.command)
 
     def __bool__(self):
         return self.command != None and len(self.command) > 0
@@ -46,7 +81,9 @@ class PDFCommand(PDFToken):
         :return: True or False or NotImplemented
         :type: bool
         """
-        if isinstance(other, PDFCommand):
+        if other is self:
+            return True
+        elif isinstance(other, PDFCommand):
             return self.command == other.command
         elif isinstance(other, bytes):
             return self.command == other
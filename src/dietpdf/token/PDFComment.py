@@ -14,6 +14,8 @@ class PDFComment(PDFToken):
     It starts with a "%" and ends with a newline (either `\\r\\n` or `\\n`)
     """
 
+    __slots__ = ("content",)
+
     def __init__(self, content: bytes):
         assert type(content) == bytes
 
@@ -15,6 +15,8 @@ class PDFDictOpen(PDFToken):
     `PDFDictionary`.
     """
 
+    __slots__ = ()
+
     def __eq__(self, other):
         """Equality operator for PDFDictOpen.
 
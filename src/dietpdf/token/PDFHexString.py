@@ -5,14 +5,15 @@ __license__ = "mit"
 __maintainer__ = "Frédéric BISSON"
 __email__ = "zigazou@protonmail.com"
 
-import re
-
 from .PDFToken import PDFToken
+from .string_codec import clean_hexstring
 
 
 class PDFHexString(PDFToken):
     """A PDF hexadecimal string (between < and >)"""
 
+    __slots__ = ("hexstring",)
+
     def __init__(self, hexstring: bytes):
         assert type(hexstring) == bytes
 
@@ -51,4 +52,4 @@ class PDFHexString(PDFToken):
         return self._pretty("HexString(%s)" % (self.hexstring.decode('ascii'),))
 
     def encode(self) -> bytes:
-        return b"<%s>" % re.sub(b"[^0-9A-Za-z]+", b"", self.hexstring)
+        return b"<%s>" % clean_hexstring(self.hexstring)
@@ -15,6 +15,8 @@ class PDFListClose(PDFToken):
     `PDFList`.
     """
 
+    __slots__ = ()
+
     def __eq__(self, other):
         """Equality operator for PDFListClose.
 
@@ -15,6 +15,8 @@ class PDFListOpen(PDFToken):
     `PDFList`.
     """
 
+    __slots__ = ()
+
     def __eq__(self, other):
         """Equality operator for PDFListOpen.
 
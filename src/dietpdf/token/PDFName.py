@@ -7,11 +7,24 @@ __email__ = "zigazou@protonmail.com"
 
 from .PDFToken import PDFToken
 
+# Maximum number of names kept in the interning table.
+MAX_INTERNED_NAMES = 65536
+
+
 class PDFName(PDFToken):
-    """A PDF name (starting with /)"""
+    """A PDF name (starting with /)
+
+    PDFName instances are immutable and interned: creating a PDFName with a
+    name already seen returns the same instance. Once `MAX_INTERNED_NAMES`
+    names have been interned, new names get their own instance.
+    """
+
+    __slots__ = ("name", "_hash")
 
-    def __init__(self, name):
-        """Create a new PDFName.
+    _interned = {}
+
+    def __new__(cls, name):
+        """Create a new PDFName or return the interned one.
 
         It sets the name of the PDFName to the name parameter.
 
@@ -29,13 +42,37 @@ class PDFName(PDFToken):
         assert type(name) in [PDFName, str, bytes]
 
         if type(name) == PDFName:
-            self.name = name.name
+            return name
         elif type(name) == str:
-            assert len(name) > 0
-            self.name = name.encode('ascii')
-        else:
-            assert len(name) > 0
-            self.name = name
+            name = name.encode('ascii')
+
+        try:
+            return cls._interned[name]
+        except KeyError:
+            pass
+
+        assert len(name) > 0
+
+        instance = super().__new__(cls)
+        instance.name = name
+        instance._hash = hash(name)
+
+        if len(cls._interned) < MAX_INTERNED_NAMES:
+            cls._interned[name] = instance
+
+        return instance
+
+    def __reduce__(self):
+        return (PDFName, (self.name,))
+
+    @property
+    def item_offset(self):
+        """Interned names are shared, they have no offset."""
+        return None
+
+    @item_offset.setter
+    def item_offset(self, _):
+        pass
 
     def __hash__(self) -> int:
         """Hash of a PDFName
@@ -45,7 +82,7 @@ class PDFName(PDFToken):
         :return: The hash
         :rtype: int
         """
-        return hash(self.name)
+        return self._hash
 
     def __eq__(self, other):
         """Equality operator for PDFName.
@@ -63,7 +100,9 @@ class PDFName(PDFToken):
         :return: True or False or NotImplemented
         :type: bool
         """
-        if type(other) == PDFName:
+        if other is self:
+            return True
+        elif type(other) == PDFName:
             return self.name == other.name
         elif type(other) == bytes:
             return self.name == other
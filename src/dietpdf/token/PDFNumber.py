@@ -5,24 +5,53 @@ __license__ = "mit"
 __maintainer__ = "Frédéric BISSON"
 __email__ = "zigazou@protonmail.com"
 
+import re
+
 from .PDFToken import PDFToken
 
+# Raw numbers which encode would write exactly the same way.
+_canonical_integer = re.compile(rb"0|-?[1-9][0-9]*")
+_canonical_decimal = re.compile(rb"-?(?:[1-9][0-9]*)?\.[0-9]*[1-9]")
+
 
 class PDFNumber(PDFToken):
-    """A PDF number (either an integer or a float)"""
+    """A PDF number (either an integer or a float)
+
+    A number read from a PDF keeps its raw bytes. They are only converted to
+    an int or a float when the value is needed and they are written back
+    unchanged when rounding would not shorten them.
+    """
+
+    __slots__ = ("raw", "_value", "precision")
 
     def __init__(self, value, precision=4):
         assert type(precision) == int
 
         if type(value) == float or type(value) == int:
-            self.value = value
-        elif ord('.') in value:
-            self.value = float(value)
+            self.raw = None
+            self._value = value
         else:
-            self.value = int(value)
+            self.raw = bytes(value)
+            self._value = None
 
         self.precision = precision
 
+    @property
+    def value(self):
+        """The number as an int or a float, converted on first access."""
+        if self._value is None:
+            if ord('.') in self.raw:
+                self._value = float(self.raw)
+            else:
+                self._value = int(self.raw)
+
+        return self._value
+
+    @value.setter
+    def value(self, value):
+        self.raw = None
+        self._value = value
+
     def __eq__(self, other):
         """Equality operator for PDFNumber.
 
@@ -67,30 +96,66 @@ class PDFNumber(PDFToken):
         return self._pretty("Number(%s)" % (self.value,))
 
     def encode(self) -> bytes:
-        if type(self.value) == int:
-            human = str(self.value)
+        if self.raw is not None and raw_is_encoded(self.raw, self.precision):
+            return self.raw
+
+        return encode_value(self.value, self.precision)
+
+
+def raw_is_encoded(raw: bytes, precision: int) -> bool:
+    """Tell if the raw bytes of a number are already encoded.
+
+    :param raw: The number as read from a PDF
+    :type raw: bytes
+    :param precision: The precision used to encode the number
+    :type precision: int
+    :return: True if `encode_value` would give the same bytes
+    :rtype: bool
+    """
+    if ord('.') not in raw:
+        return _canonical_integer.fullmatch(raw) is not None
+
+    return (
+        _canonical_decimal.fullmatch(raw) is not None and
+        len(raw) - raw.index(b".") - 1 <= precision
+    )
+
+
+def encode_value(value, precision: int) -> bytes:
+    """Encode a number, rounding floats to the given precision.
+
+    :param value: The number
+    :type value: int or float
+    :param precision: The minimum number of decimals kept. More decimals are
+        kept for numbers which would otherwise be rounded to zero.
+    :type precision: int
+    :return: The shortest encoding of the rounded number
+    :rtype: bytes
+    """
+    if type(value) == int:
+        human = str(value)
+    else:
+        # Smart float rounding.
+        if value != 0.0:
+            for decimals in range(precision, 8):
+                float_rounded = round(value, decimals)
+                if float_rounded != 0.0:
+                    break
+
+            human = "{:.9f}".format(float_rounded).rstrip("0")
+            if human[-1] == ".":
+                human = human[:-1]
         else:
-            # Smart float rounding.
-            if self.value != 0.0:
-                for precision in range(self.precision, 8):
-                    float_rounded = round(self.value, precision)
-                    if float_rounded != 0.0:
-                        break
-
-                human = "{:.9f}".format(float_rounded).rstrip("0")
-                if human[-1] == ".":
-                    human = human[:-1]
-            else:
-                human = "0"
+            human = "0"
 
-        # Remove trailing .0
-        if len(human) > 2 and human[-2:] == ".0":
-            human = human[:-2]
+    # Remove trailing .0
+    if len(human) > 2 and human[-2:] == ".0":
+        human = human[:-2]
 
-        # Remove leading zero.
-        if len(human) > 1 and human[0] == "0":
-            human = human[1:]
-        elif len(human) > 3 and human[0:3] == "-0.":
-            human = "-" + human[2:]
+    # Remove leading zero.
+    if len(human) > 1 and human[0] == "0":
+        human = human[1:]
+    elif len(human) > 3 and human[0:3] == "-0.":
+        human = "-" + human[2:]
 
-        return human.encode('ascii')
+    return human.encode('ascii')
@@ -11,6 +11,8 @@ from .PDFToken import PDFToken
 class PDFRaw(PDFToken):
     """Raw bytes in a PDF file"""
 
+    __slots__ = ("raw",)
+
     def __init__(self, raw: bytes):
         assert type(raw) == bytes
 
@@ -12,8 +12,25 @@ class PDFToken:
     """Base class for any PDF item that might be encountered in a PDF file.
     
     This class should not be used directly, it should be derived first.
+
+    Tokens are created by the million when parsing a PDF file, every class
+    deriving from PDFToken declares its attributes in `__slots__` so that its
+    instances do not carry a `__dict__`.
     """
-    item_offset = None
+
+    __slots__ = ("_item_offset",)
+
+    @property
+    def item_offset(self):
+        """Offset of the token in the generated PDF, None if it is unknown."""
+        try:
+            return self._item_offset
+        except AttributeError:
+            return None
+
+    @item_offset.setter
+    def item_offset(self, offset):
+        self._item_offset = offset
 
     def __eq__(self, other):
         return NotImplemented
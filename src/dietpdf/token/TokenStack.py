@@ -62,6 +62,64 @@ class TokenStack:
 
         return item
 
+    def pop_from(self, index: int) -> list:
+        """Pop every item from the specified index to the top of the stack.
+
+        :param index: The index of the first item to pop
+        :type index: int
+        :return: The popped items, in the order they were pushed
+        :rtype: list
+        """
+        items = self.stack[index:]
+        del self.stack[index:]
+
+        return items
+
+    def remove_indices(self, indices) -> list:
+        """Remove the items at the specified indexes.
+
+        The stack is rebuilt once, whatever the number of items removed.
+
+        :param indices: The indexes of the items to remove
+        :type indices: iterable of int
+        :return: The removed items, in the stack order
+        :rtype: list
+        :raise IndexError: If an index is outside of the stack
+        """
+        indices = set(indices)
+        if not indices:
+            return []
+
+        if min(indices) < 0 or max(indices) >= len(self.stack):
+            raise IndexError("remove index out of range")
+
+        kept = []
+        removed = []
+        for index, item in enumerate(self.stack):
+            if index in indices:
+                removed.append(item)
+            else:
+                kept.append(item)
+
+        # The stack is modified in place so that references to it remain
+        # valid.
+        self.stack[:] = kept
+
+        return removed
+
+    def remove_where(self, select: callable) -> list:
+        """Remove the items satisfying a predicate.
+
+        See the `find` method for information about the predicate.
+
+        :param select: The predicate
+        :type select: function
+        :raise TypeError: If the predicate is not a function
+        :return: The removed items, in the stack order
+        :rtype: list
+        """
+        return self.remove_indices(index for index, _ in self.find(select))
+
     def stack_size(self) -> int:
         """Returns the stack size of the PDF
 
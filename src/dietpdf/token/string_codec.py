@@ -0,0 +1,156 @@
+__author__ = "Frédéric BISSON"
+__copyright__ = "Copyright 2022, Frédéric BISSON"
+__credits__ = ["Frédéric BISSON"]
+__license__ = "mit"
+__maintainer__ = "Frédéric BISSON"
+__email__ = "zigazou@protonmail.com"
+
+import re
+
+# The content of a literal string up to the next unescaped parenthesis.
+_string_content = re.compile(rb"(?:[^()\\]+|\\.)*", re.DOTALL)
+
+# An escape sequence: octal code, end of line or any other character. A
+# backslash at the very end of a string is ignored.
+_escape_sequence = re.compile(rb"\\([0-7]{1,3}|\r\n?|.|$)", re.DOTALL)
+
+# All supported escape character sequence and their equivalent value.
+_ESCAPE_CHARS = {
+    b"n": b"\n",
+    b"r": b"\r",
+    b"t": b"\t",
+    b"b": b"\b",
+    b"f": b"\f",
+    b"(": b"(",
+    b")": b")",
+    b"\\": b"\\",
+    # A backslash at the end of a line removes the end of line.
+    b"\n": b"",
+    b"\r": b"",
+    b"\r\n": b"",
+    b"": b"",
+}
+
+# Octal codes of 1, 2 or 3 digits. Overflowing codes are truncated to one
+# byte.
+_ESCAPE_CHARS.update({
+    octal % code: bytes([code & 0xff])
+    for code in range(0o1000)
+    for octal in [b"%o", b"%02o", b"%03o"]
+})
+
+# Anything other than digits and letters is removed from hexadecimal strings.
+_NOT_HEXADECIMAL = bytes(
+    char for char in range(256) if not chr(char).isascii() or
+    not chr(char).isalnum()
+)
+
+
+def find_string_end(binary_data, offset: int) -> int:
+    """Find the end of a literal string.
+
+    Instead of looking at each byte, the search jumps from one unescaped
+    parenthesis to the next one.
+
+    :param binary_data: The block of bytes containing the string
+    :type binary_data: bytes or bytearray or memoryview or mmap
+    :param offset: Offset of the opening parenthesis
+    :type offset: int
+    :return: The offset following the closing parenthesis or None if the
+        string is not terminated
+    :rtype: int
+    """
+    nested = 1
+    position = offset + 1
+    while nested != 0:
+        position = _string_content.match(binary_data, position).end()
+        char = binary_data[position:position + 1]
+
+        if char == b")":
+            nested -= 1
+        elif char == b"(":
+            nested += 1
+        else:
+            # End of data or backslash as the last byte.
+            return None
+
+        position += 1
+
+    return position
+
+
+def unescape(string: bytes) -> bytes:
+    """Unescape a PDF string.
+
+    The unescape function decodes all escape sequences from a PDF string.
+
+    The following sequences are recognized:
+
+      - \\#, \\##, \\###, where # denotes an octal digit (from 0 to 7)
+      - \\n = line feed (0x0a)
+      - \\r = carriage return (0x0d)
+      - \\t = tabulation (0x09)
+      - \\b = back (0x08)
+      - \\f = form feed (0x0c)
+      - \\( = left parentheses (()
+      - \\) = right parentheses ())
+      - \\\\ = backslash (\\)
+      - \\ at the end of a line, be it Unix LF or Windows CR+LF style end of
+        line, will remove the end of line from the unescaped string
+
+    A backslash followed by any other character is ignored.
+
+    :param string: The string to unescape
+    :type string: bytes
+    :return: The unescaped string
+    :rtype: bytes
+    """
+    assert type(string) == bytes
+
+    if b"\\" not in string:
+        return string
+
+    # Splitting gives the unescaped parts at even indices and the codes of the
+    # escape sequences at odd indices.
+    parts = _escape_sequence.split(string)
+    parts[1::2] = [_ESCAPE_CHARS.get(code, code) for code in parts[1::2]]
+
+    return b"".join(parts)
+
+
+def escape(string: bytes) -> bytes:
+    """Escape a byte string to be written as a literal string.
+
+    Backslashes, parentheses and carriage returns (which would be read as
+    line feeds) are escaped.
+
+    :param string: The string to escape
+    :type string: bytes
+    :return: The escaped string
+    :rtype: bytes
+    """
+    assert type(string) == bytes
+
+    # Each replacement is one pass done in C, which is faster than one pass
+    # calling back Python code for each special character.
+    return (
+        string
+        .replace(b"\\", b"\\\\")
+        .replace(b"(", b"\\(")
+        .replace(b")", b"\\)")
+        .replace(b"\r", b"\\r")
+    )
+
+
+def clean_hexstring(hexstring: bytes) -> bytes:
+    """Remove white spaces and any other unwanted byte from an hexadecimal
+    string.
+
+    :param hexstring: The hexadecimal string to clean
+    :type hexstring: bytes
+    :return: The hexadecimal string with only digits and letters
+    :rtype: bytes
+    """
+    assert type(hexstring) == bytes
+
+    return hexstring.translate(None, _NOT_HEXADECIMAL)
@@ -0,0 +1,96 @@
+__author__ = "Frédéric BISSON"
+__copyright__ = "Copyright 2022, Frédéric BISSON"
+__credits__ = ["Frédéric BISSON"]
+__license__ = "mit"
+__maintainer__ = "Frédéric BISSON"
+__email__ = "zigazou@protonmail.com"
+
+"""Compare the content stream lexer with the TokenParser on path heavy
+content streams, like those found in CAD drawings.
+
+Run from the `tests` directory:
+
+    python3 benchmark/benchmark_content_stream.py
+
+Both ways are checked to give the same output. The peak memory used by the
+tokens is measured with tracemalloc.
+"""
+
+import tracemalloc
+
+from random import seed, randrange
+from time import perf_counter
+
+from dietpdf.item.content_stream import (
+    minify_content_stream, _optimize_content_stream_tokens
+)
+from dietpdf.parser.ContentStreamLexer import ContentStreamLexer
+from dietpdf.parser.TokenParser import TokenParser
+from dietpdf.processor.TokenProcessor import TokenProcessor
+
+
+def create_path_stream(path_count: int) -> bytes:
+    seed(2022)
+
+    def coordinate(): return b"%d.%03d" % (randrange(1000), randrange(1000))
+
+    lines = [b"q 0.5 w 0 0 1 RG"]
+    for _ in range(path_count):
+        lines.append(b"%s %s m" % (coordinate(), coordinate()))
+        for _ in range(4):
+            lines.append(b"%s %s l" % (coordinate(), coordinate()))
+        lines.append(b"%s %s %s %s %s %s c S" % tuple(
+            coordinate() for _ in range(6)
+        ))
+    lines.append(b"Q")
+
+    return b"\n".join(lines)
+
+
+def duration(function: callable) -> tuple:
+    start = perf_counter()
+    result = function()
+    return (result, perf_counter() - start)
+
+
+def peak_memory(function: callable) -> int:
+    tracemalloc.start()
+    function()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return peak
+
+
+def parse_tokens(stream: bytes) -> TokenProcessor:
+    processor = TokenProcessor()
+    TokenParser(processor).parse(stream)
+    return processor
+
+
+if __name__ == "__main__":
+    for path_count in [1000, 5000, 10000]:
+        stream = create_path_stream(path_count)
+        print("%d paths, %d bytes" % (path_count, len(stream)))
+
+        expected, legacy_time = duration(
+            lambda: _optimize_content_stream_tokens(stream, True)
+        )
+
+        result, lexer_time = duration(
+            lambda: minify_content_stream(ContentStreamLexer(stream), True)
+        )
+
+        assert result == expected
+
+        # Memory used by the tokens.
+        legacy_peak = peak_memory(lambda: parse_tokens(stream))
+        lexer_peak = peak_memory(lambda: ContentStreamLexer(stream))
+
+        print("  TokenParser  %8.1f ms  %8.1f MB" % (
+            legacy_time * 1000, legacy_peak / 1e6
+        ))
+        print("  lexer        %8.1f ms  %8.1f MB  (x%.1f, x%.1f)" % (
+            lexer_time * 1000, lexer_peak / 1e6,
+            legacy_time / lexer_time, legacy_peak / lexer_peak
+        ))
@@ -0,0 +1,55 @@
+__author__ = "Frédéric BISSON"
+__copyright__ = "Copyright 2022, Frédéric BISSON"
+__credits__ = ["Frédéric BISSON"]
+__license__ = "mit"
+__maintainer__ = "Frédéric BISSON"
+__email__ = "zigazou@protonmail.com"
+
+"""Compare inline image scanning with and without a known length.
+
+Run from the `tests` directory:
+
+    python3 benchmark/benchmark_inline_image.py
+
+It tokenizes content streams made of many inline glyph bitmaps. With a
+standard color space, the data length is computed from the image dictionary.
+With an unknown color space, the data is scanned looking for the EI operator.
+"""
+
+from random import seed, randrange
+from timeit import timeit
+
+from dietpdf.parser.TokenParser import TokenParser
+from dietpdf.processor.TokenProcessor import TokenProcessor
+
+IMAGES = 5000
+REPEAT = 5
+
+
+def create_content_stream(color_space: bytes, size: int) -> bytes:
+    seed(2022)
+
+    images = []
+    for _ in range(IMAGES):
+        data = bytes([randrange(256) for _ in range(size * size)])
+        images.append(
+            b"q %d 0 0 %d 0 0 cm BI /W %d /H %d /BPC 8 /CS /%s ID %s EI Q" %
+            (size, size, size, size, color_space, data)
+        )
+
+    return b"\n".join(images)
+
+
+def tokenize(stream: bytes):
+    TokenParser(TokenProcessor()).parse(stream)
+
+
+if __name__ == "__main__":
+    for size in [4, 16, 64]:
+        for color_space in [b"G", b"CustomSpace"]:
+            stream = create_content_stream(color_space, size)
+            duration = timeit(lambda: tokenize(stream), number=REPEAT) / REPEAT
+
+            print("%3dx%-3d %-12s %8.2f ms" % (
+                size, size, color_space.decode("ascii"), duration * 1000
+            ))
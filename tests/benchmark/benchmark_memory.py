@@ -0,0 +1,171 @@
+__author__ = "Frédéric BISSON"
+__copyright__ = "Copyright 2022, Frédéric BISSON"
+__credits__ = ["Frédéric BISSON"]
+__license__ = "mit"
+__maintainer__ = "Frédéric BISSON"
+__email__ = "zigazou@protonmail.com"
+
+"""Compare the memory used by the tokens with and without `__slots__`.
+
+Run from the `tests` directory:
+
+    python3 benchmark/benchmark_memory.py
+
+Every token of a parsed PDF is copied twice: once as an instance of its own
+class, declaring its attributes in `__slots__`, and once as an instance of a
+class holding the same attributes in a `__dict__`, like the token classes
+before they used `__slots__`. Only the tokens themselves are measured, the
+values they point to (bytes, dicts, lists...) are shared by both copies.
+
+The PDF examples and a synthetic file with many small objects are measured.
+"""
+
+from glob import glob
+from random import seed, randrange
+from time import perf_counter
+import tracemalloc
+
+from dietpdf.parser.PDFParser import PDFParser
+from dietpdf.processor.PDFProcessor import PDFProcessor
+from dietpdf.token.PDFToken import PDFToken
+from dietpdf.item.PDFObject import PDFObject
+from dietpdf.item.PDFObjectStream import PDFObjectStream
+from dietpdf.item.PDFDictionary import PDFDictionary
+from dietpdf.item.PDFList import PDFList
+from dietpdf.item.PDFTrailer import PDFTrailer
+from dietpdf.info.decode_objstm import convert_objstm
+
+_dict_classes = {}
+
+
+def dict_class(slots_class: type) -> type:
+    """A class with a `__dict__` standing for a class with `__slots__`."""
+    if slots_class not in _dict_classes:
+        _dict_classes[slots_class] = type(slots_class.__name__, (), {})
+
+    return _dict_classes[slots_class]
+
+
+def slot_names(token_class: type) -> list:
+    return [
+        name
+        for cls in token_class.__mro__
+        for name in cls.__dict__.get("__slots__", ())
+    ]
+
+
+def all_tokens(items: list) -> list:
+    """Every distinct token held by the items, nested ones included."""
+    tokens = {}
+    to_visit = list(items)
+    while to_visit:
+        item = to_visit.pop()
+        if not isinstance(item, PDFToken) or id(item) in tokens:
+            continue
+
+        tokens[id(item)] = item
+
+        if type(item) == PDFObject:
+            to_visit += [item.value, item.stream]
+        elif type(item) == PDFObjectStream:
+            to_visit += item.objects
+        elif type(item) == PDFDictionary:
+            to_visit += item.items.keys()
+            to_visit += item.items.values()
+        elif type(item) == PDFList:
+            to_visit += item.items
+        elif type(item) == PDFTrailer:
+            to_visit.append(item.dictionary)
+
+    return list(tokens.values())
+
+
+def copy_tokens(tokens: list, with_slots: bool) -> int:
+    """Copy the tokens, return the number of bytes allocated by the copies."""
+    attributes = []
+    for token in tokens:
+        values = {}
+        for name in slot_names(type(token)):
+            try:
+                values[name] = getattr(token, name)
+            except AttributeError:
+                pass
+
+        if with_slots:
+            attributes.append((type(token), values))
+        else:
+            attributes.append((dict_class(type(token)), values))
+
+    copies = [None] * len(tokens)
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    for index, (token_class, values) in enumerate(attributes):
+        copy = object.__new__(token_class)
+        for name, value in values.items():
+            setattr(copy, name, value)
+
+        copies[index] = copy
+
+    size = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+
+    return size
+
+
+def parse(pdf_file_content: bytes) -> tuple:
+    start = perf_counter()
+    processor = PDFProcessor()
+    PDFParser(processor).parse(pdf_file_content)
+    processor.end_parsing()
+    convert_objstm(processor.tokens)
+
+    return (processor, perf_counter() - start)
+
+
+def create_objects(object_count: int) -> bytes:
+    seed(2022)
+
+    lines = [b"%PDF-1.4"]
+    for obj_num in range(1, object_count + 1):
+        lines.append(
+            b"%d 0 obj <</Type/Annot/Subtype/Link/Rect[%d %d.5 %d %d]"
+            b"/Border[0 0 0]/P %d 0 R/Contents(Link %d)/F 4>> endobj" % (
+                obj_num,
+                randrange(600), randrange(800), randrange(600), randrange(800),
+                randrange(1, object_count + 1), obj_num
+            )
+        )
+
+    lines.append(b"trailer <</Size %d/Root 1 0 R>>" % (object_count + 1,))
+    lines.append(b"startxref 0")
+    lines.append(b"%%EOF")
+
+    return b"\n".join(lines)
+
+
+def report(name: str, pdf_file_content: bytes):
+    processor, parse_time = parse(pdf_file_content)
+    tokens = all_tokens(processor.tokens.stack)
+
+    dict_size = copy_tokens(tokens, with_slots=False)
+    slots_size = copy_tokens(tokens, with_slots=True)
+
+    print("%s: %d tokens, parsed in %.1f ms" % (
+        name, len(tokens), parse_time * 1000
+    ))
+    print("  __dict__   %6.1f bytes per token" % (dict_size / len(tokens),))
+    print("  __slots__  %6.1f bytes per token  (-%.0f%%)" % (
+        slots_size / len(tokens), 100 - 100 * slots_size / dict_size
+    ))
+
+
+if __name__ == "__main__":
+    for pdf_file_name in sorted(glob("pdf-examples/*.pdf")):
+        report(pdf_file_name, open(pdf_file_name, "rb").read())
+
+    for object_count in [10000, 50000]:
+        report(
+            "synthetic, %d objects" % (object_count,),
+            create_objects(object_count)
+        )
@@ -0,0 +1,94 @@
+__author__ = "Frédéric BISSON"
+__copyright__ = "Copyright 2022, Frédéric BISSON"
+__credits__ = ["Frédéric BISSON"]
+__license__ = "mit"
+__maintainer__ = "Frédéric BISSON"
+__email__ = "zigazou@protonmail.com"
+
+"""Compare the replacement of redefined objects by the PDFProcessor with the
+previous way of scanning the stack for the object to replace.
+
+Run from the `tests` directory:
+
+    python3 benchmark/benchmark_redefinitions.py
+
+The content mimics incremental updates: every object is defined once, then
+redefined by the following updates. Both ways are checked to give the same
+objects.
+"""
+
+from random import seed, randrange
+from time import perf_counter
+
+from dietpdf.parser.PDFParser import PDFParser
+from dietpdf.processor.PDFProcessor import PDFProcessor
+from dietpdf.item.PDFObject import PDFObject
+
+
+class LegacyPDFProcessor(PDFProcessor):
+    """The PDFProcessor replacing objects by scanning the stack."""
+
+    def _generate_object(self):
+        value = self.tokens.pop()
+        object_id = self.tokens.pop()
+        object = PDFObject(object_id.obj_num, object_id.gen_num, value, None)
+
+        if object.obj_num in self.tokens.objects:
+            def any_object_with_same_number(_, item):
+                return (
+                    type(item) == PDFObject and
+                    item.obj_num == object.obj_num
+                )
+
+            for index, _ in self.tokens.find(any_object_with_same_number):
+                self.tokens.pop(index)
+                break
+
+        self.tokens.push(object)
+
+
+def create_updates(object_count: int, redefinition_count: int) -> bytes:
+    seed(2022)
+
+    lines = [
+        b"%d 0 obj %d endobj" % (obj_num, obj_num)
+        for obj_num in range(1, object_count + 1)
+    ]
+
+    for version in range(redefinition_count):
+        lines.append(b"%d 0 obj %d endobj" % (
+            randrange(1, object_count + 1), version
+        ))
+
+    return b"\n".join(lines)
+
+
+def parse(processor: PDFProcessor, content: bytes) -> tuple:
+    start = perf_counter()
+    PDFParser(processor).parse(content)
+    processor.end_parsing()
+
+    def any_object(_, item): return type(item) == PDFObject
+    objects = processor.tokens.find_all(any_object)
+
+    return (objects, perf_counter() - start)
+
+
+if __name__ == "__main__":
+    for object_count, redefinition_count in [
+        (10000, 10000), (1000, 50000), (5000, 50000)
+    ]:
+        content = create_updates(object_count, redefinition_count)
+        print("%d objects, %d redefinitions" % (
+            object_count, redefinition_count
+        ))
+
+        expected, legacy_time = parse(LegacyPDFProcessor(), content)
+        result, tombstone_time = parse(PDFProcessor(), content)
+
+        assert result == expected
+
+        print("  stack scan   %8.1f ms" % (legacy_time * 1000))
+        print("  tombstones   %8.1f ms  (x%.1f)" % (
+            tombstone_time * 1000, legacy_time / tombstone_time
+        ))
@@ -0,0 +1,178 @@
+__author__ = "Frédéric BISSON"
+__copyright__ = "Copyright 2022, Frédéric BISSON"
+__credits__ = ["Frédéric BISSON"]
+__license__ = "mit"
+__maintainer__ = "Frédéric BISSON"
+__email__ = "zigazou@protonmail.com"
+
+"""Compare the string codec with the byte by byte functions it replaces.
+
+Run from the `tests` directory:
+
+    python3 benchmark/benchmark_string_codec.py
+
+The previous implementations are copied here. Both implementations are
+checked to give the same results before being timed.
+"""
+
+import re
+
+from random import seed, randrange, choice
+from timeit import timeit
+
+from dietpdf.token.string_codec import (
+    find_string_end, unescape, escape, clean_hexstring
+)
+
+REPEAT = 5
+
+
+def legacy_find_string_end(binary_data: bytes, offset: int) -> int:
+    char_offset = offset + 1
+    nested = 1
+    while nested != 0:
+        char = binary_data[char_offset:char_offset + 1]
+        if char == b")":
+            nested -= 1
+        elif char == b"(":
+            nested += 1
+        elif char == b"\\":
+            char_offset += 1
+
+        char_offset += 1
+
+    return char_offset
+
+
+def legacy_unescape(string: bytes) -> bytes:
+    escape_chars = {
+        0x6e: 0x0a, 0x72: 0x0d, 0x74: 0x09, 0x62: 0x08,
+        0x66: 0x0c, 0x28: 0x28, 0x29: 0x29, 0x5c: 0x5c,
+    }
+
+    unescaped = b""
+    state = 0
+    ordinal = 0
+
+    for char in string:
+        if state == 0:
+            if char == 0x5c:
+                state = 1
+            else:
+                unescaped += b"%c" % char
+        elif state == 1:
+            if char in b"01234567":
+                ordinal = char - 0x30
+                state = 2
+            elif char in escape_chars:
+                unescaped += b"%c" % escape_chars[char]
+                state = 0
+            elif char == 0x0a:
+                state = 0
+            elif char == 0x0d:
+                state = 4
+            else:
+                unescaped += b"%c" % char
+                state = 0
+        elif state in [2, 3]:
+            if char in b"01234567":
+                ordinal = ordinal * 8 + char - 0x30
+                if state == 3:
+                    unescaped += b"%c" % ordinal
+                    state = 0
+                else:
+                    state = 3
+            else:
+                unescaped += b"%c" % ordinal
+                if char == 0x5c:
+                    state = 1
+                else:
+                    unescaped += b"%c" % char
+                    state = 0
+        elif state == 4:
+            if char != 0x0a:
+                unescaped += b"%c" % char
+
+            state = 0
+
+    if state in [2, 3]:
+        unescaped += b"%c" % ordinal
+
+    return unescaped
+
+
+def legacy_escape(string: bytes) -> bytes:
+    string = string.replace(b"\\", b"\\\\")
+    string = string.replace(b"(", b"\\(")
+    string = string.replace(b")", b"\\)")
+    string = string.replace(b"\r", b"\\r")
+    return string
+
+
+def legacy_clean_hexstring(hexstring: bytes) -> bytes:
+    return re.sub(b"[^0-9A-Za-z]+", b"", hexstring)
+
+
+def create_strings(pieces: list, count: int, length: int) -> list:
+    seed(2022)
+
+    return [
+        b"".join(choice(pieces) for _ in range(randrange(length)))
+        for _ in range(count)
+    ]
+
+
+# Text with a few escape sequences, as found in most documents.
+TEXT_PIECES = [
+    b"Lorem", b"ipsum", b"dolor", b"sit", b"amet,", b" ", b" ", b" ", b"\\(",
+]
+
+# Escape sequences everywhere.
+ESCAPED_PIECES = [
+    b"Lorem", b"ipsum", b" ", b"\\(", b"\\)", b"\\\\", b"\\n",
+    b"\\101", b"\\7", b"(nested)", b"\\\n",
+]
+
+
+def compare(name: str, legacy: callable, current: callable, values: list):
+    for value in values:
+        assert legacy(value) == current(value), (name, value)
+
+    legacy_time = timeit(
+        lambda: [legacy(value) for value in values], number=REPEAT
+    ) / REPEAT
+
+    current_time = timeit(
+        lambda: [current(value) for value in values], number=REPEAT
+    ) / REPEAT
+
+    print("%-18s legacy %8.2f ms  codec %8.2f ms  (x%.1f)" % (
+        name, legacy_time * 1000, current_time * 1000,
+        legacy_time / current_time
+    ))
+
+
+if __name__ == "__main__":
+    for kind, pieces in [("text", TEXT_PIECES), ("escaped", ESCAPED_PIECES)]:
+        for length in [4, 64, 512]:
+            print("%s, up to %d pieces per string" % (kind, length))
+            strings = create_strings(pieces, 2000, length)
+            literals = [b"(%s)" % string for string in strings]
+            raw = [unescape(string) for string in strings]
+            hexstrings = [
+                b" ".join(b"%02x" % char for char in string)
+                for string in raw
+            ]
+
+            compare(
+                "find_string_end",
+                lambda literal: legacy_find_string_end(literal, 0),
+                lambda literal: find_string_end(literal, 0),
+                literals
+            )
+            compare("unescape", legacy_unescape, unescape, strings)
+            compare("escape", legacy_escape, escape, raw)
+            compare(
+                "clean_hexstring", legacy_clean_hexstring, clean_hexstring,
+                hexstrings
+            )
@@ -0,0 +1,92 @@
+__author__ = "Frédéric BISSON"
+__copyright__ = "Copyright 2022, Frédéric BISSON"
+__credits__ = ["Frédéric BISSON"]
+__license__ = "mit"
+__maintainer__ = "Frédéric BISSON"
+__email__ = "zigazou@protonmail.com"
+
+"""Compare the parsing engines on the PDF examples.
+
+Run from the `tests` directory:
+
+    python3 benchmark/benchmark_tokenizer.py
+
+For each example, it reports the time needed to parse the whole file and the
+time needed to tokenize its decoded streams, once with each engine.
+"""
+
+from glob import glob
+from timeit import timeit
+
+from dietpdf.parser.PDFParser import PDFParser
+from dietpdf.parser.TokenParser import (
+    TokenParser, ENGINE_DISPATCH, ENGINE_SCANNER
+)
+from dietpdf.processor.PDFProcessor import PDFProcessor
+from dietpdf.processor.TokenProcessor import TokenProcessor
+from dietpdf.item.PDFObject import PDFObject
+
+ENGINES = [ENGINE_DISPATCH, ENGINE_SCANNER]
+REPEAT = 5
+
+
+def parse_pdf(pdf_file_content: bytes, engine: str) -> PDFProcessor:
+    processor = PDFProcessor()
+    PDFParser(processor, engine).parse(pdf_file_content)
+    processor.end_parsing()
+    return processor
+
+
+def parse_streams(streams: list, engine: str):
+    for stream in streams:
+        TokenParser(TokenProcessor(), engine).parse(stream)
+
+
+def decoded_streams(processor: PDFProcessor) -> list:
+    def any_object_with_stream(_, item):
+        return type(item) == PDFObject and item.has_stream()
+
+    streams = []
+    for _, object in processor.tokens.find(any_object_with_stream):
+        stream = object.decode_stream()
+
+        # Only keep streams the token parser understands (content streams).
+        try:
+            TokenParser(TokenProcessor()).parse(stream)
+        except Exception:
+            continue
+
+        streams.append(stream)
+
+    return streams
+
+
+def benchmark(file_name: str):
+    pdf_file_content = open(file_name, "rb").read()
+    streams = decoded_streams(parse_pdf(pdf_file_content, ENGINE_SCANNER))
+
+    results = []
+    for engine in ENGINES:
+        file_time = timeit(
+            lambda: parse_pdf(pdf_file_content, engine), number=REPEAT
+        ) / REPEAT
+
+        streams_time = timeit(
+            lambda: parse_streams(streams, engine), number=REPEAT
+        ) / REPEAT
+
+        results.append((file_time, streams_time))
+
+    print("%s (%d bytes, %d bytes of streams)" % (
+        file_name, len(pdf_file_content), sum(len(s) for s in streams)
+    ))
+
+    for engine, (file_time, streams_time) in zip(ENGINES, results):
+        print("  %-10s file %8.2f ms  streams %8.2f ms" % (
+            engine, file_time * 1000, streams_time * 1000
+        ))
+
+
+if __name__ == "__main__":
+    for file_name in sorted(glob("pdf-examples/*.pdf")):
+        benchmark(file_name)
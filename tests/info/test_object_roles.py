@@ -0,0 +1,90 @@
+__author__ = "Frédéric BISSON"
+__copyright__ = "Copyright 2022, Frédéric BISSON"
+__credits__ = ["Frédéric BISSON"]
+__license__ = "mit"
+__maintainer__ = "Frédéric BISSON"
+__email__ = "zigazou@protonmail.com"
+
+from dietpdf.parser.PDFParser import PDFParser
+from dietpdf.processor.PDFProcessor import PDFProcessor
+from dietpdf.info.object_roles import (
+    classify_objects, ROLE_PAGE, ROLE_PAGE_CONTENT, ROLE_FORM, ROLE_IMAGE,
+    ROLE_FONT, ROLE_FONT_PROGRAM, ROLE_CMAP, ROLE_TOUNICODE, ROLE_ICC_PROFILE,
+    ROLE_METADATA, ROLE_ANNOTATION
+)
+
+
+def test_classify_objects():
+    processor = PDFProcessor()
+    PDFParser(processor).parse(b"""
+1 0 obj <</Type/Page/Contents[2 0 R 3 0 R]/Annots[4 0 R]
+  /Resources<</XObject<</Fm1 5 0 R/Im1 6 0 R>>/Font<</F1 7 0 R>>
+  /ColorSpace<</CS1[/ICCBased 10 0 R]>>>>>> endobj
+2 0 obj <</Length 3>> stream
+q Q
+endstream endobj
+3 0 obj <</Length 3>> stream
+q Q
+endstream endobj
+4 0 obj <</Type/Annot/Subtype/Text/Contents(Note)>> endobj
+5 0 obj <</Subtype/Form/BBox[0 0 1 1]/Length 3>> stream
+q Q
+endstream endobj
+6 0 obj <</Type/XObject/Subtype/Image/Width 1/Height 1/Length 1>> stream
+x
+endstream endobj
+7 0 obj <</Type/Font/ToUnicode 8 0 R/FontDescriptor 9 0 R>> endobj
+8 0 obj <</Type/CMap/Length 3>> stream
+q Q
+endstream endobj
+9 0 obj <</Type/FontDescriptor/FontFile2 11 0 R>> endobj
+10 0 obj <</N 3/Length 1>> stream
+x
+endstream endobj
+11 0 obj <</Length 1>> stream
+x
+endstream endobj
+12 0 obj <</Type/Metadata/Subtype/XML/Length 1>> stream
+x
+endstream endobj
+13 0 obj <</Length 1>> stream
+x
+endstream endobj
+""")
+    processor.end_parsing()
+
+    roles = classify_objects(processor.tokens)
+
+    assert roles == {
+        1: ROLE_PAGE,
+        2: ROLE_PAGE_CONTENT,
+        3: ROLE_PAGE_CONTENT,
+        4: ROLE_ANNOTATION,
+        5: ROLE_FORM,
+        6: ROLE_IMAGE,
+        7: ROLE_FONT,
+        # The own type of an object prevails.
+        8: ROLE_CMAP,
+        10: ROLE_ICC_PROFILE,
+        11: ROLE_FONT_PROGRAM,
+        12: ROLE_METADATA,
+    }
+    assert processor.tokens.roles is roles
+
+    # Roles are forgotten when the document is refreshed.
+    processor.tokens.refresh()
+    assert processor.tokens.roles == {}
+
+
+def test_classify_objects_example():
+    processor = PDFProcessor()
+    PDFParser(processor).parse(
+        open("pdf-examples/libreoffice-writer-hyperlink.pdf", "rb").read()
+    )
+    processor.end_parsing()
+
+    roles = classify_objects(processor.tokens)
+
+    assert roles[2] == ROLE_PAGE_CONTENT
+    assert roles[13] == ROLE_FONT_PROGRAM
+    assert roles[16] == ROLE_TOUNICODE
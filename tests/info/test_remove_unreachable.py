@@ -0,0 +1,81 @@
+__author__ = "Frédéric BISSON"
+__copyright__ = "Copyright 2022, Frédéric BISSON"
+__credits__ = ["Frédéric BISSON"]
+__license__ = "mit"
+__maintainer__ = "Frédéric BISSON"
+__email__ = "zigazou@protonmail.com"
+
+from dietpdf.parser.PDFParser import PDFParser
+from dietpdf.processor.PDFProcessor import PDFProcessor
+from dietpdf.info.decode_objstm import convert_objstm
+from dietpdf.info.remove_unreachable import remove_unreachable
+
+
+def parse(pdf_file_content: bytes) -> PDFProcessor:
+    processor = PDFProcessor()
+    PDFParser(processor).parse(pdf_file_content)
+    processor.end_parsing()
+    convert_objstm(processor.tokens)
+
+    return processor
+
+
+def test_remove_unreachable():
+    processor = parse(b"""%PDF-1.4
+1 0 obj <</Type/Catalog/Pages 2 0 R>> endobj
+2 0 obj <</Type/Pages/Kids[3 0 R]/Count 1>> endobj
+3 0 obj <</Type/Page/Parent 2 0 R/Contents 4 0 R>> endobj
+4 0 obj <</Length 3>> stream
+q Q
+endstream endobj
+5 0 obj <</Title(Info)/Subject 6 0 R>> endobj
+6 0 obj (Subject) endobj
+7 0 obj <</Length 5/Next 8 0 R>> stream
+image
+endstream endobj
+8 0 obj <</Previous 7 0 R>> endobj
+trailer <</Size 9/Root 1 0 R/Info 5 0 R>>
+startxref 0
+%%EOF
+""")
+
+    removed_count, removed_bytes = remove_unreachable(processor.tokens)
+
+    assert sorted(processor.tokens.objects.keys()) == [1, 2, 3, 4, 5, 6]
+    assert removed_count == 2
+    assert removed_bytes > len(b"image")
+
+
+def test_remove_unreachable_xref_stream():
+    processor = parse(b"""%PDF-1.5
+1 0 obj <</Type/Catalog/Pages 2 0 R>> endobj
+2 0 obj <</Type/Pages/Kids[]/Count 0>> endobj
+3 0 obj (orphan) endobj
+4 0 obj <</Type/XRef/Size 5/Root 1 0 R/W[1 1 1]/Length 0>> stream
+endstream endobj
+startxref 0
+%%EOF
+""")
+
+    assert remove_unreachable(processor.tokens)[0] == 1
+    assert sorted(processor.tokens.objects.keys()) == [1, 2, 4]
+
+
+def test_remove_unreachable_without_trailer():
+    processor = parse(b"1 0 obj (one) endobj 2 0 obj (two) endobj")
+
+    assert remove_unreachable(processor.tokens) == (0, 0)
+    assert sorted(processor.tokens.objects.keys()) == [1, 2]
+
+
+def test_remove_unreachable_orphan_lengths():
+    processor = parse(
+        open("pdf-examples/libreoffice-writer-hyperlink.opt.pdf", "rb").read()
+    )
+    object_count = len(processor.tokens.objects)
+
+    # Lengths of streams left behind when the streams were rewritten.
+    assert remove_unreachable(processor.tokens)[0] == 2
+    assert 3 not in processor.tokens.objects
+    assert 14 not in processor.tokens.objects
+    assert len(processor.tokens.objects) == object_count - 2
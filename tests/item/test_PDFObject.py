@@ -5,9 +5,13 @@ __license__ = "mit"
 __maintainer__ = "Frédéric BISSON"
 __email__ = "zigazou@protonmail.com"
 
+import pickle
+
+from dietpdf.token.PDFName import PDFName
 from dietpdf.token.PDFNumber import PDFNumber
 from dietpdf.item.PDFObject import PDFObject
 from dietpdf.item.PDFDictionary import PDFDictionary
+from dietpdf.item.PDFStream import PDFStream
 
 
 def test_PDFObject_bool():
@@ -20,3 +24,22 @@ def test_PDFObject_bool():
     assert not object_number_false
     assert object_dictionary_true and True
     assert not object_dictionary_false
+
+
+def test_PDFObject_slots():
+    stream = PDFStream(b"q Q")
+    dictionary = PDFDictionary({PDFName(b"Length"): PDFNumber(3)})
+    object = PDFObject(1, 0, dictionary, stream)
+
+    assert not hasattr(object, "__dict__")
+    assert not hasattr(stream, "__dict__")
+    assert not hasattr(PDFNumber(3), "__dict__")
+
+    assert object.item_offset is None
+    object.item_offset = 42
+    assert object.item_offset == 42
+
+    copy = pickle.loads(pickle.dumps(object))
+    assert copy.item_offset == 42
+    assert copy.source_code == object.source_code
+    assert copy.encode() == object.encode()
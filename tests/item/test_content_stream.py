@@ -5,8 +5,22 @@ __license__ = "mit"
 __maintainer__ = "Frédéric BISSON"
 __email__ = "zigazou@protonmail.com"
 
+import pytest
+
+from random import seed, choice, randrange
+
 from dietpdf.processor.TokenProcessor import TokenProcessor
-from dietpdf.item.content_stream import optimize_content_stream
+from dietpdf.parser.PDFParser import PDFParser
+from dietpdf.parser.TokenParser import UnexpectedSequence
+from dietpdf.parser.ContentStreamLexer import (
+    ContentStreamLexer, KIND_NUMBER, KIND_OPERATOR, KIND_NAME, KIND_STRING
+)
+from dietpdf.processor.PDFProcessor import PDFProcessor
+from dietpdf.info.all_source_codes import all_source_codes
+from dietpdf.item.content_stream import (
+    optimize_content_stream, minify_content_stream,
+    _optimize_content_stream_tokens
+)
 
 def create_content_stream_1():
     return b"""
@@ -226,3 +240,68 @@ def test_optimize_content_stream():
         assert len(optimized_stream) != 0
         assert len(optimized_stream) < len(stream)
         assert b"/ArtifactBMC" not in optimized_stream
+
+
+def test_ContentStreamLexer():
+    lexer = ContentStreamLexer(b"0.12345 1 m\n/F1 12.5 Tf (a(b)c) Tj")
+
+    assert list(lexer.kinds) == [
+        KIND_NUMBER, KIND_NUMBER, KIND_OPERATOR,
+        KIND_NAME, KIND_NUMBER, KIND_OPERATOR,
+        KIND_STRING, KIND_OPERATOR,
+    ]
+    assert list(lexer.numbers) == [0.12345, 1, 12.5]
+    assert list(lexer.precisions) == [2, 2, 4, 4, 2, 4, 4, 4]
+    assert lexer.token(3) == b"F1"
+    assert lexer.token(6) == b"a(b)c"
+
+    for stream in [b"BI /W 1 /H 1 ID x EI", b"(unterminated", b"a{b}"]:
+        with pytest.raises(UnexpectedSequence):
+            ContentStreamLexer(stream)
+
+
+def random_content_stream(count: int) -> bytes:
+    pieces = [
+        b"0", b"1", b"-12", b"+3", b"007", b".5", b"-0.5", b"1.",
+        b"12.345678", b"0.00001", b"595.275",
+        b"m", b"l", b"c", b"re", b"Tf", b"cm", b"rg", b"Tj", b"q", b"Q",
+        b"/F1", b"/Span", b"[", b"]", b"<<", b">>", b"<0102 0a>", b"<>",
+        b"(text)", b"(a\\)b)", b"(nested (string))", b"%comment\n",
+        b" ", b"\n", b"\r\n", b"\t",
+    ]
+
+    # The TokenParser needs enough tokens before the first operator.
+    return b"q q q q q q " + b"".join(
+        choice(pieces) + choice([b"", b" "]) for _ in range(count)
+    )
+
+
+def test_minify_content_stream():
+    seed(2022)
+    streams = [create_content_stream_1(), create_content_stream_2()]
+    streams += [random_content_stream(randrange(200)) for _ in range(300)]
+
+    # Content streams of the example PDFs.
+    for pdf_file_name in [
+        "pdf-examples/libreoffice-writer-hyperlink.pdf",
+        "pdf-examples/inkscape-cross.pdf",
+        "pdf-examples/libreoffice-impress-cross.pdf",
+    ]:
+        processor = PDFProcessor()
+        PDFParser(processor).parse(open(pdf_file_name, "rb").read())
+        processor.end_parsing()
+
+        for obj_num in all_source_codes(processor.tokens):
+            streams.append(processor.tokens.objects[obj_num].decode_stream())
+
+    for stream in streams:
+        for convert_hexstrings in [True, False]:
+            try:
+                lexer = ContentStreamLexer(stream)
+            except UnexpectedSequence:
+                continue
+
+            assert (
+                minify_content_stream(lexer, convert_hexstrings) ==
+                _optimize_content_stream_tokens(stream, convert_hexstrings)
+            ), stream
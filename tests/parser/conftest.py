@@ -0,0 +1,54 @@
+__author__ = "Frédéric BISSON"
+__copyright__ = "Copyright 2022, Frédéric BISSON"
+__credits__ = ["Frédéric BISSON"]
+__license__ = "mit"
+__maintainer__ = "Frédéric BISSON"
+__email__ = "zigazou@protonmail.com"
+
+"""Helpers shared by the tests parsing the live revision of a PDF."""
+
+import pytest
+
+from dietpdf.parser.read_xref import read_xref
+from dietpdf.processor.PDFProcessor import PDFProcessor
+from dietpdf.item.PDFObject import PDFObject
+
+
+def append_update(
+    pdf_file_content: bytes, obj_num: int, value: bytes
+) -> bytes:
+    """Append an incremental update replacing an object."""
+    references, trailer = read_xref(pdf_file_content)
+    previous_xref = int(pdf_file_content[
+        pdf_file_content.rindex(b"startxref") + len(b"startxref"):
+    ].split()[0])
+
+    offset = len(pdf_file_content)
+    output = pdf_file_content + b"%d 0 obj %s endobj\n" % (obj_num, value)
+
+    xref_offset = len(output)
+    output += b"xref\n%d 1\n%010d 00000 n \n" % (obj_num, offset)
+    output += b"trailer<</Size %d/Root %s/Info %s/Prev %d>>\n" % (
+        len(references),
+        trailer[b"Root"].encode(),
+        trailer[b"Info"].encode(),
+        previous_xref
+    )
+    output += b"startxref\n%d\n%%%%EOF\n" % xref_offset
+
+    return output
+
+
+def find_live_objects(processor: PDFProcessor) -> list:
+    def any_object(_, item): return type(item) == PDFObject
+    return processor.tokens.find_all(any_object)
+
+
+@pytest.fixture
+def update_object():
+    return append_update
+
+
+@pytest.fixture
+def live_objects():
+    return find_live_objects
@@ -9,13 +9,21 @@ from random import seed, randrange, choice
 from zlib import decompress
 
 from dietpdf.parser.PDFParser import PDFParser
+from dietpdf.parser.map_file import map_file
 from dietpdf.processor.PDFProcessor import PDFProcessor
 
 from dietpdf.token.PDFString import PDFString
 from dietpdf.token.PDFHexString import PDFHexString
 from dietpdf.token.PDFNumber import PDFNumber
+from dietpdf.token.PDFName import PDFName
+from dietpdf.token.PDFDictOpen import PDFDictOpen
 
 from dietpdf.item.PDFObject import PDFObject
+from dietpdf.item.PDFList import PDFList
+from dietpdf.item.PDFDictionary import PDFDictionary
+from dietpdf.item.PDFXref import PDFXref
+from dietpdf.item.PDFTrailer import PDFTrailer
+from dietpdf.item.PDFStartXref import PDFStartXref
 
 
 def test_PDFParser_stream():
@@ -144,3 +152,258 @@ def test_PDFParser_comment():
 
         # Comments other than %PDF* and %%EOF are discarded
         assert processor.tokens.stack_size() == 0
+
+
+def test_PDFParser_buffer_sources():
+    pdf_file_name = "pdf-examples/libreoffice-writer-hyperlink.pdf"
+    pdf_file_content = open(pdf_file_name, "rb").read()
+
+    expected = PDFProcessor()
+    PDFParser(expected).parse(pdf_file_content)
+    expected.end_parsing()
+
+    sources = [
+        bytearray(pdf_file_content),
+        memoryview(pdf_file_content),
+    ]
+
+    with map_file(pdf_file_name) as mapped_file_content:
+        sources.append(mapped_file_content)
+
+        for source in sources:
+            processor = PDFProcessor()
+            PDFParser(processor).parse(source)
+            processor.end_parsing()
+
+            assert processor.tokens.stack_size() == expected.tokens.stack_size()
+            for index in range(expected.tokens.stack_size()):
+                assert (
+                    processor.tokens.stack_at(index) ==
+                    expected.tokens.stack_at(index)
+                )
+
+
+def test_PDFParser_stream_length():
+    seed(2022)
+
+    after_stream = [b"\r\n", b"\n"]
+    before_endstream = [b"\r\n", b"\n", b""]
+
+    for _ in range(64):
+        # The raw data contains the end of stream sequence to check the parser
+        # really jumps over it.
+        raw_data = (
+            bytes([randrange(256) for _ in range(randrange(2000))]) +
+            b"\nendstream\nendobj\n" +
+            bytes([randrange(256) for _ in range(randrange(2000))])
+        )
+
+        end_of_line = choice(before_endstream)
+        pdf_stream = b"1 0 obj<</Length %d>>stream%s%s%sendstream\nendobj\n" % (
+            len(raw_data),
+            choice(after_stream),
+            raw_data,
+            end_of_line,
+        )
+
+        processor = PDFProcessor()
+        parser = PDFParser(processor)
+        parser.parse(pdf_stream)
+
+        assert processor.tokens.stack_size() == 1
+        assert processor.tokens.stack_at(0).stream == raw_data + end_of_line
+
+
+def test_PDFParser_stream_wrong_length():
+    lengths = [b"2", b"2000", b"-1", b"2.5", b"5 0 R"]
+
+    for length in lengths:
+        pdf_stream = (
+            b"5 0 obj 9 endobj "
+            b"1 0 obj<</Length %s>>stream\nHello world\nendstream\nendobj\n"
+        ) % length
+
+        processor = PDFProcessor()
+        parser = PDFParser(processor)
+        parser.parse(pdf_stream)
+
+        # The parser falls back to looking for the endstream keyword.
+        assert processor.tokens.stack_size() == 2
+        assert processor.tokens.stack_at(1).stream == b"Hello world\n"
+
+
+def test_PDFParser_stream_zero_copy():
+    raw_data = b"x\x9c\xcbH\xcd\xc9\xc9\x07\x00\x06,\x02\x15"
+    pdf_stream = (
+        b"1 0 obj<</Length %d/Filter/FlateDecode>>stream\n%s\nendstream\n"
+        b"endobj\n"
+    ) % (len(raw_data), raw_data)
+
+    processor = PDFProcessor()
+    parser = PDFParser(processor)
+    parser.parse(pdf_stream)
+
+    # The stream content is a view on the parsed data, not a copy.
+    object = processor.tokens.stack_at(0)
+    assert type(object.stream.stream) == memoryview
+    assert object.stream.stream.obj is pdf_stream
+    assert bytes(object.stream) == raw_data + b"\n"
+
+    assert object.decode_stream() == b"hello"
+    assert raw_data in object.encode()
+
+
+def test_PDFParser_feed():
+    seed(2022)
+
+    pdf_file_names = [
+        "pdf-examples/libreoffice-writer-hyperlink.pdf",
+        "pdf-examples/libreoffice-writer-empty.pdf",
+        "pdf-examples/inkscape-cross.pdf",
+    ]
+
+    for pdf_file_name in pdf_file_names:
+        pdf_file_content = open(pdf_file_name, "rb").read()
+
+        expected = PDFProcessor()
+        PDFParser(expected).parse(pdf_file_content)
+        expected.end_parsing()
+
+        for maximum_size in [1, 7, 64, 4096]:
+            processor = PDFProcessor()
+            parser = PDFParser(processor)
+
+            offset = 0
+            while offset < len(pdf_file_content):
+                size = randrange(1, maximum_size + 1)
+                parser.feed(pdf_file_content[offset:offset + size])
+                offset += size
+
+            parser.close()
+            processor.end_parsing()
+
+            assert processor.tokens.stack_size() == expected.tokens.stack_size()
+            for index in range(expected.tokens.stack_size()):
+                assert (
+                    processor.tokens.stack_at(index) ==
+                    expected.tokens.stack_at(index)
+                )
+
+
+def test_PDFParser_feed_stream_length():
+    # The stream contains the end of stream sequence: when cut just after it,
+    # the parser must wait for the real end of the stream.
+    raw_data = b"abc\nendstream\nendobj\ndef"
+    pdf_stream = b"1 0 obj<</Length %d>>stream\n%s\nendstream\nendobj\n" % (
+        len(raw_data), raw_data
+    )
+
+    for cut in range(1, len(pdf_stream)):
+        processor = PDFProcessor()
+        parser = PDFParser(processor)
+
+        parser.feed(pdf_stream[:cut])
+        parser.feed(pdf_stream[cut:])
+        parser.close()
+
+        assert processor.tokens.stack_size() == 1
+        assert processor.tokens.stack_at(0).stream == raw_data + b"\n"
+
+
+def test_PDFParser_redefinitions():
+    content = b"".join(
+        b"%d 0 obj (version %d) endobj\n" % (obj_num, version)
+        for version in range(3)
+        for obj_num in range(1, 101)
+    )
+
+    processor = PDFProcessor()
+    PDFParser(processor).parse(content)
+    processor.end_parsing()
+
+    def any_object(_, item): return type(item) == PDFObject
+    objects = processor.tokens.find_all(any_object)
+
+    # Only the last definitions remain, in the order they were defined.
+    assert [object.obj_num for object in objects] == list(range(1, 101))
+    assert all(object.value == b"version 2" for object in objects)
+    assert processor.tokens.stack_size() == 100
+
+
+def test_PDFParser_end_parsing():
+    content = (
+        b"%PDF-1.4\n"
+        b"1 0 obj (one) endobj\n"
+        b"xref\n"
+        b"0 2\n"
+        b"0000000000 65535 f \n"
+        b"0000000009 00000 n \n"
+        b"5 1\n"
+        b"0000000100 00000 n \n"
+        b"trailer\n<</Size 6>>\n"
+        b"startxref\n30\n%%EOF\n"
+    )
+
+    processor = PDFProcessor()
+    PDFParser(processor).parse(content)
+    processor.end_parsing()
+
+    _, object, xref, trailer, startxref, _ = processor.tokens.stack
+
+    assert object.value == b"one"
+    assert type(xref) == PDFXref
+    assert [
+        (subsection.base, subsection.count, subsection.entries)
+        for subsection in xref.subsections
+    ] == [
+        (0, 2, [(0, 65535, "f"), (9, 0, "n")]),
+        (5, 1, [(100, 0, "n")]),
+    ]
+    assert type(trailer) == PDFTrailer and trailer.dictionary[b"Size"] == 6
+    assert type(startxref) == PDFStartXref and startxref.offset == 30
+
+
+def test_PDFParser_lists_and_dictionaries():
+    processor = PDFProcessor()
+    PDFParser(processor).parse(
+        b"1 0 obj <</A [1 [2 3] <</B 4>> []] /C <<>> /A 5>> endobj "
+        b"2 0 obj [1 << 2 ] endobj"
+    )
+    processor.end_parsing()
+
+    value = processor.tokens.objects[1].value
+    assert type(value) == PDFDictionary
+    assert list(value.items.keys()) == [b"A", b"C"]
+    assert value[b"A"] == PDFList([
+        PDFNumber(1),
+        PDFList([PDFNumber(2), PDFNumber(3)]),
+        PDFDictionary({PDFName(b"B"): PDFNumber(4)}),
+        PDFList([]),
+    ])
+    assert value[b"C"] == PDFDictionary({})
+
+    # An unclosed dictionary becomes an item of the enclosing list.
+    assert processor.tokens.objects[2].value == PDFList([
+        PDFNumber(1), PDFDictOpen(), PDFNumber(2)
+    ])
+    assert processor.tokens.stack_size() == 2
+
+
+def test_PDFParser_stream_same_content():
+    # Valid, missing, wrong and indirect lengths give the same content.
+    lengths = [b"/Length 11", b"", b"/Length 2000", b"/Length 5 0 R"]
+
+    for end_of_line in [b"\n", b"\r\n", b""]:
+        for length in lengths:
+            pdf_stream = (
+                b"1 0 obj<<%s>>stream\nHello world%sendstream\nendobj\n"
+            ) % (length, end_of_line)
+
+            processor = PDFProcessor()
+            PDFParser(processor).parse(pdf_stream)
+            object = processor.tokens.stack_at(0)
+
+            assert object.stream == b"Hello world" + end_of_line
+            assert object.encode() == (
+                b"1 0 obj<<%s>>stream\nHello world%sendstream\nendobj\n"
+            ) % (length, end_of_line)
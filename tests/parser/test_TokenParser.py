@@ -0,0 +1,103 @@
+__author__ = "Frédéric BISSON"
+__copyright__ = "Copyright 2022, Frédéric BISSON"
+__credits__ = ["Frédéric BISSON"]
+__license__ = "mit"
+__maintainer__ = "Frédéric BISSON"
+__email__ = "zigazou@protonmail.com"
+
+from glob import glob
+
+import pytest
+
+from dietpdf.parser.PDFParser import PDFParser
+from dietpdf.parser.TokenParser import (
+    TokenParser, ENGINE_DISPATCH, ENGINE_SCANNER, UnexpectedSequence
+)
+from dietpdf.processor.PDFProcessor import PDFProcessor
+from dietpdf.processor.TokenProcessor import TokenProcessor
+
+
+def create_content_streams() -> list:
+    return [
+        b"",
+        b"   \r\n\t",
+        b"q 1 0 0 1 56.8 773.989 cm 0.7 w 0 0 0.50196 RG 0 -1.1 m S Q",
+        b"BT/F1 12 Tf[<01> 2 <0203> -6 (Hello \\(world\\))]TJ ET",
+        b"/Link<</MCID 0>>BDC EMC % comment\r\n.5 -.5 +3 4. g",
+        b"<<>>[]<>()<< /A [1 2] >>",
+        b"BI /W 2 /H 2 /BPC 8 /CS /G ID \x00\x01\x02\x03 EI Q",
+    ]
+
+
+def tokenize(stream: bytes, engine: str) -> list:
+    processor = TokenProcessor()
+    TokenParser(processor, engine).parse(stream)
+    return processor.tokens.stack
+
+
+def test_TokenParser_engines_content_streams():
+    for stream in create_content_streams():
+        assert (
+            tokenize(stream, ENGINE_SCANNER) ==
+            tokenize(stream, ENGINE_DISPATCH)
+        )
+
+
+def test_TokenParser_engines_pdf_examples():
+    for file_name in glob("pdf-examples/*.pdf"):
+        pdf_file_content = open(file_name, "rb").read()
+
+        stacks = []
+        for engine in [ENGINE_DISPATCH, ENGINE_SCANNER]:
+            processor = PDFProcessor()
+            PDFParser(processor, engine).parse(pdf_file_content)
+            processor.end_parsing()
+            stacks.append(processor.tokens.stack)
+
+        assert stacks[0] == stacks[1], file_name
+
+
+def test_TokenParser_engines_errors():
+    for engine in [ENGINE_DISPATCH, ENGINE_SCANNER]:
+        with pytest.raises(UnexpectedSequence):
+            tokenize(b"/ /Name", engine)
+
+
+def test_TokenParser_inline_image():
+    # The image data contains white spaces followed by EI.
+    data = b"\x00 EI \x01\nEI\n\x02\x03"
+
+    inline_images = [
+        b"BI /W 6 /H 2 /BPC 8 /CS /G ID %s EI Q",
+        b"BI /Width 6 /Height 2 /BitsPerComponent 8 /ColorSpace /DeviceGray"
+        b" ID %s\nEI Q",
+        b"BI /W 8 /H 1 /BPC 4 /CS /RGB ID %s EI Q",
+        b"BI /W 24 /H 1 /BPC 4 /CS [/I /RGB 15 <00>] ID %s EI Q",
+        b"BI /W 96 /H 1 /IM true ID %s EI Q",
+        b"BI /W 1 /H 1 /CS /CustomSpace /F /AHx /L 12 ID\r\n%s EI Q",
+    ]
+
+    for inline_image in inline_images:
+        for engine in [ENGINE_DISPATCH, ENGINE_SCANNER]:
+            tokens = tokenize(inline_image % data, engine)
+
+            assert tokens[-4] == b"ID"
+            assert tokens[-3] == data
+            assert tokens[-2] == b"EI"
+            assert tokens[-1] == b"Q"
+
+
+def test_TokenParser_inline_image_fallback():
+    # The length cannot be computed or is wrong: the first EI is used.
+    inline_images = [
+        b"BI /W 4 /H 1 /BPC 8 /CS /CustomSpace ID abcd EI Q",
+        b"BI /W 4 /H 1 /BPC 8 /CS /G /F /AHx ID abcd EI Q",
+        b"BI /W 4 /H 1 /BPC 8 /CS /G /L 3 ID abcd EI Q",
+    ]
+
+    for inline_image in inline_images:
+        for engine in [ENGINE_DISPATCH, ENGINE_SCANNER]:
+            tokens = tokenize(inline_image, engine)
+
+            assert tokens[-3] == b"abcd"
+            assert tokens[-2] == b"EI"
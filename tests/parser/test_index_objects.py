@@ -0,0 +1,52 @@
+__author__ = "Frédéric BISSON"
+__copyright__ = "Copyright 2022, Frédéric BISSON"
+__credits__ = ["Frédéric BISSON"]
+__license__ = "mit"
+__maintainer__ = "Frédéric BISSON"
+__email__ = "zigazou@protonmail.com"
+
+from glob import glob
+
+from dietpdf.parser.index_objects import index_objects
+from dietpdf.parser.read_xref import read_xref
+
+
+def test_index_objects_examples():
+    for pdf_file_name in glob("pdf-examples/*.pdf"):
+        pdf_file_content = open(pdf_file_name, "rb").read()
+
+        references, trailers, startxrefs = index_objects(pdf_file_content)
+        xref_references, _ = read_xref(pdf_file_content)
+
+        assert references == {
+            obj_num: entry
+            for obj_num, entry in xref_references.items()
+            if entry[0] == 1
+        }
+        assert len(trailers) == 1
+        assert startxrefs == [pdf_file_content.rindex(b"\nxref\n") + 1]
+
+
+def test_index_objects_last_definition_wins():
+    pdf_file_content = (
+        b"%PDF-1.7\n"
+        b"1 0 obj<</Length 22>>stream\n"
+        b"2 0 obj (fake) endobj\n"
+        b"\nendstream\nendobj\n"
+        b"2 0 obj(first)endobj\n"
+        b"2 1 obj(second)endobj\n"
+        b"(3 0 obj)\n"
+        b"trailer<</Root 1 0 R>>\n"
+        b"startxref\n123\n%%EOF\n"
+    )
+
+    references, trailers, startxrefs = index_objects(pdf_file_content)
+
+    assert references == {
+        1: (1, 9, 0),
+        2: (1, pdf_file_content.index(b"2 1 obj"), 1),
+        # Object headers inside strings are not distinguished.
+        3: (1, pdf_file_content.index(b"3 0 obj"), 0),
+    }
+    assert trailers == [pdf_file_content.index(b"trailer")]
+    assert startxrefs == [123]
@@ -0,0 +1,69 @@
+__author__ = "Frédéric BISSON"
+__copyright__ = "Copyright 2022, Frédéric BISSON"
+__credits__ = ["Frédéric BISSON"]
+__license__ = "mit"
+__maintainer__ = "Frédéric BISSON"
+__email__ = "zigazou@protonmail.com"
+
+import pytest
+
+from dietpdf.parser.PDFParser import PDFParser
+from dietpdf.parser.parallel_parse import parallel_parse, _split_objects
+from dietpdf.parser.parse_live_revision import parse_live_revision
+from dietpdf.processor.PDFProcessor import PDFProcessor
+from dietpdf.item.PDFTrailer import PDFTrailer
+
+
+@pytest.mark.parametrize("pdf_file_name", [
+    "pdf-examples/libreoffice-writer-hyperlink.pdf",
+    "pdf-examples/libreoffice-writer-hyperlink.opt.pdf",
+    "pdf-examples/inkscape-cross.pdf",
+])
+@pytest.mark.parametrize("workers", [1, 3])
+def test_parallel_parse(pdf_file_name, workers, live_objects):
+    pdf_file_content = open(pdf_file_name, "rb").read()
+
+    expected = PDFProcessor()
+    parse_live_revision(expected, pdf_file_content)
+
+    processor = PDFProcessor()
+    parallel_parse(processor, pdf_file_name, pdf_file_content, workers)
+
+    assert live_objects(processor) == live_objects(expected)
+    assert processor.tokens.stack_at(-1) == expected.tokens.stack_at(-1)
+
+
+def test_parallel_parse_last_definition(tmp_path, update_object, live_objects):
+    pdf_file_content = open(
+        "pdf-examples/libreoffice-writer-hyperlink.pdf", "rb"
+    ).read()
+    pdf_file_content = update_object(pdf_file_content, 3, b"(first)")
+    pdf_file_content = update_object(pdf_file_content, 3, b"(last)")
+
+    # Shifting the objects forces the use of the index of objects.
+    pdf_file_content = pdf_file_content[:9] + b"%" * 8 + pdf_file_content[9:]
+
+    pdf_file_name = str(tmp_path / "updated.pdf")
+    open(pdf_file_name, "wb").write(pdf_file_content)
+
+    expected = PDFProcessor()
+    PDFParser(expected).parse(pdf_file_content)
+    expected.end_parsing()
+
+    processor = PDFProcessor()
+    parallel_parse(processor, pdf_file_name, pdf_file_content, 2)
+
+    assert live_objects(processor) == live_objects(expected)
+    assert processor.tokens.objects[3].value == b"last"
+    assert type(processor.tokens.stack_at(-1)) == PDFTrailer
+
+
+def test_split_objects():
+    objects = [(offset, offset // 10) for offset in range(0, 1000, 10)]
+
+    ranges = _split_objects(objects, 4, 1000)
+    assert len(ranges) == 4
+    assert sum(ranges, []) == objects
+
+    assert _split_objects(objects, 200, 1000) == [[item] for item in objects]
+    assert _split_objects([], 4, 1000) == []
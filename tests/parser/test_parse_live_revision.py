@@ -0,0 +1,52 @@
+__author__ = "Frédéric BISSON"
+__copyright__ = "Copyright 2022, Frédéric BISSON"
+__credits__ = ["Frédéric BISSON"]
+__license__ = "mit"
+__maintainer__ = "Frédéric BISSON"
+__email__ = "zigazou@protonmail.com"
+
+import pytest
+
+from dietpdf.parser.PDFParser import PDFParser
+from dietpdf.parser.parse_live_revision import parse_live_revision
+from dietpdf.parser.read_xref import InvalidXref
+from dietpdf.processor.PDFProcessor import PDFProcessor
+from dietpdf.item.PDFTrailer import PDFTrailer
+
+
+def test_parse_live_revision(update_object, live_objects):
+    pdf_file_content = open(
+        "pdf-examples/libreoffice-writer-hyperlink.pdf", "rb"
+    ).read()
+
+    # The first update would stop the tokenizer, it must not be parsed.
+    pdf_file_content = update_object(pdf_file_content, 3, b"(dead) )")
+    pdf_file_content = update_object(pdf_file_content, 3, b"(live)")
+
+    expected = PDFProcessor()
+    PDFParser(expected).parse(
+        pdf_file_content.replace(b"(dead) )", b"(dead)  ")
+    )
+    expected.end_parsing()
+
+    processor = PDFProcessor()
+    parse_live_revision(processor, pdf_file_content)
+
+    assert live_objects(processor) == live_objects(expected)
+    assert processor.tokens.objects[3].value == b"live"
+
+    trailer = processor.tokens.stack_at(-1)
+    assert type(trailer) == PDFTrailer
+    assert trailer == expected.tokens.stack_at(-3)
+
+
+def test_parse_live_revision_invalid_xref():
+    pdf_file_content = open(
+        "pdf-examples/libreoffice-writer-hyperlink.pdf", "rb"
+    ).read()
+
+    with pytest.raises(InvalidXref):
+        parse_live_revision(
+            PDFProcessor(),
+            pdf_file_content[:9] + b"%" * 8 + pdf_file_content[9:]
+        )
@@ -0,0 +1,184 @@
+__author__ = "Frédéric BISSON"
+__copyright__ = "Copyright 2022, Frédéric BISSON"
+__credits__ = ["Frédéric BISSON"]
+__license__ = "mit"
+__maintainer__ = "Frédéric BISSON"
+__email__ = "zigazou@protonmail.com"
+
+import pytest
+
+from zlib import compress
+
+from dietpdf.parser.PDFParser import PDFParser
+from dietpdf.parser.read_xref import read_xref, InvalidXref
+from dietpdf.processor.PDFProcessor import PDFProcessor
+from dietpdf.info.decode_objstm import convert_objstm
+from dietpdf.pdf.LazyPDF import LazyPDF
+
+
+def create_xref_stream_pdf() -> bytes:
+    """Create a PDF using a cross-reference stream and an object stream,
+    updated once by an incremental update.
+    """
+    output = b"%PDF-1.7\n"
+    offsets = {}
+
+    offsets[1] = len(output)
+    output += b"1 0 obj<</Type/Catalog/Pages 2 0 R>>endobj\n"
+
+    offsets[2] = len(output)
+    output += b"2 0 obj<</Type/Pages/Kids[]/Count 0>>endobj\n"
+
+    # Objects 4 and 5 are stored in object stream 3.
+    objects = b"(Object 4) (Object 5)"
+    header = b"4 0 5 11 "
+    objstm = header + objects
+    offsets[3] = len(output)
+    output += b"3 0 obj<</Type/ObjStm/N 2/First %d/Length %d>>stream\n" % (
+        len(header), len(objstm)
+    )
+    output += objstm + b"\nendstream\nendobj\n"
+
+    entries = (
+        b"\x00\x00\x00\xff" +
+        b"\x01" + offsets[1].to_bytes(2, "big") + b"\x00" +
+        b"\x01" + offsets[2].to_bytes(2, "big") + b"\x00" +
+        b"\x01" + offsets[3].to_bytes(2, "big") + b"\x00" +
+        b"\x02\x00\x03\x00" +
+        b"\x02\x00\x03\x01" +
+        b"\x01" + len(output).to_bytes(2, "big") + b"\x00"
+    )
+    entries = compress(entries)
+    first_xref = len(output)
+    output += (
+        b"6 0 obj<</Type/XRef/Size 7/W[1 2 1]/Root 1 0 R"
+        b"/Filter/FlateDecode/Length %d>>stream\n"
+    ) % len(entries)
+    output += entries + b"\nendstream\nendobj\n"
+    output += b"startxref\n%d\n%%%%EOF\n" % first_xref
+
+    # Incremental update replacing object 5.
+    offset_5 = len(output)
+    output += b"5 0 obj(Object 5 updated)endobj\n"
+
+    entries = compress(
+        b"\x01" + offset_5.to_bytes(2, "big") + b"\x00" +
+        b"\x01" + len(output).to_bytes(2, "big") + b"\x00"
+    )
+    second_xref = len(output)
+    output += (
+        b"7 0 obj<</Type/XRef/Size 8/Index[5 1 7 1]/W[1 2 1]/Root 1 0 R"
+        b"/Prev %d/Filter/FlateDecode/Length %d>>stream\n"
+    ) % (first_xref, len(entries))
+    output += entries + b"\nendstream\nendobj\n"
+    output += b"startxref\n%d\n%%%%EOF\n" % second_xref
+
+    return output
+
+
+def test_LazyPDF_examples():
+    pdf_file_names = [
+        "pdf-examples/libreoffice-writer-hyperlink.pdf",
+        "pdf-examples/libreoffice-writer-hyperlink.opt.pdf",
+        "pdf-examples/inkscape-cross.pdf",
+    ]
+
+    for pdf_file_name in pdf_file_names:
+        pdf_file_content = open(pdf_file_name, "rb").read()
+
+        processor = PDFProcessor()
+        PDFParser(processor).parse(pdf_file_content)
+        processor.end_parsing()
+        convert_objstm(processor.tokens)
+        expected = processor.tokens
+
+        pdf = LazyPDF(pdf_file_content)
+
+        assert pdf.stack_size() == 0
+        assert pdf.references.keys() - {0} == expected.objects.keys()
+        for obj_num in expected.objects:
+            assert pdf.get(obj_num) == expected.objects[obj_num]
+
+
+def test_LazyPDF_xref_stream():
+    pdf = LazyPDF(create_xref_stream_pdf())
+
+    assert pdf.references[4] == (2, 3, 0)
+    assert pdf.references[5][0] == 1
+
+    assert pdf.get(pdf.trailer[b"Root"], ["Pages", "Count"]) == 0
+    assert pdf.get(4).value == b"Object 4"
+    assert pdf.get(5).value == b"Object 5 updated"
+    assert pdf.get(8) == None
+
+    # Only the objects needed have been loaded.
+    assert set(pdf.objects.keys()) == {1, 2, 3, 4, 5}
+
+
+def test_LazyPDF_invalid_xref():
+    pdf_file_content = open(
+        "pdf-examples/libreoffice-writer-hyperlink.pdf", "rb"
+    ).read()
+
+    with pytest.raises(InvalidXref):
+        read_xref(pdf_file_content[:-100])
+
+
+
+def test_LazyPDF_repair():
+    pdf_file_content = open(
+        "pdf-examples/libreoffice-writer-hyperlink.pdf", "rb"
+    ).read()
+    expected = LazyPDF(pdf_file_content)
+
+    # Wrong offset: object 1 points to object 2.
+    pdf = LazyPDF(pdf_file_content)
+    pdf.references[1] = pdf.references[2]
+    assert pdf.get(1) == expected.get(1)
+    assert pdf.repaired
+
+    # Missing startxref.
+    pdf = LazyPDF(pdf_file_content[:pdf_file_content.rindex(b"startxref")])
+    assert pdf.repaired
+    assert pdf.trailer == expected.trailer
+    assert pdf.get(1) == expected.get(1)
+
+    # Shifted objects.
+    pdf = LazyPDF(pdf_file_content[:9] + b"%" * 8 + pdf_file_content[9:])
+    assert pdf.get(1) == expected.get(1)
+    assert pdf.repaired
+
+    # Cross-reference streams without startxref.
+    pdf_file_content = create_xref_stream_pdf()
+    pdf = LazyPDF(pdf_file_content.replace(b"startxref", b"%tartxref"))
+    assert pdf.repaired
+    assert b"Prev" in pdf.trailer
+    assert pdf.get(5).value == b"Object 5 updated"
+
+    with pytest.raises(InvalidXref):
+        LazyPDF(b"%PDF-1.7\n1 0 obj 1 endobj\n")
+
+
+def test_LazyPDF_parse_error():
+    # The object cannot be parsed, even after repairing the cross-references.
+    pdf = LazyPDF(create_xref_stream_pdf().replace(
+        b"/Count 0>>endobj", b"/Count 0]>endobj"
+    ))
+
+    with pytest.raises(InvalidXref):
+        pdf.get(2)
+
+    assert pdf.repaired
+
+
+def test_LazyPDF_repair_truncated_update():
+    # A truncated incremental update follows the cross-reference streams.
+    pdf_file_content = create_xref_stream_pdf()
+    pdf = LazyPDF(
+        pdf_file_content.replace(b"startxref", b"%tartxref") +
+        b"8 0 obj <</Type/Annot/Rect[0 0 1"
+    )
+
+    assert pdf.repaired
+    assert pdf.trailer[b"Root"] == LazyPDF(pdf_file_content).trailer[b"Root"]
+    assert pdf.get(5).value == b"Object 5 updated"
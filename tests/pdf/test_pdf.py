@@ -17,6 +17,7 @@ from dietpdf.item.PDFDictionary import PDFDictionary
 from dietpdf.item.PDFReference import PDFReference
 from dietpdf.item.PDFList import PDFList
 from dietpdf.item.PDFNull import PDFNull
+from dietpdf.item.PDFTrailer import PDFTrailer
 
 from dietpdf.pdf.PDF import PDF
 
@@ -223,3 +224,274 @@ def test_pdf_push_pop_insert():
         pdf.insert(index, PDFComment(b"Comment"))
 
     assert len(pdf.find_all(any_string)) == 0
+
+
+def test_pdf_remove_object():
+    def any_object(_, item): return type(item) == PDFObject
+
+    all_objects = create_objects()
+    pdf = PDF()
+
+    for object in all_objects:
+        pdf.push(object)
+
+    pdf.push(PDFComment(b"Comment"))
+
+    assert pdf.remove_object(0) == None
+    assert pdf.remove_object(3) == all_objects[2]
+    assert pdf.remove_object(11) == all_objects[10]
+    assert 3 not in pdf.objects
+    assert pdf.tombstones == 2
+    assert pdf.stack_size() == len(all_objects) - 1
+
+    # Tombstones are invisible through the accessors.
+    assert pdf.find_all(any_object) == all_objects[0:2] + all_objects[3:10]
+    assert pdf.stack_at(-1) == PDFComment(b"Comment")
+    assert pdf.tombstones == 0
+
+    # The position of an object is found again after an insert.
+    pdf.insert(0, PDFComment(b"First"))
+    assert pdf.remove_object(5) == all_objects[4]
+    assert pdf.pop() == PDFComment(b"Comment")
+    assert pdf.stack_at(0) == PDFComment(b"First")
+    assert pdf.find_first(lambda _, item: item is None) == None
+
+    # Tombstones on top of the stack are skipped by pop.
+    pdf.remove_object(10)
+    assert pdf.pop() == all_objects[8]
+    assert pdf.tombstones == 0
+
+
+def test_pdf_pop_from_after_insert():
+    first = PDFObject(1, 0, PDFNumber(1), None)
+    second = PDFObject(2, 0, PDFNumber(2), None)
+    third = PDFObject(3, 0, PDFNumber(3), None)
+
+    pdf = PDF()
+    pdf.push(first)
+    pdf.push(second)
+    pdf.insert(0, third)
+
+    assert pdf.pop_from(2) == [second]
+    assert sorted(pdf.objects.keys()) == [1, 3]
+    assert pdf.get(2) == None
+
+    # Objects are forgotten after removing other items.
+    pdf.push(second)
+    pdf.remove_indices([0])
+    assert pdf.pop_from(1) == [second]
+    assert sorted(pdf.objects.keys()) == [1]
+
+
+def test_pdf_indexes():
+    all_objects = create_objects()
+    pdf = PDF()
+
+    for object in all_objects[:-1]:
+        pdf.push(object)
+
+    pdf.push(PDFComment(b"Comment"))
+
+    assert pdf.find_by_class(PDFObject) == all_objects[:-1]
+    assert pdf.find_by_class(PDFComment) == [PDFComment(b"Comment")]
+    assert pdf.find_by_type(b"Annot") == []
+
+    # Pushed items are indexed.
+    pdf.push(all_objects[-1])
+    assert pdf.find_by_type(b"Annot") == [all_objects[-1]]
+    assert pdf.find_by_type(b"Annot", b"Link") == [all_objects[-1]]
+    assert pdf.find_by_type(b"Annot", b"Widget") == []
+    assert pdf.find_by_subtype(b"Link") == [all_objects[-1]]
+    assert pdf.find_with_stream() == []
+
+    # Removed items are not found anymore.
+    pdf.remove_object(11)
+    assert pdf.find_by_type(b"Annot") == []
+    assert pdf.find_by_class(PDFObject) == all_objects[:-1]
+
+    # Changes made to objects need a refresh.
+    all_objects[1].value = PDFDictionary({
+        PDFName(b"Type"): PDFName(b"Page")
+    })
+    assert pdf.find_by_type(b"Page") == []
+    pdf.refresh()
+    assert pdf.find_by_type(b"Page") == [all_objects[1]]
+
+
+def test_pdf_remove_where():
+    def any_string(_, item): return (
+        type(item) == PDFObject and
+        type(item.value) == PDFString
+    )
+
+    all_objects = create_objects()
+    pdf = PDF()
+
+    for object in all_objects:
+        pdf.push(object)
+
+    removed = pdf.remove_where(any_string)
+    assert [object.obj_num for object in removed] == [2, 3, 4, 5]
+    assert sorted(pdf.objects.keys()) == [1, 6, 7, 8, 9, 10, 11]
+    assert pdf.find_all(any_string) == []
+    assert pdf.remove_where(any_string) == []
+
+    # Indexes are those given by find, without tombstones.
+    pdf.remove_object(1)
+    assert pdf.remove_indices([0, 5]) == [all_objects[5], all_objects[10]]
+    assert sorted(pdf.objects.keys()) == [7, 8, 9, 10]
+    assert pdf.stack_at(0) == all_objects[6]
+
+    with pytest.raises(IndexError):
+        pdf.remove_indices([4])
+
+    # Positions of the remaining objects are still known.
+    assert pdf.remove_object(9) == all_objects[8]
+    assert pdf.find_by_class(PDFObject) == [
+        all_objects[6], all_objects[7], all_objects[9]
+    ]
+
+
+def test_pdf_references():
+    all_objects = create_objects()
+    pdf = PDF()
+
+    for object in all_objects[:-2]:
+        pdf.push(object)
+
+    assert pdf.find_referrers(3) == {(7, ("Contents",)), (8, ("Contents",))}
+    assert pdf.find_referrers(PDFReference(7, 0)) == {(1, ("Dummy1",))}
+    assert pdf.find_referrers(1) == set()
+    assert pdf.find_references(all_objects[0]) == [
+        (("Contents",), 2), (("Dummy1",), 7)
+    ]
+
+    # Pushed objects update the index.
+    pdf.push(all_objects[-2])
+    assert pdf.find_referrers(1) == {(10, (0,))}
+    assert pdf.find_referrers(3) == {
+        (7, ("Contents",)), (8, ("Contents",)), (10, (2,))
+    }
+
+    # Removed objects update the index.
+    pdf.remove_object(7)
+    pdf.pop()
+    assert pdf.find_referrers(3) == {(8, ("Contents",))}
+    assert pdf.find_referrers(1) == set()
+
+    def any_dummy(_, item): return type(item) == PDFObject and b"Dummy1" in item
+    pdf.remove_where(any_dummy)
+    assert pdf.find_referrers(4) == set()
+    assert pdf.find_referrers(7) == set()
+
+
+def test_pdf_get_cache():
+    all_objects = create_objects()
+    pdf = PDF()
+
+    for object in all_objects:
+        pdf.push(object)
+
+    # The path is not modified.
+    path = ["Dummy1", "Contents"]
+    assert pdf.get(1, path).value == b"Object 3"
+    assert path == ["Dummy1", "Contents"]
+    assert pdf.get(1, ("Dummy1", "Contents")).value == b"Object 3"
+
+    # Replacing an object involved in a resolution updates the result.
+    pdf.remove_object(3)
+    assert pdf.get(1, path) == None
+    pdf.push(PDFObject(3, 0, PDFString(b"New object 3"), None))
+    assert pdf.get(1, path).value == b"New object 3"
+
+    pdf.push(PDFObject(7, 0, PDFDictionary({
+        PDFName(b"Contents"): PDFReference(2, 0)
+    }), None))
+    assert pdf.get(1, path).value == b"Object 2"
+
+    # Changes made to objects need a refresh.
+    assert pdf.get(6, ["Dummy2"]) == b"Dummy2"
+    all_objects[5].value[b"Dummy2"] = PDFString(b"Changed")
+    assert pdf.get(6, ["Dummy2"]) == b"Dummy2"
+    pdf.refresh()
+    assert pdf.get(6, ["Dummy2"]) == b"Changed"
+
+    # References looping without consuming the path.
+    pdf.push(PDFObject(12, 0, PDFReference(13, 0), None))
+    pdf.push(PDFObject(13, 0, PDFReference(12, 0), None))
+    assert pdf.get(12, ["Contents"]) == None
+
+
+def test_pdf_select():
+    all_objects = create_objects()
+    pdf = PDF()
+
+    for object in all_objects:
+        pdf.push(object)
+
+    pdf.push(PDFComment(b"Comment"))
+
+    def queries():
+        return [
+            pdf.select(),
+            pdf.select(type="Annot"),
+            pdf.select(type=b"Annot", subtype=PDFName(b"Link")),
+            pdf.select(subtype="Widget"),
+            pdf.select(has=["Contents"]),
+            pdf.select(has=[b"Dummy1", "Dummy2"]),
+            pdf.select(stream=False, where=lambda item: item.obj_num > 8),
+            pdf.select(stream=True),
+            pdf.select(item_class=PDFComment),
+        ]
+
+    expected = [
+        all_objects,
+        [all_objects[10]],
+        [all_objects[10]],
+        [],
+        [all_objects[0], all_objects[6], all_objects[7]],
+        [all_objects[5]],
+        all_objects[8:],
+        [],
+        [PDFComment(b"Comment")],
+    ]
+
+    # Without indexes, the stack is scanned.
+    assert not pdf.indexed
+    assert queries() == expected
+
+    # With indexes, the same items are found.
+    pdf.find_by_class(PDFObject)
+    assert pdf.indexed
+    assert queries() == expected
+
+    with pytest.raises(TypeError):
+        pdf.select(where=2022)
+
+
+def test_pdf_select_trailer():
+    pdf = PDF()
+    object = PDFObject(
+        1, 0, PDFDictionary({PDFName(b"Type"): PDFName(b"Catalog")}), None
+    )
+    trailer = PDFTrailer(PDFDictionary({
+        PDFName(b"Size"): PDFNumber(2),
+        PDFName(b"Root"): PDFReference(1, 0),
+    }))
+    pdf.push(object)
+    pdf.push(trailer)
+
+    for _ in range(2):
+        assert pdf.select(item_class=PDFTrailer, has=["Root"]) == [trailer]
+        assert pdf.select(item_class=PDFTrailer, has=["Info"]) == []
+        assert pdf.select(item_class=PDFTrailer, type="Catalog") == []
+        assert pdf.select(type="Catalog") == [object]
+
+        with pytest.raises(TypeError):
+            pdf.select(item_class=PDFTrailer, stream=False)
+
+        with pytest.raises(TypeError):
+            pdf.select(item_class=PDFComment, has=["Root"])
+
+        # The same items are found with indexes.
+        pdf.find_by_class(PDFTrailer)
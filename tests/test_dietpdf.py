@@ -0,0 +1,31 @@
+__author__ = "Frédéric BISSON"
+__copyright__ = "Copyright 2022, Frédéric BISSON"
+__credits__ = ["Frédéric BISSON"]
+__license__ = "mit"
+__maintainer__ = "Frédéric BISSON"
+__email__ = "zigazou@protonmail.com"
+
+import pytest
+
+from shutil import copyfile
+
+from dietpdf.dietpdf import diet, optimized_name
+
+
+def test_optimized_name():
+    assert optimized_name("scan.pdf") == "scan.opt.pdf"
+    assert optimized_name("scan.PDF") == "scan.opt.pdf"
+    assert optimized_name("dir.pdf/scan") == "dir.pdf/scan.opt.pdf"
+    assert optimized_name("scan") == "scan.opt.pdf"
+
+
+def test_diet_does_not_overwrite_input(tmp_path):
+    input_pdf_name = str(tmp_path / "X.PDF")
+    copyfile("pdf-examples/libreoffice-writer-empty.pdf", input_pdf_name)
+    content = open(input_pdf_name, "rb").read()
+
+    for output_pdf_name in [input_pdf_name, str(tmp_path / "." / "X.PDF")]:
+        with pytest.raises(SystemExit):
+            diet(input_pdf_name, output_pdf_name=output_pdf_name)
+
+        assert open(input_pdf_name, "rb").read() == content
@@ -15,3 +15,18 @@ __email__ = "zigazou@protonmail.com"
 def test_infopdf():
     """diet("test.pdf")"""
 
+
+
+def test_infopdf_hyperlink_fallback(tmp_path, capsys):
+    pdf_file_name = "pdf-examples/libreoffice-writer-hyperlink.pdf"
+    infopdf("hyperlink", pdf_file_name)
+    expected = capsys.readouterr().out
+    assert "http" in expected
+
+    # Without /Root in the trailer, the whole PDF is parsed.
+    pdf_file_content = open(pdf_file_name, "rb").read()
+    broken_pdf_name = tmp_path / "no-root.pdf"
+    broken_pdf_name.write_bytes(pdf_file_content.replace(b"/Root", b"/Ro0t"))
+
+    infopdf("hyperlink", str(broken_pdf_name))
+    assert capsys.readouterr().out == expected
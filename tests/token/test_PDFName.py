@@ -0,0 +1,67 @@
+__author__ = "Frédéric BISSON"
+__copyright__ = "Copyright 2022, Frédéric BISSON"
+__credits__ = ["Frédéric BISSON"]
+__license__ = "mit"
+__maintainer__ = "Frédéric BISSON"
+__email__ = "zigazou@protonmail.com"
+
+import pickle
+import pytest
+
+from copy import deepcopy
+
+from dietpdf.token.PDFName import PDFName
+from dietpdf.token.PDFCommand import PDFCommand
+from dietpdf.item.PDFDictionary import PDFDictionary
+
+
+def test_PDFName_interning():
+    name = PDFName(b"Type")
+
+    assert PDFName(b"Type") is name
+    assert PDFName("Type") is name
+    assert PDFName(name) is name
+    assert PDFName(bytes(bytearray(b"Type"))) is name
+    assert PDFName(b"Length") is not name
+
+    assert name == b"Type"
+    assert hash(name) == hash(b"Type")
+
+    assert pickle.loads(pickle.dumps(name)) is name
+    assert deepcopy(name) is name
+
+    # Interned names are shared, they do not record any offset.
+    name.item_offset = 42
+    assert name.item_offset is None
+
+
+def test_PDFCommand_interning():
+    command = PDFCommand(b"BT")
+
+    assert PDFCommand(b"BT") is command
+    assert PDFCommand(b"ET") is not command
+    assert command == b"BT"
+    assert command == PDFCommand(b"BT")
+    assert pickle.loads(pickle.dumps(command)) is command
+
+    # The interned table must not bypass the argument checks.
+    with pytest.raises(AssertionError):
+        PDFCommand(command)
+
+    with pytest.raises(AssertionError):
+        PDFCommand(b"")
+
+
+def test_PDFDictionary_lookup():
+    dictionary = PDFDictionary({
+        PDFName(b"Type"): PDFName(b"Page"),
+        PDFName(b"Count"): PDFName(b"Pages"),
+    })
+
+    assert b"Type" in dictionary
+    assert "Type" in dictionary
+    assert PDFName(b"Type") in dictionary
+    assert b"Kids" not in dictionary
+
+    assert dictionary[b"Type"] is PDFName(b"Page")
+    assert dictionary["Count"] == b"Pages"
@@ -0,0 +1,83 @@
+__author__ = "Frédéric BISSON"
+__copyright__ = "Copyright 2022, Frédéric BISSON"
+__credits__ = ["Frédéric BISSON"]
+__license__ = "mit"
+__maintainer__ = "Frédéric BISSON"
+__email__ = "zigazou@protonmail.com"
+
+import pytest
+
+from random import seed, randrange, choice
+
+from dietpdf.token.PDFNumber import PDFNumber
+
+
+def rounded_encode(value, precision: int) -> bytes:
+    """Encode a number by converting it first, like PDFNumber always did."""
+    return PDFNumber(value, precision).encode()
+
+
+@pytest.mark.parametrize("raw, precision, expected", [
+    (b"0", 4, b"0"),
+    (b"123", 4, b"123"),
+    (b"-123", 4, b"-123"),
+    (b"+123", 4, b"123"),
+    (b"007", 4, b"7"),
+    (b"-0", 4, b"0"),
+    (b"0.5", 4, b".5"),
+    (b"-0.5", 4, b"-.5"),
+    (b".5", 4, b".5"),
+    (b"-.5", 4, b"-.5"),
+    (b"1.0", 4, b"1"),
+    (b"1.", 4, b"1"),
+    (b".0", 4, b"0"),
+    (b"12.34", 4, b"12.34"),
+    (b"12.34567", 4, b"12.3457"),
+    (b"12.34567", 1, b"12.3"),
+    (b"0.00001", 4, b".00001"),
+    (b"1.2500", 4, b"1.25"),
+])
+def test_PDFNumber_encode(raw, precision, expected):
+    number = PDFNumber(raw, precision)
+    assert number.encode() == expected
+    assert number == float(raw)
+
+
+def test_PDFNumber_lazy_value():
+    number = PDFNumber(b"12.5")
+    assert number._value is None
+    assert number.value == 12.5
+    assert type(PDFNumber(b"12").value) == int
+
+    # Changing the value forgets the raw bytes.
+    number.value = 3
+    assert number.raw is None
+    assert number.encode() == b"3"
+
+    # The precision may be changed after the number has been read.
+    number = PDFNumber(b"1.2345")
+    assert number.encode() == b"1.2345"
+    number.set_precision(2)
+    assert number.encode() == b"1.23"
+
+
+def test_PDFNumber_same_as_rounded():
+    seed(2022)
+    digits = "0123456789"
+    for _ in range(20000):
+        integer_part = "".join(choice(digits) for _ in range(randrange(6)))
+        decimal_part = "".join(choice(digits) for _ in range(randrange(7)))
+        raw = choice(["", "-"]) + integer_part
+        if decimal_part or not integer_part:
+            raw += "." + decimal_part
+        if raw in ["-", ".", "-."]:
+            continue
+
+        raw = raw.encode("ascii")
+        precision = randrange(1, 6)
+        if ord(".") in raw:
+            expected = rounded_encode(float(raw), precision)
+        else:
+            expected = rounded_encode(int(raw), precision)
+
+        assert PDFNumber(raw, precision).encode() == expected, raw
@@ -0,0 +1,66 @@
+__author__ = "Frédéric BISSON"
+__copyright__ = "Copyright 2022, Frédéric BISSON"
+__credits__ = ["Frédéric BISSON"]
+__license__ = "mit"
+__maintainer__ = "Frédéric BISSON"
+__email__ = "zigazou@protonmail.com"
+
+from random import seed, randrange
+
+from dietpdf.token.string_codec import (
+    find_string_end, unescape, escape, clean_hexstring
+)
+
+
+def test_string_codec_find_string_end():
+    assertions = [
+        (b"()", 2),
+        (b"(Hello world!) Tj", 14),
+        (b"((()))()", 6),
+        (b"(\\(\\(\\)\\))", 10),
+        (b"(\\\\)", 4),
+        (b"(a\\)", None),
+        (b"((a)", None),
+        (b"(a\\", None),
+    ]
+
+    for string, end in assertions:
+        assert find_string_end(b"  " + string, 2) == (
+            None if end is None else end + 2
+        )
+
+
+def test_string_codec_unescape():
+    assertions = [
+        (b"\\", b""),
+        (b"a\\", b"a"),
+        (b"\\q", b"q"),
+        (b"\\\\101", b"\\101"),
+        (b"\\(\\)", b"()"),
+        (b"\\t\\b\\f\\r", b"\t\b\f\r"),
+        (b"\\777", b"\xff"),
+        (b"\\1\\2", b"\x01\x02"),
+        (b"a\\\r\r\nb", b"a\r\nb"),
+    ]
+
+    for encoded, decoded in assertions:
+        assert decoded == unescape(encoded)
+
+
+def test_string_codec_escape():
+    seed(2022)
+
+    assert escape(b"Hello") == b"Hello"
+    assert escape(b"(\\)\r\n") == b"\\(\\\\\\)\\r\n"
+
+    for _ in range(256):
+        string = bytes([randrange(256) for _ in range(randrange(64))])
+        escaped = escape(string)
+
+        assert unescape(escaped) == string
+        assert find_string_end(b"(%s)" % escaped, 0) == len(escaped) + 2
+
+
+def test_string_codec_clean_hexstring():
+    assert clean_hexstring(b"") == b""
+    assert clean_hexstring(b"01 2a\r\n3B\t4c\x00") == b"012a3B4c"